@@ -1,8 +1,6 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
-import os
-import tempfile
 from schema_generator import SchemaGenerator
 
 app = FastAPI(
@@ -55,14 +53,12 @@ async def generate_smart_schema(
     - Configurable max nested depth (default: 100)
     """
     try:
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.ndjson') as temp_file:
-            content = await file.read()
-            temp_file.write(content.decode('utf-8'))
-            temp_file_path = temp_file.name
+        # The upload is read completely anyway, so parse it in memory
+        # instead of writing it to a temporary file and reading it back
+        content = await file.read()
         
         # Parse and analyze
-        objects = schema_generator.parse_ndjson_file(temp_file_path)
+        objects = schema_generator.parse_ndjson(content.decode('utf-8'))
         
         if sample_size and len(objects) > sample_size:
             import random
@@ -71,12 +67,12 @@ async def generate_smart_schema(
         # Generate schema using the smart hardened method for better flexibility
         schema = schema_generator.generate_smart_hardened_schema_with_depth(objects, max_nested_depth)
         
-        # Clean up
-        os.unlink(temp_file_path)
-        
         return SchemaResponse(schema=schema)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        # Don't keep anything derived from this upload in the shared generator's caches
+        schema_generator.clear_caches()
 
 @app.post("/api/v1/schemas/flexible", response_model=SchemaResponse)
 async def generate_flexible_schema(
@@ -94,14 +90,12 @@ async def generate_flexible_schema(
     - Ideal for data that varies significantly
     """
     try:
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.ndjson') as temp_file:
-            content = await file.read()
-            temp_file.write(content.decode('utf-8'))
-            temp_file_path = temp_file.name
+        # The upload is read completely anyway, so parse it in memory
+        # instead of writing it to a temporary file and reading it back
+        content = await file.read()
         
         # Parse and analyze
-        objects = schema_generator.parse_ndjson_file(temp_file_path)
+        objects = schema_generator.parse_ndjson(content.decode('utf-8'))
         
         if sample_size and len(objects) > sample_size:
             import random
@@ -110,12 +104,12 @@ async def generate_flexible_schema(
         # Generate flexible schema that allows any content
         schema = schema_generator.generate_flexible_with_types_schema(objects)
         
-        # Clean up
-        os.unlink(temp_file_path)
-        
         return SchemaResponse(schema=schema)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        # Don't keep anything derived from this upload in the shared generator's caches
+        schema_generator.clear_caches()
 
 @app.post("/api/v1/analyze", response_model=AnalysisResponse)
 async def analyze_objects(
@@ -134,14 +128,12 @@ async def analyze_objects(
     - All possible paths in nested structures
     """
     try:
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.ndjson') as temp_file:
-            content = await file.read()
-            temp_file.write(content.decode('utf-8'))
-            temp_file_path = temp_file.name
+        # The upload is read completely anyway, so parse it in memory
+        # instead of writing it to a temporary file and reading it back
+        content = await file.read()
         
         # Parse objects
-        objects = schema_generator.parse_ndjson_file(temp_file_path)
+        objects = schema_generator.parse_ndjson(content.decode('utf-8'))
         
         if sample_size and len(objects) > sample_size:
             import random
@@ -150,12 +142,12 @@ async def analyze_objects(
         # Analyze objects with custom max nested depth
         analysis = schema_generator.analyze_objects_with_depth(objects, max_nested_depth)
         
-        # Clean up
-        os.unlink(temp_file_path)
-        
         return AnalysisResponse(analysis=analysis)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        # Don't keep anything derived from this upload in the shared generator's caches
+        schema_generator.clear_caches()
 
 if __name__ == "__main__":
     import uvicorn
@@ -149,8 +149,7 @@ def test_with_file():
     
     # Write to NDJSON file
     with open("sample_data.ndjson", "w") as f:
-        for item in sample_data:
-            f.write(json.dumps(item) + "\n")
+        f.write("\n".join(json.dumps(item) for item in sample_data) + "\n")
     
     print("\n📁 Testing with NDJSON file...")
     print("Created sample_data.ndjson with mixed content types")
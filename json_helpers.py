@@ -0,0 +1,33 @@
+"""
+JSON encoding helpers shared by the test and demo scripts.
+
+orjson encodes much faster and is used when available, with the standard json
+module as the fallback. Everything is encoded to UTF-8 bytes.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dumps_indented(obj):
+    """Encode an object as indented JSON bytes"""
+    if orjson is not None:
+        # Analyses have integer keys (depth levels), which json turns into strings
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+def save_json(filename, obj):
+    """Save an object as indented JSON, returning the encoded bytes for reuse"""
+    data = dumps_indented(obj)
+    with open(filename, "wb") as f:
+        f.write(data)
+    return data
+
+def encode_ndjson(objects):
+    """Encode objects as an NDJSON payload"""
+    if orjson is not None:
+        return b'\n'.join([orjson.dumps(obj) for obj in objects]) + b'\n'
+    return ('\n'.join([json.dumps(obj) for obj in objects]) + '\n').encode('utf-8')
@@ -1,19 +1,586 @@
 import json
 import logging
-from typing import List, Dict, Any, Optional, Iterator, Set, Union
-import base64
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Iterator, Set, Union, Callable, Tuple
+import array
+import numbers
 import re
-from datetime import datetime
+import string
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# jsonschema is optional - without it generated schemas are not self-validated
+try:
+    import jsonschema
+    from jsonschema.exceptions import best_match
+    from jsonschema.validators import validator_for
+except ImportError:
+    jsonschema = None
+
+# Bit flags for the fixed vocabulary of value types seen in JSON data
+T_STR = 1
+T_INT = 2
+T_FLOAT = 4
+T_BOOL = 8
+T_LIST = 16
+T_DICT = 32
+T_NULL = 64
+T_OTHER = 128  # Any type outside the JSON vocabulary
+
+# Numeric values are buffered in typed arrays and reduced with min()/max() in
+# batches of this size instead of being compared one at a time
+NUMERIC_BUFFER_SIZE = 65536
+
+# Field sets up to this size get a generated per-object analyzer unrolled over
+# the field names - wider ones walk each object's own keys instead
+MAX_UNROLLED_FIELDS = 256
+
+# Distinct string prefixes/suffixes kept per field by the deep string analysis
+MAX_STRING_AFFIXES = 256
+
+# Strings shorter than this are never considered binary data
+MIN_BINARY_LENGTH = 20
+
+# Distinct strings whose classification is memoized per generator. The caches
+# keep the strings alive, so the bound also caps the memory held by long values.
+STRING_CACHE_SIZE = 4096
+
+# Leaf schemas memoized per generator, keyed by their types, patterns and
+# exact constraint values - least recently used shapes are dropped beyond this
+LEAF_SCHEMA_CACHE_SIZE = 1024
+
+# Canonical schemas for value types without constraints (copied before use)
+PRIMITIVE_SCHEMAS = {
+    'str': {"type": "string"},
+    'int': {"type": "integer"},
+    'float': {"type": "number"},
+    'bool': {"type": "boolean"},
+    'list': {"type": "array", "items": {}},
+    'dict': {"type": "object", "additionalProperties": True},
+}
+
+# One schema per JSON value type - a oneOf over these accepts any value
+ANY_VALUE_SCHEMAS = [
+    {"type": "string"},
+    {"type": "number"},
+    {"type": "integer"},
+    {"type": "boolean"},
+    {"type": "object", "additionalProperties": True},
+    {"type": "array", "items": {}},
+    {"type": "null"}
+]
+
+# Shared read-only property schema used by the flexible schema variants
+PERMISSIVE_PROPERTY_SCHEMA = {"oneOf": ANY_VALUE_SCHEMAS}
+
+# Shared read-only oneOf options for the type-preserving flexible schema, in order
+FLEXIBLE_TYPE_OPTIONS = (
+    (T_STR, {"type": "string"}),
+    (T_INT, {"type": "integer"}),
+    (T_FLOAT, {"type": "number"}),
+    (T_BOOL, {"type": "boolean"}),
+    (T_LIST, {"type": "array", "items": {}}),
+)
+FLEXIBLE_OBJECT_SCHEMA = {"type": "object"}
+FLEXIBLE_OPEN_OBJECT_SCHEMA = {
+    "type": "object",
+    "additionalProperties": True,
+    "description": "⚠️ WARNING: Object allows additional properties due to mixed content. Consider defining explicit field schemas."
+}
+NULL_SCHEMA = {"type": "null"}
+
+# Shared read-only non-string oneOf options for the smart mixed-type schema, in order
+SMART_MIXED_TYPE_OPTIONS = (
+    (T_INT, {"type": "integer"}),
+    (T_FLOAT, {"type": "number"}),
+    (T_BOOL, {"type": "boolean"}),
+    (T_LIST, {"type": "array", "items": {}, "minItems": 0}),
+)
+# Pattern the binary schemas put on base64 encoded strings
+BASE64_PATTERN = "^[A-Za-z0-9+/]*={0,2}$"
+
+BINARY_STRING_SCHEMA = {
+    "type": "string",
+    "contentEncoding": "base64",
+    "contentMediaType": "application/octet-stream"
+}
+
+# Compiled pattern detection regexes
+EMAIL_REGEX = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+URL_REGEX = re.compile(r'^https?://[^\s/$.?#].[^\s]*$')
+UUID_REGEX = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
+
+# Common date/time patterns
+DATE_TIME_REGEXES = (
+    re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}'),  # ISO format
+    re.compile(r'^\d{4}-\d{2}-\d{2}$'),  # Date only
+    re.compile(r'^\d{2}/\d{2}/\d{4}$'),  # MM/DD/YYYY
+    re.compile(r'^\d{2}-\d{2}-\d{4}$'),  # MM-DD-YYYY
+)
+
+# All detection patterns as one regex with a named group per pattern, tried in
+# priority order so a single match classifies a string
+PATTERN_REGEX = re.compile('^(?:{})'.format('|'.join([
+    '(?P<email>{})'.format(EMAIL_REGEX.pattern[1:]),
+    '(?P<url>{})'.format(URL_REGEX.pattern[1:]),
+    '(?P<datetime>{})'.format('|'.join(regex.pattern[1:] for regex in DATE_TIME_REGEXES)),
+    '(?P<uuid>(?i:{}))'.format(UUID_REGEX.pattern[1:]),
+])))
+
+
+def _regex_format_check(*regexes):
+    """Build a jsonschema format check accepting strings that match any of the regexes."""
+    def check(instance: Any) -> bool:
+        return not isinstance(instance, str) or any(regex.match(instance) for regex in regexes)
+    return check
+
+
+# Format checker using the same rules as pattern detection, for callers that
+# want the generated format keywords asserted (they are annotations by default)
+if jsonschema is not None:
+    FORMAT_CHECKER = jsonschema.FormatChecker(formats=())
+    FORMAT_CHECKER.checks('email')(_regex_format_check(EMAIL_REGEX))
+    FORMAT_CHECKER.checks('uri')(_regex_format_check(URL_REGEX))
+    FORMAT_CHECKER.checks('uuid')(_regex_format_check(UUID_REGEX))
+    FORMAT_CHECKER.checks('date-time')(_regex_format_check(*DATE_TIME_REGEXES))
+else:
+    FORMAT_CHECKER = None
+
+# Sentinel for fields absent from an object
+_MISSING = object()
+
+_BASE64_ALPHABET = (string.ascii_letters + string.digits + '+/').encode('ascii')
+_HEX_ALPHABET = string.hexdigits.encode('ascii')
+
+
+def _alphabet_check(alphabet: bytes, min_length: int, max_padding: int = 0) -> Callable[[str], bool]:
+    """
+    Build a check equivalent to matching r'^[<alphabet>]{min_length,}={0,max_padding}$'.
+    
+    The character scan is done by bytes.translate in C, which is several times
+    faster than the regex engine on long strings such as encoded blobs.
+    """
+    def check(value: str) -> bool:
+        # '$' also matches before a trailing newline
+        if value.endswith('\n'):
+            value = value[:-1]
+        body = value.rstrip('=') if max_padding else value
+        if len(value) - len(body) > max_padding or len(body) < min_length or not body.isascii():
+            return False
+        return not body.encode('ascii').translate(None, alphabet)
+    return check
+
+
+# Table-driven replacements for the default binary detection patterns
+_BINARY_PATTERN_CHECKS = {
+    r'^[A-Za-z0-9+/]{20,}={0,2}$': _alphabet_check(_BASE64_ALPHABET, 20, max_padding=2),
+    r'^[A-Fa-f0-9]{32,}$': _alphabet_check(_HEX_ALPHABET, 32),
+}
+
+# Table-driven checks for the patterns used in generated schemas, for the compiled validator
+_SCHEMA_PATTERN_CHECKS = {
+    BASE64_PATTERN: _alphabet_check(_BASE64_ALPHABET, 0, max_padding=2),
+}
+
+_TYPE_BITS = {
+    str: T_STR,
+    int: T_INT,
+    float: T_FLOAT,
+    bool: T_BOOL,
+    list: T_LIST,
+    dict: T_DICT,
+    type(None): T_NULL,
+}
+
+
+class _TypeNames(dict):
+    """Type -> type name mapping that falls back to __name__ for unlisted types."""
+    
+    def __missing__(self, value_type: type) -> str:
+        return value_type.__name__
+
+
+# Names of the JSON value types: _TYPE_NAMES[type(value)] is a dict hit instead
+# of reading type(value).__name__, which builds a new string for builtin types
+_TYPE_NAMES = _TypeNames((value_type, value_type.__name__) for value_type in _TYPE_BITS)
+
+_TYPE_BIT_NAMES = (
+    (T_STR, 'str'),
+    (T_INT, 'int'),
+    (T_FLOAT, 'float'),
+    (T_BOOL, 'bool'),
+    (T_LIST, 'list'),
+    (T_DICT, 'dict'),
+    (T_NULL, 'NoneType'),
+)
+
+# Bit flags for the string patterns detected during analysis
+P_EMAIL = 1
+P_URL = 2
+P_DATETIME = 4
+P_UUID = 8
+P_BINARY = 16
+
+_PATTERN_BIT_NAMES = (
+    (P_EMAIL, 'email'),
+    (P_URL, 'url'),
+    (P_DATETIME, 'datetime'),
+    (P_UUID, 'uuid'),
+    (P_BINARY, 'binary'),
+)
+_PATTERN_NAMES = dict(_PATTERN_BIT_NAMES)
+_PATTERN_BITS = {name: bit for bit, name in _PATTERN_BIT_NAMES}
+
+# Detected string patterns and the schema keywords they map to, in priority order
+PATTERN_FORMATS = (
+    ('email', P_EMAIL, {"format": "email"}),
+    ('url', P_URL, {"format": "uri"}),
+    ('datetime', P_DATETIME, {"format": "date-time"}),
+    ('uuid', P_UUID, {"format": "uuid"}),
+    ('binary', P_BINARY, {"contentEncoding": "base64", "contentMediaType": "application/octet-stream"}),
+)
+
+
+def _mask_to_names(mask: int, bit_names) -> Set[str]:
+    """Expand a bitmask into the set of names whose bits are set."""
+    return {name for bit, name in bit_names if mask & bit}
+
+
+def _bit_count(mask: int) -> int:
+    """Count the set bits in a bitmask."""
+    return bin(mask).count('1')
+
+
+def _analysis_types_mask(analysis: Dict[str, Any]) -> int:
+    """Get the type bitmask of a field analysis, deriving it from the names if needed."""
+    mask = analysis.get('types_mask')
+    if mask is None:
+        mask = 0
+        for name in analysis.get('types', ()):
+            for bit, bit_name in _TYPE_BIT_NAMES:
+                if name == bit_name:
+                    mask |= bit
+                    break
+            else:
+                mask |= T_OTHER
+    return mask
+
+
+def _has_multiple_types(analysis: Dict[str, Any]) -> bool:
+    """Check whether a field analysis has seen more than one value type."""
+    mask = _analysis_types_mask(analysis)
+    if mask & T_OTHER:
+        # Several non-JSON types share one bit - count the names instead
+        return len(analysis['types']) > 1
+    return mask & (mask - 1) != 0
+
+
+def _pattern_keywords(patterns: Set[str], include_binary: bool = False) -> Dict[str, Any]:
+    """Return the schema keywords for the highest priority pattern in a pattern set."""
+    if patterns:
+        for pattern, _, keywords in PATTERN_FORMATS:
+            if pattern in patterns and (include_binary or pattern != 'binary'):
+                return keywords
+    return {}
+
+
+def _pattern_mask_keywords(mask: int) -> Dict[str, Any]:
+    """Return the format keywords for the highest priority pattern bit in a mask."""
+    if mask:
+        for _, bit, keywords in PATTERN_FORMATS:
+            if mask & bit and bit != P_BINARY:
+                return keywords
+    return {}
+
+
+def _analysis_patterns_mask(analysis: Dict[str, Any]) -> int:
+    """Get the pattern bitmask of a field analysis, deriving it from the names if needed."""
+    mask = analysis.get('patterns_mask')
+    if mask is None:
+        patterns = analysis.get('patterns', ())
+        mask = 0
+        for pattern, bit, _ in PATTERN_FORMATS:
+            if pattern in patterns:
+                mask |= bit
+    return mask
+
+
+def _is_number(value: Any) -> bool:
+    """Check for an int or float value, excluding bools."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _expand_integer_range(min_value: Union[int, float], max_value: Union[int, float]) -> tuple:
+    """Widen an observed integer range into schema (minimum, maximum) bounds."""
+    if min_value == max_value:
+        # Single value - use a small range around it
+        expansion = max(1, abs(min_value) // 10)
+    else:
+        # Range of values - expand it slightly
+        expansion = max(1, (max_value - min_value) // 4)  # Expand by 25%
+    return min_value - expansion, max_value + expansion
+
+
+def _expand_float_range(min_value: Union[int, float], max_value: Union[int, float]) -> tuple:
+    """Widen an observed float range into schema (minimum, maximum) bounds."""
+    if min_value == max_value:
+        # Single value - use 10% range
+        expansion = abs(min_value) * 0.1
+    else:
+        # Range of values - expand by 20%
+        expansion = (max_value - min_value) * 0.2
+    return min_value - expansion, max_value + expansion
+
+
+def _expand_numeric_range(min_value: Union[int, float], max_value: Union[int, float], is_float: bool) -> tuple:
+    """
+    Widen an observed numeric range into schema minimum/maximum bounds.
+    
+    Args:
+        min_value: Smallest observed value
+        max_value: Largest observed value
+        is_float: Use percentage-based expansion instead of integer steps
+        
+    Returns:
+        Tuple of (minimum, maximum)
+    """
+    if is_float:
+        return _expand_float_range(min_value, max_value)
+    return _expand_integer_range(min_value, max_value)
+
+
+def _allow_null(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extend a freshly built single-type schema to also accept null.
+    
+    String, numeric, array and object keywords only apply to values of their
+    own type, so null is added to the type list instead of wrapping the schema
+    in a oneOf that validators would have to evaluate branch by branch.
+    
+    Args:
+        schema: Schema with a single "type" (modified in place)
+        
+    Returns:
+        Schema accepting the original values and null
+    """
+    if isinstance(schema.get("type"), str):
+        schema["type"] = [schema["type"], "null"]
+        return schema
+    return {"oneOf": [schema, {"type": "null"}]}
+
+
+def _clone_schema(schema: Any) -> Any:
+    """Copy the dicts and lists of a schema so a cached template is never shared."""
+    if isinstance(schema, dict):
+        clone = {}
+    elif isinstance(schema, list):
+        clone = []
+    else:
+        return schema
+    
+    # Copy with an explicit stack of (source, copy) pairs, so arbitrarily
+    # deep schemas never hit the recursion limit
+    stack = [(schema, clone)]
+    pop = stack.pop
+    while stack:
+        source, target = pop()
+        is_dict = isinstance(target, dict)
+        for key, value in (source.items() if is_dict else enumerate(source)):
+            if isinstance(value, dict):
+                child = {}
+                stack.append((value, child))
+            elif isinstance(value, list):
+                child = []
+                stack.append((value, child))
+            else:
+                child = value
+            if is_dict:
+                target[key] = child
+            else:
+                target.append(child)
+    return clone
+
+
+def _json_ready(value: Any) -> Any:
+    """Copy an analysis result with every set replaced by a sorted list."""
+    if isinstance(value, dict):
+        return {key: _json_ready(item) for key, item in value.items()}
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    if isinstance(value, list):
+        return [_json_ready(item) for item in value]
+    return value
+
+
+def _constraints_key(constraints: Dict[str, Any]) -> tuple:
+    """Build a hashable cache key from a constraints dict (keeping 1 and 1.0 apart)."""
+    key = []
+    for name, value in sorted(constraints.items()):
+        try:
+            hash(value)
+        except TypeError:
+            value = repr(value)
+        key.append((name, type(value), value))
+    return tuple(key)
+
+
+@lru_cache(maxsize=64)
+def _object_analyzer_factory(field_names: tuple) -> Callable[..., Callable[[Dict[str, Any]], None]]:
+    """
+    Compile the unrolled per-object analyzer for a field set (see SchemaGenerator._build_object_analyzer).
+    
+    Returns a factory taking the string, numeric, array, object and fallback
+    analyzers followed by one _FieldStats per field, in field_names order.
+    """
+    stats_names = [f'a{index}' for index in range(len(field_names))]
+    lines = [
+        f"def _make_analyzer(_str, _num, _list, _dict, _other{''.join(', ' + a for a in stats_names)}):",
+        '    def _analyze_object(obj):',
+        '        get = obj.get',
+    ]
+    for field_name, a in zip(field_names, stats_names):
+        lines += [
+            f'        v = get({field_name!r}, _MISSING)',
+            f'        if v is _MISSING:',
+            f'            {a}.missing_count += 1',
+            f'        else:',
+            f'            {a}.total_count += 1',
+            f'            t = type(v)',
+            f'            if v is None:',
+            f'                {a}.null_count += 1',
+            f'                {a}.types_mask |= T_NULL',
+            f'            elif t is str:',
+            f'                {a}.types_mask |= T_STR',
+            f'                _str({a}, v)',
+            f'            elif t is int:',
+            f'                {a}.types_mask |= T_INT',
+            f'                _num({a}, v)',
+            f'            elif t is float:',
+            f'                {a}.types_mask |= T_FLOAT',
+            f'                _num({a}, v)',
+            f'            elif t is bool:',
+            f'                {a}.types_mask |= T_BOOL',
+            f'            elif t is dict:',
+            f'                {a}.types_mask |= T_DICT',
+            f'                _dict({a}, v)',
+            f'            elif t is list:',
+            f'                {a}.types_mask |= T_LIST',
+            f'                _list({a}, v)',
+            f'            else:',
+            f'                _other({a}, v)',
+        ]
+    if not field_names:
+        lines.append('        pass')
+    lines.append('    return _analyze_object')
+    namespace = {
+        '_MISSING': _MISSING,
+        'T_NULL': T_NULL, 'T_STR': T_STR, 'T_INT': T_INT,
+        'T_FLOAT': T_FLOAT, 'T_BOOL': T_BOOL, 'T_LIST': T_LIST, 'T_DICT': T_DICT,
+    }
+    exec(compile('\n'.join(lines), '<field analyzer>', 'exec'), namespace)
+    return namespace['_make_analyzer']
+
+
+class _FieldStats:
+    """Per-field accumulator used while collecting statistics (slots instead of a dict)."""
+    
+    __slots__ = (
+        'types', 'types_mask', 'null_count', 'total_count', 'missing_count',
+        'min_length', 'max_length', 'min_value', 'max_value',
+        'patterns', 'patterns_mask', 'is_binary',
+        'nested_structure', 'array_structure', 'int_buf', 'float_buf',
+    )
+    
+    def __init__(self):
+        self.types = set()
+        self.types_mask = 0
+        self.null_count = 0
+        self.total_count = 0
+        self.missing_count = 0
+        self.min_length = None
+        self.max_length = None
+        self.min_value = None
+        self.max_value = None
+        self.patterns = set()
+        self.patterns_mask = 0
+        self.is_binary = False
+        self.nested_structure = None
+        self.array_structure = None
+        self.int_buf = None
+        self.float_buf = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Export as the field analysis dictionary used by the schema generators."""
+        analysis = {
+            'types': self.types,
+            'types_mask': self.types_mask,
+            'null_count': self.null_count,
+            'total_count': self.total_count,
+            'missing_count': self.missing_count,
+            'min_length': self.min_length,
+            'max_length': self.max_length,
+            'min_value': self.min_value,
+            'max_value': self.max_value,
+            'patterns': self.patterns,
+            'patterns_mask': self.patterns_mask,
+            'is_binary': self.is_binary,
+            'is_mixed': False
+        }
+        if self.array_structure is not None:
+            analysis['array_structure'] = self.array_structure
+        if self.nested_structure is not None:
+            analysis['nested_structure'] = self.nested_structure
+        return analysis
+
+
+class _AnalysisCache:
+    """Field analysis shared by the helpers of one call on one object list."""
+    
+    __slots__ = ('objects', 'fields', 'field_index', 'field_constraints')
+    
+    def __init__(self, objects: List[Dict[str, Any]]):
+        self.objects = objects
+        self.fields = {}  # Field analysis by max_depth (None for the basic analysis)
+        self.field_index = None
+        self.field_constraints = None
+
+
+class _FieldConstraint:
+    """
+    Schema-relevant flags of one analyzed field, read once from its analysis.
+    
+    The schema generators decide each field's shape from these attributes
+    instead of repeated dict lookups. analysis is the cached field analysis
+    itself and must not be modified.
+    """
+    
+    __slots__ = ('name', 'analysis', 'is_binary', 'is_mixed', 'types_mask', 'null_percentage', 'required')
+    
+    def __init__(self, name: str, analysis: Dict[str, Any]):
+        self.name = name
+        self.analysis = analysis
+        self.is_binary = analysis.get('is_binary', False)
+        self.is_mixed = analysis.get('is_mixed', False)
+        self.types_mask = _analysis_types_mask(analysis)
+        self.null_percentage = analysis.get('null_percentage', 0)
+        self.required = analysis.get('required', False)
+
+
 class SchemaGenerator:
     """
     A rule-based schema generator that analyzes NDJSON data and creates comprehensive JSON schemas.
     Supports fields that can contain anything, including binary data and mixed types.
     No external LLM required - uses intelligent pattern analysis.
+    
+    Generated schemas share sub-schemas with each other and with module-level
+    templates, so treat them as read-only - copy a schema (e.g. with
+    copy.deepcopy) before modifying it in place.
     """
     
     def __init__(self):
@@ -25,6 +592,11 @@ class SchemaGenerator:
             r'^[A-Za-z0-9+/]{20,}={0,2}$',  # Base64 pattern - must be at least 20 chars
             r'^[A-Fa-f0-9]{32,}$',  # Hex pattern - must be at least 32 chars
         ]
+        # Checks built from binary_patterns, and the patterns they were built
+        # from - rebuilt whenever the patterns change (see _sync_binary_checks)
+        self._binary_checks_patterns = None
+        self._builtin_binary_checks = ()
+        self._custom_binary_checks = ()
         
         # Common binary file extensions and their MIME types
         self.binary_mime_types = {
@@ -39,6 +611,32 @@ class SchemaGenerator:
             'dat': 'application/octet-stream',
         }
         
+        # Leaf schemas already generated for a (types, patterns, constraints) shape,
+        # shared between all schemas produced by this generator
+        self._leaf_schema_cache = OrderedDict()
+        
+        # Pattern mask per distinct string - enum-like values and repeated
+        # IDs are only run through the detection regexes once
+        self._classify_string = lru_cache(maxsize=STRING_CACHE_SIZE)(self._detect_string_patterns)
+        
+        # Binary verdict per distinct string for the nested structure walkers.
+        # Callers skip strings below MIN_BINARY_LENGTH so they never fill the cache.
+        self._is_binary_string = lru_cache(maxsize=STRING_CACHE_SIZE)(self._is_likely_binary)
+        
+        # Checked and compiled validators for recently validated schemas, keyed by
+        # the schema's JSON, so validating a regenerated schema skips check_schema
+        self._schema_validators = lru_cache(maxsize=32)(self._build_schema_validators)
+        
+        # Analysis cache of the call in progress (see _analysis_scope)
+        self._analysis = None
+        
+        # Schema builders for nested field types that carry constraints
+        self._nested_type_handlers = {
+            'str': lambda patterns, constraints: self._generate_nested_string_schema(patterns, constraints),
+            'int': lambda patterns, constraints: self._generate_nested_integer_schema(constraints),
+            'float': lambda patterns, constraints: self._generate_nested_number_schema(constraints),
+        }
+        
     def parse_ndjson(self, ndjson_content: str) -> List[Dict[str, Any]]:
         """
         Parse NDJSON content into a list of JSON objects.
@@ -71,13 +669,8 @@ class SchemaGenerator:
         Returns:
             List of parsed JSON objects
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return self.parse_ndjson(f.read())
-        except FileNotFoundError:
-            raise ValueError(f"File not found: {file_path}")
-        except Exception as e:
-            raise ValueError(f"Error reading file {file_path}: {e}")
+        # Parse line by line rather than holding the whole file text in memory
+        return list(self.stream_ndjson(file_path))
     
     def stream_ndjson(self, file_path: str) -> Iterator[Dict[str, Any]]:
         """
@@ -124,8 +717,9 @@ class SchemaGenerator:
         # Sample data if specified
         if sample_size and len(objects) > sample_size:
             import random
+            total_objects = len(objects)
             objects = random.sample(objects, sample_size)
-            logger.info(f"Sampled {sample_size} objects from {len(self.parse_ndjson(ndjson_content))} total objects")
+            logger.info(f"Sampled {sample_size} objects from {total_objects} total objects")
         
         return self._analyze_objects(objects)
     
@@ -148,11 +742,62 @@ class SchemaGenerator:
         # Sample data if specified
         if sample_size and len(objects) > sample_size:
             import random
+            total_objects = len(objects)
             objects = random.sample(objects, sample_size)
-            logger.info(f"Sampled {sample_size} objects from {len(self.parse_ndjson_file(file_path))} total objects")
+            logger.info(f"Sampled {sample_size} objects from {total_objects} total objects")
         
         return self._analyze_objects(objects)
     
+    def analyze_ndjson_file_parallel(self, file_path: str, workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Analyze a large NDJSON file using a pool of worker processes.
+        
+        The file is split into byte ranges aligned to line boundaries. Each worker
+        parses and analyzes its own range, and the partial field statistics are
+        merged before the schema is generated and validated.
+        
+        Args:
+            file_path: Path to the NDJSON file
+            workers: Number of worker processes (None for one per CPU core)
+            
+        Returns:
+            Generated JSON schema
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1:
+            return self.analyze_ndjson_file(file_path)
+        
+        try:
+            ranges = _split_file_by_lines(file_path, workers)
+        except FileNotFoundError:
+            raise ValueError(f"File not found: {file_path}")
+        
+        field_analysis = {}
+        total_objects = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_collect_ndjson_chunk_stats, file_path, start, end, self.binary_patterns) for start, end in ranges]
+            for future in futures:
+                partial, object_count = future.result()
+                self._merge_field_stats(field_analysis, partial)
+                total_objects += object_count
+            
+            if not total_objects:
+                raise ValueError(f"NDJSON file {file_path} is empty or contains no valid JSON objects")
+            
+            for analysis in field_analysis.values():
+                # A field is missing from every object that did not contain it
+                analysis['missing_count'] = total_objects - analysis['total_count']
+                self._post_process_field_analysis(analysis, total_objects)
+            
+            schema = self._generate_schema_from_analysis(field_analysis)
+            
+            # Validate each range against the merged schema in the same workers
+            futures = [executor.submit(_validate_ndjson_chunk, file_path, start, end, schema) for start, end in ranges]
+            for future in futures:
+                future.result()
+        
+        return schema
+    
     def _analyze_objects(self, objects: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Analyze a list of JSON objects and generate a comprehensive JSON schema.
@@ -167,7 +812,7 @@ class SchemaGenerator:
             raise ValueError("JSON objects list cannot be empty")
         
         # Analyze all objects to understand the structure
-        field_analysis = self._analyze_fields(objects)
+        field_analysis = self._cached_analyze_fields(objects)
         
         # Generate schema based on analysis
         schema = self._generate_schema_from_analysis(field_analysis)
@@ -187,139 +832,372 @@ class SchemaGenerator:
         Returns:
             Dictionary mapping field names to their analysis
         """
-        field_analysis = {}
+        field_analysis = self._collect_field_stats(objects)
         total_objects = len(objects)
         
+        # Post-process analysis
+        for field_name, analysis in field_analysis.items():
+            self._post_process_field_analysis(analysis, total_objects)
+        
+        return field_analysis
+    
+    def _cached_analyze_fields(self, objects: List[Dict[str, Any]], max_depth: Optional[int] = None,
+                               workers: int = 1) -> Dict[str, Dict[str, Any]]:
+        """
+        Field analysis of an object list, computed once per call (see _analysis_scope).
+        
+        Args:
+            objects: List of JSON objects to analyze
+            max_depth: Maximum depth for the deep analysis, or None for the basic analysis
+            workers: Number of worker processes for the deep analysis
+            
+        Returns:
+            Dictionary mapping field names to a private copy of their analysis
+        """
+        with self._analysis_scope(objects) as cache:
+            field_analysis = cache.fields.get(max_depth)
+            if field_analysis is None:
+                if max_depth is None:
+                    field_analysis = self._analyze_fields(objects)
+                else:
+                    field_analysis = self._analyze_fields_deep_with_depth(objects, max_depth, workers)
+                cache.fields[max_depth] = field_analysis
+        
+        # Callers add their own keys to the per-field dicts
+        return {field_name: dict(analysis) for field_name, analysis in field_analysis.items()}
+    
+    def _cached_field_constraints(self, objects: List[Dict[str, Any]]) -> List[_FieldConstraint]:
+        """
+        Per-field constraint records for the schema generators, computed once per call.
+        
+        Unlike _cached_analyze_fields, the records reference the cached analysis
+        directly, so callers must treat record.analysis as read-only.
+        
+        Args:
+            objects: List of JSON objects to analyze
+            
+        Returns:
+            One record per field, in field order
+        """
+        with self._analysis_scope(objects) as cache:
+            if cache.field_constraints is None:
+                field_analysis = cache.fields.get(None)
+                if field_analysis is None:
+                    field_analysis = cache.fields[None] = self._analyze_fields(objects)
+                cache.field_constraints = [
+                    _FieldConstraint(field_name, analysis) for field_name, analysis in field_analysis.items()
+                ]
+            return cache.field_constraints
+    
+    def _field_values(self, objects: List[Dict[str, Any]], field_name: str) -> List[Any]:
+        """
+        Values of a field in the objects that contain it, in object order.
+        
+        The per-field deep analyzers all read from one field -> values index built
+        in a single pass over the objects and kept for the call in progress,
+        instead of each probing every object for its field.
+        
+        Args:
+            objects: List of JSON objects
+            field_name: Name of the field
+            
+        Returns:
+            List of the field's values (shared - do not modify)
+        """
+        with self._analysis_scope(objects) as cache:
+            if cache.field_index is None:
+                index = {}
+                for obj in objects:
+                    for key, value in obj.items():
+                        values = index.get(key)
+                        if values is None:
+                            index[key] = [value]
+                        else:
+                            values.append(value)
+                cache.field_index = index
+            return cache.field_index.get(field_name, [])
+    
+    @contextmanager
+    def _analysis_scope(self, objects: List[Dict[str, Any]]) -> Iterator[_AnalysisCache]:
+        """
+        Share field analysis of an object list between the helpers of one call.
+        
+        Nested scopes for the same list reuse the enclosing cache, and the cache
+        is dropped when the outermost scope exits. Nothing is kept between calls,
+        so objects modified in place are always analyzed afresh.
+        
+        Args:
+            objects: List of JSON objects being analyzed
+            
+        Yields:
+            The analysis cache for the objects
+        """
+        outer = self._analysis
+        if outer is not None and outer.objects is objects:
+            yield outer
+            return
+        if outer is None:
+            # A new call - drop string verdicts made with since changed binary patterns
+            self._sync_binary_checks()
+        
+        self._analysis = _AnalysisCache(objects)
+        try:
+            yield self._analysis
+        finally:
+            self._analysis = outer
+    
+    def _collect_field_stats(self, objects: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Collect raw per-field statistics without post-processing.
+        
+        The result only holds counts, min/max values and type/pattern sets, so
+        partial results for disjoint sets of objects can be merged with
+        _merge_field_stats before post-processing.
+        
+        Args:
+            objects: List of JSON objects to analyze
+            
+        Returns:
+            Dictionary mapping field names to their raw statistics
+        """
+        field_analysis = {}
+        
         # First pass: collect all field names and initialize analysis
         all_field_names = set()
         for obj in objects:
             all_field_names.update(obj.keys())
         
         for field_name in all_field_names:
-            field_analysis[field_name] = {
-                'types': set(),
-                'values': [],
-                'null_count': 0,
-                'total_count': 0,
-                'missing_count': 0,
-                'min_length': None,
-                'max_length': None,
-                'min_value': None,
-                'max_value': None,
-                'patterns': set(),
-                'is_binary': False,
-                'is_mixed': False
-            }
+            field_analysis[field_name] = _FieldStats()
+        
+        # Second pass: analyze each object with a loop specialized to the field set
+        if len(field_analysis) <= MAX_UNROLLED_FIELDS:
+            analyze_object = self._build_object_analyzer(field_analysis)
+            for obj in objects:
+                analyze_object(obj)
+        else:
+            self._analyze_wide_objects(objects, field_analysis)
         
-        # Second pass: analyze each object
+        for stats in field_analysis.values():
+            self._flush_numeric_buffers(stats)
+        
+        return {field_name: stats.to_dict() for field_name, stats in field_analysis.items()}
+    
+    def _analyze_wide_objects(self, objects: List[Dict[str, Any]], field_analysis: Dict[str, _FieldStats]) -> None:
+        """
+        Analyze objects for a field set too wide for a generated analyzer.
+        
+        Only the keys each object actually has are visited, and missing counts
+        are derived from the present counts at the end, so sparse objects over
+        many distinct keys cost time in proportion to their own size.
+        
+        Args:
+            objects: List of JSON objects to analyze
+            field_analysis: Field statistics keyed by field name, updated in place
+        """
+        object_count = 0
         for obj in objects:
-            for field_name in all_field_names:
-                analysis = field_analysis[field_name]
-                
-                if field_name not in obj:
-                    # Field is missing from this object
-                    analysis['missing_count'] += 1
-                    continue
-                
-                field_value = obj[field_name]
-                analysis['total_count'] += 1
-                analysis['values'].append(field_value)
-                
+            object_count += 1
+            for field_name, field_value in obj.items():
+                stats = field_analysis[field_name]
+                stats.total_count += 1
                 if field_value is None:
-                    analysis['null_count'] += 1
-                    analysis['types'].add('NoneType')  # Track null as a type
-                    continue
-                
-                # Analyze type
-                field_type = type(field_value).__name__
-                analysis['types'].add(field_type)
-                
-                # Analyze patterns and constraints
-                if isinstance(field_value, str):
-                    self._analyze_string_field(analysis, field_value)
-                elif isinstance(field_value, (int, float)):
-                    self._analyze_numeric_field(analysis, field_value)
-                elif isinstance(field_value, bool):
-                    # Boolean fields don't need additional analysis
-                    pass
-                elif isinstance(field_value, list):
-                    self._analyze_array_field(analysis, field_value)
-                elif isinstance(field_value, dict):
-                    self._analyze_object_field(analysis, field_value)
+                    stats.null_count += 1
+                    stats.types_mask |= T_NULL
+                else:
+                    self._analyze_field_value(stats, field_value)
+        
+        for stats in field_analysis.values():
+            stats.missing_count = object_count - stats.total_count
+    
+    def _analyze_field_value(self, stats: _FieldStats, field_value: Any) -> None:
+        """Record a single non-null field value in its field statistics."""
+        # Analyze type - known JSON types are accumulated as bits,
+        # anything else falls back to the name set
+        type_bit = _TYPE_BITS.get(type(field_value))
+        if type_bit is not None:
+            stats.types_mask |= type_bit
+        else:
+            stats.types.add(_TYPE_NAMES[type(field_value)])
         
-        # Post-process analysis
-        for field_name, analysis in field_analysis.items():
-            self._post_process_field_analysis(analysis, total_objects)
+        # Analyze patterns and constraints
+        if isinstance(field_value, str):
+            self._analyze_string_field(stats, field_value)
+        elif isinstance(field_value, (int, float)):
+            self._analyze_numeric_field(stats, field_value)
+        elif isinstance(field_value, bool):
+            # Boolean fields don't need additional analysis
+            pass
+        elif isinstance(field_value, list):
+            self._analyze_array_field(stats, field_value)
+        elif isinstance(field_value, dict):
+            self._analyze_object_field(stats, field_value)
+    
+    def _build_object_analyzer(self, field_analysis: Dict[str, _FieldStats]):
+        """
+        Generate a per-object analysis function unrolled over the known field names.
         
-        return field_analysis
+        Only used for field sets of up to MAX_UNROLLED_FIELDS names, so the
+        generated code and the cached compiled factories stay small.
+        
+        The generated code does one dict lookup per field and dispatches on the
+        exact value type inline, instead of iterating the field set and going
+        through isinstance checks for every value. Values of any other type
+        fall back to _analyze_field_value.
+        
+        Args:
+            field_analysis: Field statistics keyed by field name
+            
+        Returns:
+            Function taking a single object and updating field_analysis in place
+        """
+        # The code only depends on the field names, so it is compiled once per field set
+        make_analyzer = _object_analyzer_factory(tuple(field_analysis))
+        return make_analyzer(
+            self._analyze_string_field, self._analyze_numeric_field,
+            self._analyze_array_field, self._analyze_object_field,
+            self._analyze_field_value, *field_analysis.values()
+        )
     
-    def _analyze_string_field(self, analysis: Dict[str, Any], value: str) -> None:
+    def _merge_field_stats(self, merged: Dict[str, Dict[str, Any]], partial: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Merge raw field statistics from _collect_field_stats into an accumulator.
+        
+        Args:
+            merged: Accumulated statistics, updated in place
+            partial: Statistics for another disjoint set of objects
+        """
+        for field_name, analysis in partial.items():
+            target = merged.get(field_name)
+            if target is None:
+                merged[field_name] = analysis
+                continue
+            
+            target['types'] |= analysis['types']
+            target['types_mask'] |= analysis['types_mask']
+            target['patterns'] |= analysis['patterns']
+            target['patterns_mask'] |= analysis['patterns_mask']
+            target['null_count'] += analysis['null_count']
+            target['total_count'] += analysis['total_count']
+            target['missing_count'] += analysis['missing_count']
+            target['is_binary'] = target['is_binary'] or analysis['is_binary']
+            _merge_constraints(target, analysis)
+            
+            if 'nested_structure' in analysis:
+                if 'nested_structure' in target:
+                    _merge_structure_info(target['nested_structure'], analysis['nested_structure'])
+                else:
+                    target['nested_structure'] = analysis['nested_structure']
+            
+            if 'array_structure' in analysis:
+                if 'array_structure' not in target:
+                    target['array_structure'] = analysis['array_structure']
+                    continue
+                target_array = target['array_structure']
+                source_array = analysis['array_structure']
+                target_array['item_types'] |= source_array['item_types']
+                target_array['nested_objects'] = target_array['nested_objects'] or source_array['nested_objects']
+                target_array['consistent_structure'] = target_array['consistent_structure'] and source_array['consistent_structure']
+                for item_keys, schema_info in source_array['item_schemas'].items():
+                    target_info = target_array['item_schemas'].get(item_keys)
+                    if target_info is None:
+                        target_array['item_schemas'][item_keys] = schema_info
+                    else:
+                        _merge_structure_info(target_info, schema_info)
+                        target_info['count'] += schema_info['count']
+    
+    def _analyze_string_field(self, stats: _FieldStats, value: str) -> None:
         """Analyze a string field for patterns and characteristics."""
         # Length analysis
         length = len(value)
-        if analysis['min_length'] is None or length < analysis['min_length']:
-            analysis['min_length'] = length
-        if analysis['max_length'] is None or length > analysis['max_length']:
-            analysis['max_length'] = length
-        
-        # Check for binary patterns
-        if self._is_likely_binary(value):
-            analysis['is_binary'] = True
-        
-        # Check for common patterns
-        if self._is_email(value):
-            analysis['patterns'].add('email')
-        elif self._is_url(value):
-            analysis['patterns'].add('url')
-        elif self._is_date_time(value):
-            analysis['patterns'].add('datetime')
-        elif self._is_uuid(value):
-            analysis['patterns'].add('uuid')
-    
-    def _analyze_numeric_field(self, analysis: Dict[str, Any], value: Union[int, float]) -> None:
+        if stats.min_length is None or length < stats.min_length:
+            stats.min_length = length
+        if stats.max_length is None or length > stats.max_length:
+            stats.max_length = length
+        
+        # Check for binary and common patterns
+        patterns_mask = self._classify_string(value)
+        if patterns_mask & P_BINARY:
+            stats.is_binary = True
+            patterns_mask ^= P_BINARY
+        stats.patterns_mask |= patterns_mask
+    
+    def _analyze_numeric_field(self, stats: _FieldStats, value: Union[int, float]) -> None:
         """Analyze a numeric field for constraints."""
         # Only analyze actual numeric values
-        if not isinstance(value, (int, float)):
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
             return
-            
-        # Ensure we have valid numeric values
-        if isinstance(value, (int, float)) and not isinstance(value, bool):
-            if analysis['min_value'] is None or value < analysis['min_value']:
-                analysis['min_value'] = value
-            if analysis['max_value'] is None or value > analysis['max_value']:
-                analysis['max_value'] = value
-    
-    def _analyze_array_field(self, analysis: Dict[str, Any], value: List) -> None:
+        
+        # Buffer ints and floats separately so min/max keep the original type
+        if type(value) is int:
+            buffer = stats.int_buf
+            if buffer is None:
+                buffer = stats.int_buf = array.array('q')
+            try:
+                buffer.append(value)
+            except OverflowError:
+                # Outside the 64-bit range - compare directly
+                self._update_numeric_range(stats, value, value)
+                return
+        else:
+            buffer = stats.float_buf
+            if buffer is None:
+                buffer = stats.float_buf = array.array('d')
+            buffer.append(value)
+        
+        if len(buffer) >= NUMERIC_BUFFER_SIZE:
+            self._flush_numeric_buffers(stats)
+    
+    def _update_numeric_range(self, stats: _FieldStats, low: Union[int, float], high: Union[int, float]) -> None:
+        """Widen the tracked min/max value of a field."""
+        if stats.min_value is None or low < stats.min_value:
+            stats.min_value = low
+        if stats.max_value is None or high > stats.max_value:
+            stats.max_value = high
+    
+    def _flush_numeric_buffers(self, stats: _FieldStats) -> None:
+        """Reduce buffered numeric values into min_value/max_value and reset the buffers."""
+        for buffer in (stats.int_buf, stats.float_buf):
+            if buffer:
+                self._update_numeric_range(stats, min(buffer), max(buffer))
+        stats.int_buf = None
+        stats.float_buf = None
+    
+    def _analyze_array_field(self, stats: _FieldStats, value: List) -> None:
         """Analyze an array field."""
         # Length analysis
         length = len(value)
-        if analysis['min_length'] is None or length < analysis['min_length']:
-            analysis['min_length'] = length
-        if analysis['max_length'] is None or length > analysis['max_length']:
-            analysis['max_length'] = length
+        if stats.min_length is None or length < stats.min_length:
+            stats.min_length = length
+        if stats.max_length is None or length > stats.max_length:
+            stats.max_length = length
         
         # Analyze array item types and structure
-        if 'array_structure' not in analysis:
-            analysis['array_structure'] = {
+        if stats.array_structure is None:
+            stats.array_structure = {
                 'item_types': set(),
                 'item_schemas': {},
                 'consistent_structure': True,
                 'nested_objects': False
             }
         
-        # Analyze each item in the array
-        for item in value:
-            item_type = type(item).__name__
-            analysis['array_structure']['item_types'].add(item_type)
+        # Collect the distinct item types in one C-level pass instead of one set insert per item
+        item_classes = set(map(type, value))
+        for item_class in item_classes:
+            stats.array_structure['item_types'].add(_TYPE_NAMES[item_class])
+        
+        # If items are objects, analyze their structure
+        if dict in item_classes:
+            stats.array_structure['nested_objects'] = True
             
-            # If item is an object, analyze its structure
-            if isinstance(item, dict):
-                analysis['array_structure']['nested_objects'] = True
+            for item in value:
+                if type(item) is not dict:
+                    continue
                 
                 # Create a unique key for this object structure
                 item_keys = tuple(sorted(item.keys()))
-                if item_keys not in analysis['array_structure']['item_schemas']:
-                    analysis['array_structure']['item_schemas'][item_keys] = {
+                if item_keys not in stats.array_structure['item_schemas']:
+                    stats.array_structure['item_schemas'][item_keys] = {
                         'fields': set(),
                         'field_types': {},
                         'field_patterns': {},
@@ -327,7 +1205,7 @@ class SchemaGenerator:
                         'count': 0
                     }
                 
-                schema_info = analysis['array_structure']['item_schemas'][item_keys]
+                schema_info = stats.array_structure['item_schemas'][item_keys]
                 schema_info['count'] += 1
                 
                 # Analyze each field in the object
@@ -335,26 +1213,19 @@ class SchemaGenerator:
                     schema_info['fields'].add(field_name)
                     
                     # Analyze field type
-                    field_type = type(field_value).__name__
+                    value_type = type(field_value)
                     if field_name not in schema_info['field_types']:
                         schema_info['field_types'][field_name] = set()
-                    schema_info['field_types'][field_name].add(field_type)
+                    schema_info['field_types'][field_name].add(_TYPE_NAMES[value_type])
                     
                     # Analyze string patterns
-                    if isinstance(field_value, str):
+                    if value_type is str:
                         if field_name not in schema_info['field_patterns']:
                             schema_info['field_patterns'][field_name] = set()
                         
-                        if self._is_email(field_value):
-                            schema_info['field_patterns'][field_name].add('email')
-                        elif self._is_url(field_value):
-                            schema_info['field_patterns'][field_name].add('url')
-                        elif self._is_date_time(field_value):
-                            schema_info['field_patterns'][field_name].add('datetime')
-                        elif self._is_uuid(field_value):
-                            schema_info['field_patterns'][field_name].add('uuid')
-                        elif self._is_likely_binary(field_value):
-                            schema_info['field_patterns'][field_name].add('binary')
+                        patterns_mask = self._classify_string(field_value)
+                        if patterns_mask:
+                            schema_info['field_patterns'][field_name].add(_PATTERN_NAMES[patterns_mask & -patterns_mask])
                     
                     # Analyze constraints
                     if field_name not in schema_info['field_constraints']:
@@ -367,23 +1238,23 @@ class SchemaGenerator:
                     
                     constraints = schema_info['field_constraints'][field_name]
                     
-                    if isinstance(field_value, str):
+                    if value_type is str:
                         length = len(field_value)
                         if constraints['min_length'] is None or length < constraints['min_length']:
                             constraints['min_length'] = length
                         if constraints['max_length'] is None or length > constraints['max_length']:
                             constraints['max_length'] = length
-                    elif isinstance(field_value, (int, float)) and not isinstance(field_value, bool):
+                    elif value_type is int or value_type is float:
                         if constraints['min_value'] is None or field_value < constraints['min_value']:
                             constraints['min_value'] = field_value
                         if constraints['max_value'] is None or field_value > constraints['max_value']:
                             constraints['max_value'] = field_value
     
-    def _analyze_object_field(self, analysis: Dict[str, Any], value: Dict) -> None:
+    def _analyze_object_field(self, stats: _FieldStats, value: Dict) -> None:
         """Analyze an object field."""
         # Analyze nested object structure
-        if 'nested_structure' not in analysis:
-            analysis['nested_structure'] = {
+        if stats.nested_structure is None:
+            stats.nested_structure = {
                 'fields': set(),
                 'field_types': {},
                 'field_patterns': {},
@@ -392,48 +1263,41 @@ class SchemaGenerator:
         
         # Analyze each field in the nested object
         for field_name, field_value in value.items():
-            analysis['nested_structure']['fields'].add(field_name)
+            stats.nested_structure['fields'].add(field_name)
             
             # Analyze field type
-            field_type = type(field_value).__name__
-            if field_name not in analysis['nested_structure']['field_types']:
-                analysis['nested_structure']['field_types'][field_name] = set()
-            analysis['nested_structure']['field_types'][field_name].add(field_type)
+            value_type = type(field_value)
+            if field_name not in stats.nested_structure['field_types']:
+                stats.nested_structure['field_types'][field_name] = set()
+            stats.nested_structure['field_types'][field_name].add(_TYPE_NAMES[value_type])
             
             # Analyze string patterns
-            if isinstance(field_value, str):
-                if field_name not in analysis['nested_structure']['field_patterns']:
-                    analysis['nested_structure']['field_patterns'][field_name] = set()
+            if value_type is str:
+                if field_name not in stats.nested_structure['field_patterns']:
+                    stats.nested_structure['field_patterns'][field_name] = set()
                 
-                if self._is_email(field_value):
-                    analysis['nested_structure']['field_patterns'][field_name].add('email')
-                elif self._is_url(field_value):
-                    analysis['nested_structure']['field_patterns'][field_name].add('url')
-                elif self._is_date_time(field_value):
-                    analysis['nested_structure']['field_patterns'][field_name].add('datetime')
-                elif self._is_uuid(field_value):
-                    analysis['nested_structure']['field_patterns'][field_name].add('uuid')
-                elif self._is_likely_binary(field_value):
-                    analysis['nested_structure']['field_patterns'][field_name].add('binary')
+                patterns_mask = self._classify_string(field_value)
+                if patterns_mask:
+                    stats.nested_structure['field_patterns'][field_name].add(_PATTERN_NAMES[patterns_mask & -patterns_mask])
             
             # Analyze constraints
-            if field_name not in analysis['nested_structure']['field_constraints']:
-                analysis['nested_structure']['field_constraints'][field_name] = {
+            if field_name not in stats.nested_structure['field_constraints']:
+                stats.nested_structure['field_constraints'][field_name] = {
                     'min_length': None,
                     'max_length': None,
                     'min_value': None,
                     'max_value': None
                 }
             
-            constraints = analysis['nested_structure']['field_constraints'][field_name]
+            constraints = stats.nested_structure['field_constraints'][field_name]
             
-            if isinstance(field_value, str):
+            if value_type is str:
                 length = len(field_value)
                 if constraints['min_length'] is None or length < constraints['min_length']:
                     constraints['min_length'] = length
                 if constraints['max_length'] is None or length > constraints['max_length']:
                     constraints['max_length'] = length
-            elif isinstance(field_value, (int, float)) and not isinstance(field_value, bool):
+            elif value_type is int or value_type is float:
                 if constraints['min_value'] is None or field_value < constraints['min_value']:
                     constraints['min_value'] = field_value
                 if constraints['max_value'] is None or field_value > constraints['max_value']:
@@ -442,9 +1306,16 @@ class SchemaGenerator:
     def _post_process_field_analysis(self, analysis: Dict[str, Any], total_objects: int) -> None:
         """Post-process field analysis to determine final characteristics."""
         # Check if field has mixed types
-        if len(analysis['types']) > 1:
+        if _bit_count(analysis['types_mask']) + len(analysis['types']) > 1:
             analysis['is_mixed'] = True
         
+        # Expand the bitmasks into the name sets used by callers, and flag
+        # non-JSON types (only tracked by name) in the type mask
+        if analysis['types']:
+            analysis['types_mask'] |= T_OTHER
+        analysis['types'].update(_mask_to_names(analysis['types_mask'], _TYPE_BIT_NAMES))
+        analysis['patterns'].update(_mask_to_names(analysis['patterns_mask'], _PATTERN_BIT_NAMES))
+        
         # Determine if field is required (present in all objects and never null)
         # A field is required if it appears in all objects AND is never null when present
         analysis['required'] = (analysis['missing_count'] == 0 and analysis['null_count'] == 0)
@@ -455,70 +1326,116 @@ class SchemaGenerator:
         # Calculate presence percentage
         analysis['presence_percentage'] = (total_objects - analysis['missing_count']) / total_objects
     
+    def clear_caches(self) -> None:
+        """
+        Drop everything this generator memoized from the data it has seen.
+        
+        Clears the string classifications, the leaf schemas and the compiled
+        validators, e.g. once a long-lived generator finishes a request.
+        """
+        self._classify_string.cache_clear()
+        self._is_binary_string.cache_clear()
+        self._leaf_schema_cache.clear()
+        self._schema_validators.cache_clear()
+    
+    def _sync_binary_checks(self) -> None:
+        """
+        Rebuild the binary checks if binary_patterns changed since they were built.
+        
+        The default patterns use table-driven checks, any other pattern is compiled.
+        Cached string verdicts were made with the old patterns, so both string
+        caches are cleared as well.
+        """
+        if self.binary_patterns == self._binary_checks_patterns:
+            return
+        patterns = list(self.binary_patterns)
+        self._builtin_binary_checks = tuple(
+            _BINARY_PATTERN_CHECKS[pattern] for pattern in patterns if pattern in _BINARY_PATTERN_CHECKS
+        )
+        self._custom_binary_checks = tuple(
+            re.compile(pattern).match for pattern in patterns if pattern not in _BINARY_PATTERN_CHECKS
+        )
+        self._binary_checks_patterns = patterns
+        self._classify_string.cache_clear()
+        self._is_binary_string.cache_clear()
+    
     def _is_likely_binary(self, value: str) -> bool:
         """Check if a string value is likely binary data."""
         if not value:
             return False
         
         # Skip very short strings - they're unlikely to be binary
-        if len(value) < 20:
+        if len(value) < MIN_BINARY_LENGTH:
             return False
         
-        # Check for base64 pattern (must be longer and more specific)
-        for pattern in self.binary_patterns:
-            if re.match(pattern, value):
+        # Check for base64 pattern (must be longer and more specific).
+        # Neither built-in pattern allows spaces, so plain text skips their scan.
+        self._sync_binary_checks()
+        if ' ' not in value:
+            for check in self._builtin_binary_checks:
+                if check(value):
+                    return True
+        for check in self._custom_binary_checks:
+            if check(value):
                 return True
         
-        # Check for high entropy (lots of different characters) - but be more conservative
-        unique_chars = len(set(value))
-        if len(value) > 50 and unique_chars / len(value) > 0.9:
-            return True
-        
-        # Additional checks for common non-binary patterns
-        # If it looks like a name, email, URL, etc., it's probably not binary
-        if self._is_email(value) or self._is_url(value) or self._is_date_time(value) or self._is_uuid(value):
-            return False
-        
-        # If it contains spaces or common punctuation, it's probably text
-        if ' ' in value or any(char in value for char in ',.!?;:()[]{}"\''):
-            return False
-        
-        # If it's all lowercase or all uppercase, it's probably text
-        if value.islower() or value.isupper():
-            return False
+        # Check for high entropy (lots of different characters) - but be more conservative.
+        # An ASCII string has at most 128 distinct characters, so long ASCII
+        # strings can never pass and skip building the character set.
+        length = len(value)
+        if length > 50 and (length * 0.9 < 128 or not value.isascii()):
+            if len(set(value)) / length > 0.9:
+                return True
         
         return False
     
+    # Each predicate first rejects strings on a character the pattern requires,
+    # which is much cheaper than starting the regex engine for ordinary text
+    
     def _is_email(self, value: str) -> bool:
         """Check if a string is an email address."""
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(email_pattern, value))
+        return '@' in value and EMAIL_REGEX.match(value) is not None
     
     def _is_url(self, value: str) -> bool:
         """Check if a string is a URL."""
-        url_pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-        return bool(re.match(url_pattern, value))
+        return value.startswith('http') and URL_REGEX.match(value) is not None
     
     def _is_date_time(self, value: str) -> bool:
         """Check if a string is a date/time."""
-        # Common date/time patterns
-        patterns = [
-            r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}',  # ISO format
-            r'^\d{4}-\d{2}-\d{2}$',  # Date only
-            r'^\d{2}/\d{2}/\d{4}$',  # MM/DD/YYYY
-            r'^\d{2}-\d{2}-\d{4}$',  # MM-DD-YYYY
-        ]
+        # Every supported format starts with a digit
+        if not value[:1].isdigit():
+            return False
         
-        for pattern in patterns:
-            if re.match(pattern, value):
+        for regex in DATE_TIME_REGEXES:
+            if regex.match(value):
                 return True
         
         return False
     
     def _is_uuid(self, value: str) -> bool:
         """Check if a string is a UUID."""
-        uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-        return bool(re.match(uuid_pattern, value.lower()))
+        return value[8:9] == '-' and UUID_REGEX.match(value) is not None
+    
+    def _detect_string_patterns(self, value: str) -> int:
+        """
+        Detect the patterns a string matches.
+        
+        Use the memoized self._classify_string instead of calling this directly.
+        
+        Args:
+            value: String to classify
+            
+        Returns:
+            Bitmask with at most one of P_EMAIL, P_URL, P_DATETIME, P_UUID (first
+            match in that order) plus P_BINARY if the string looks binary. The
+            lowest set bit is therefore the highest priority pattern.
+        """
+        match = PATTERN_REGEX.match(value)
+        mask = _PATTERN_BITS[match.lastgroup] if match else 0
+        
+        if self._is_likely_binary(value):
+            mask |= P_BINARY
+        return mask
     
     def _generate_schema_from_analysis(self, field_analysis: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -559,24 +1476,25 @@ class SchemaGenerator:
             Property schema
         """
         types = analysis['types']
+        types_mask = analysis['types_mask']
         
         # Handle mixed types
         if analysis.get('is_mixed', False) or len(types) > 1:
             return self._generate_mixed_type_schema(analysis)
         
         # Handle single types
-        if 'NoneType' in types and len(types) == 1:
+        if types_mask == T_NULL:
             # Field is only null
             return {"type": "null"}
-        elif 'str' in types:
+        elif types_mask & T_STR:
             return self._generate_string_schema(analysis)
-        elif 'int' in types or 'float' in types:
+        elif types_mask & (T_INT | T_FLOAT):
             return self._generate_numeric_schema(analysis)
-        elif 'bool' in types:
+        elif types_mask & T_BOOL:
             return self._generate_boolean_schema(analysis)
-        elif 'list' in types:
+        elif types_mask & T_LIST:
             return self._generate_array_schema(analysis)
-        elif 'dict' in types:
+        elif types_mask & T_DICT:
             return self._generate_object_schema(analysis)
         else:
             # Fallback to any type
@@ -585,11 +1503,12 @@ class SchemaGenerator:
     def _generate_mixed_type_schema(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Generate schema for fields with mixed types."""
         type_schemas = []
+        types_mask = _analysis_types_mask(analysis)
         
         # Handle null type separately to avoid nested oneOf
-        has_null = 'NoneType' in analysis['types'] or analysis.get('null_percentage', 0) > 0
+        has_null = bool(types_mask & T_NULL) or analysis.get('null_percentage', 0) > 0
         
-        if 'str' in analysis['types']:
+        if types_mask & T_STR:
             str_schema = {"type": "string"}
             # Add length constraints if available
             if analysis.get('min_length') is not None:
@@ -597,22 +1516,15 @@ class SchemaGenerator:
             if analysis.get('max_length') is not None:
                 str_schema["maxLength"] = analysis['max_length']
             # Add pattern constraints
-            if 'email' in analysis.get('patterns', set()):
-                str_schema["format"] = "email"
-            elif 'url' in analysis.get('patterns', set()):
-                str_schema["format"] = "uri"
-            elif 'datetime' in analysis.get('patterns', set()):
-                str_schema["format"] = "date-time"
-            elif 'uuid' in analysis.get('patterns', set()):
-                str_schema["format"] = "uuid"
+            str_schema.update(_pattern_mask_keywords(_analysis_patterns_mask(analysis)))
             # Handle binary data
             if analysis.get('is_binary', False):
                 str_schema["contentEncoding"] = "base64"
                 str_schema["contentMediaType"] = "application/octet-stream"
             type_schemas.append(str_schema)
             
-        if 'int' in analysis['types'] or 'float' in analysis['types']:
-            if 'float' in analysis['types']:
+        if types_mask & (T_INT | T_FLOAT):
+            if types_mask & T_FLOAT:
                 numeric_schema = {"type": "number"}
             else:
                 numeric_schema = {"type": "integer"}
@@ -625,19 +1537,24 @@ class SchemaGenerator:
                 numeric_schema["maximum"] = max_value
             type_schemas.append(numeric_schema)
             
-        if 'bool' in analysis['types']:
+        if types_mask & T_BOOL:
             type_schemas.append({"type": "boolean"})
             
-        if 'list' in analysis['types']:
+        if types_mask & T_LIST:
             array_schema = {"type": "array", "minItems": 0, "items": {}}
             type_schemas.append(array_schema)
             
-        if 'dict' in analysis['types']:
+        if types_mask & T_DICT:
             type_schemas.append({
                 "type": "object",
                 "additionalProperties": True
             })
         
+        # A single type plus null needs no oneOf - the type-specific keywords
+        # don't apply to null, so null can join the type list
+        if has_null and len(type_schemas) == 1:
+            return _allow_null(type_schemas[0])
+        
         # Add null if it's optional
         if has_null:
             type_schemas.append({"type": "null"})
@@ -661,13 +1578,15 @@ class SchemaGenerator:
         min_length = analysis.get('min_length')
         max_length = analysis.get('max_length')
         
+        patterns_mask = _analysis_patterns_mask(analysis)
+        
         # Only set minLength if it's greater than 0 and not too restrictive
         if min_length is not None and min_length > 0:
             # For most fields, use a reasonable minimum of 1
             # Only use the actual minimum for very specific cases like UUIDs
-            if 'uuid' in analysis.get('patterns', set()):
+            if patterns_mask & P_UUID:
                 schema["minLength"] = min_length  # UUIDs have fixed length
-            elif 'email' in analysis.get('patterns', set()):
+            elif patterns_mask & P_EMAIL:
                 schema["minLength"] = 5  # Reasonable minimum for emails
             else:
                 schema["minLength"] = 1  # General minimum for strings
@@ -675,14 +1594,12 @@ class SchemaGenerator:
         # Set maxLength for better validation - use a reasonable maximum
         if max_length is not None and max_length > 0:
             # For specific patterns, use exact max length
-            if 'uuid' in analysis.get('patterns', set()):
+            if patterns_mask & P_UUID:
                 schema["maxLength"] = max_length  # UUIDs have fixed length
-            elif 'credit_card' in analysis.get('patterns', set()):
-                schema["maxLength"] = max_length  # Credit cards have fixed format
-            elif 'email' in analysis.get('patterns', set()):
+            elif patterns_mask & P_EMAIL:
                 # For emails, use a reasonable maximum (254 chars is RFC standard)
                 schema["maxLength"] = min(max_length * 2, 254)
-            elif 'url' in analysis.get('patterns', set()):
+            elif patterns_mask & P_URL:
                 # For URLs, use a reasonable maximum
                 schema["maxLength"] = min(max_length * 3, 2048)
             else:
@@ -691,14 +1608,7 @@ class SchemaGenerator:
                 schema["maxLength"] = min(max_length * 2, 1000)  # Cap at 1000 chars
         
         # Add pattern constraints
-        if 'email' in analysis.get('patterns', set()):
-            schema["format"] = "email"
-        elif 'url' in analysis.get('patterns', set()):
-            schema["format"] = "uri"
-        elif 'datetime' in analysis.get('patterns', set()):
-            schema["format"] = "date-time"
-        elif 'uuid' in analysis.get('patterns', set()):
-            schema["format"] = "uuid"
+        schema.update(_pattern_mask_keywords(patterns_mask))
         
         # Handle binary data
         if analysis.get('is_binary', False):
@@ -709,7 +1619,8 @@ class SchemaGenerator:
     
     def _generate_numeric_schema(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Generate schema for numeric fields."""
-        if 'float' in analysis['types']:
+        is_float = bool(_analysis_types_mask(analysis) & T_FLOAT)
+        if is_float:
             schema = {"type": "number"}
         else:
             schema = {"type": "integer"}
@@ -718,34 +1629,9 @@ class SchemaGenerator:
         min_value = analysis.get('min_value')
         max_value = analysis.get('max_value')
         
-        if min_value is not None and max_value is not None and isinstance(min_value, (int, float)) and isinstance(max_value, (int, float)) and not isinstance(min_value, bool) and not isinstance(max_value, bool):
+        if _is_number(min_value) and _is_number(max_value):
             # Use smart ranges instead of exact values
-            if 'float' in analysis['types']:
-                # For floats, use percentage-based expansion
-                if min_value == max_value:
-                    # Single value - use 10% range
-                    range_size = abs(min_value) * 0.1
-                    schema["minimum"] = min_value - range_size
-                    schema["maximum"] = max_value + range_size
-                else:
-                    # Range of values - expand by 20%
-                    range_size = max_value - min_value
-                    expansion = range_size * 0.2
-                    schema["minimum"] = min_value - expansion
-                    schema["maximum"] = max_value + expansion
-            else:
-                # For integers, use reasonable ranges
-                if min_value == max_value:
-                    # Single value - use a small range around it
-                    range_size = max(1, abs(min_value) // 10)
-                    schema["minimum"] = min_value - range_size
-                    schema["maximum"] = max_value + range_size
-                else:
-                    # Range of values - expand it slightly
-                    range_size = max_value - min_value
-                    expansion = max(1, range_size // 4)  # Expand by 25%
-                    schema["minimum"] = min_value - expansion
-                    schema["maximum"] = max_value + expansion
+            schema["minimum"], schema["maximum"] = _expand_numeric_range(min_value, max_value, is_float)
         
         return schema
     
@@ -755,16 +1641,13 @@ class SchemaGenerator:
     
     def _generate_array_schema(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Generate schema for array fields."""
+        schema = self._generate_nested_array_schema(analysis)
+        
         # Check if field can be null
         if analysis.get('null_percentage', 0) > 0:
-            return {
-                "oneOf": [
-                    self._generate_nested_array_schema(analysis),
-                    {"type": "null"}
-                ]
-            }
+            return _allow_null(schema)
         
-        return self._generate_nested_array_schema(analysis)
+        return schema
     
     def _generate_nested_array_schema(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Generate schema for array fields with detailed item analysis."""
@@ -797,7 +1680,7 @@ class SchemaGenerator:
         """Generate schema for array items when they are objects."""
         if len(array_structure['item_schemas']) == 1:
             # All items have the same structure
-            item_schema_info = list(array_structure['item_schemas'].values())[0]
+            item_schema_info = next(iter(array_structure['item_schemas'].values()))
             return self._generate_array_object_schema(item_schema_info)
         else:
             # Multiple different object structures - use oneOf
@@ -810,30 +1693,14 @@ class SchemaGenerator:
         """Generate schema for an object within an array."""
         schema = {
             "type": "object",
-            "properties": {}
+            "properties": self._generate_structure_properties(item_schema_info)
         }
         
-        # Generate schemas for each field in the object
-        for field_name in item_schema_info['fields']:
-            field_types = item_schema_info['field_types'].get(field_name, set())
-            field_patterns = item_schema_info['field_patterns'].get(field_name, set())
-            field_constraints = item_schema_info['field_constraints'].get(field_name, {})
-            
-            # Generate schema for this field
-            field_schema = self._generate_nested_field_schema(field_types, field_patterns, field_constraints)
-            schema["properties"][field_name] = field_schema
-        
         # Analyze if this array object needs additionalProperties
-        needs_additional = self._analyze_array_object_additional_properties_needed(item_schema_info)
+        needs_additional, mixed_fields = self._analyze_structure_additional_properties(item_schema_info)
         if needs_additional:
             schema["additionalProperties"] = True
             # Add warning in description
-            mixed_fields = []
-            for field_name in item_schema_info['fields']:
-                field_types = item_schema_info['field_types'].get(field_name, set())
-                if len(field_types) > 1:
-                    mixed_fields.append(f"{field_name}({', '.join(field_types)})")
-            
             schema["description"] = f"⚠️ WARNING: Array item allows additional properties due to mixed types in fields: {', '.join(mixed_fields)}. Consider defining explicit field schemas for better validation."
         
         return schema
@@ -842,68 +1709,45 @@ class SchemaGenerator:
         """Generate schema for simple array items (strings, numbers, etc.)."""
         item_types = array_structure['item_types']
         
-        if len(item_types) == 1:
-            # Single type
-            item_type = list(item_types)[0]
-            if item_type == 'str':
-                return {"type": "string"}
-            elif item_type == 'int':
-                return {"type": "integer"}
-            elif item_type == 'float':
-                return {"type": "number"}
-            elif item_type == 'bool':
-                return {"type": "boolean"}
-            elif item_type == 'dict':
-                # For dict items, analyze if they need additionalProperties
-                needs_additional = self._analyze_dict_item_additional_properties_needed(array_structure)
-                schema = {"type": "object"}
-                if needs_additional:
-                    schema["additionalProperties"] = True
-                    schema["description"] = "⚠️ WARNING: Array dict item allows additional properties due to complex structure. Consider defining explicit field schemas."
-                return schema
-            elif item_type == 'list':
-                return {"type": "array", "items": {}}
-            else:
-                return {"type": "string"}
-        else:
-            # Multiple types - use oneOf
-            type_schemas = []
-            for item_type in item_types:
-                if item_type == 'str':
-                    type_schemas.append({"type": "string"})
-                elif item_type == 'int':
-                    type_schemas.append({"type": "integer"})
-                elif item_type == 'float':
-                    type_schemas.append({"type": "number"})
-                elif item_type == 'bool':
-                    type_schemas.append({"type": "boolean"})
-                elif item_type == 'dict':
-                    # For dict items, analyze if they need additionalProperties
-                    needs_additional = self._analyze_dict_item_additional_properties_needed(array_structure)
-                    schema = {"type": "object"}
-                    if needs_additional:
-                        schema["additionalProperties"] = True
-                        schema["description"] = "⚠️ WARNING: Array dict item allows additional properties due to complex structure. Consider defining explicit field schemas."
-                    type_schemas.append(schema)
-                elif item_type == 'list':
-                    type_schemas.append({"type": "array", "items": {}})
-                else:
-                    type_schemas.append({"type": "string"})
-            
-            return {"oneOf": type_schemas}
+        # Dict items depend on the rest of the array structure, so only
+        # primitive item type sets are cached
+        if 'dict' not in item_types:
+            cache_key = ('items', frozenset(item_types))
+            cached = self._cached_leaf_schema(cache_key)
+            if cached is None:
+                cached = self._store_leaf_schema(cache_key, self._build_simple_array_item_schema(array_structure))
+            return cached
+        
+        return self._build_simple_array_item_schema(array_structure)
+    
+    def _build_simple_array_item_schema(self, array_structure: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the schema for simple array items (uncached)."""
+        type_schemas = [self._simple_array_item_type_schema(item_type, array_structure) for item_type in array_structure['item_types']]
+        
+        # Single type as is, multiple types - use oneOf
+        return type_schemas[0] if len(type_schemas) == 1 else {"oneOf": type_schemas}
+    
+    def _simple_array_item_type_schema(self, item_type: str, array_structure: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate the schema for one simple array item type."""
+        if item_type == 'dict':
+            # For dict items, analyze if they need additionalProperties
+            needs_additional = self._analyze_dict_item_additional_properties_needed(array_structure)
+            schema = {"type": "object"}
+            if needs_additional:
+                schema["additionalProperties"] = True
+                schema["description"] = "⚠️ WARNING: Array dict item allows additional properties due to complex structure. Consider defining explicit field schemas."
+            return schema
+        return _clone_schema(PRIMITIVE_SCHEMAS.get(item_type, PRIMITIVE_SCHEMAS['str']))
     
     def _generate_object_schema(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Generate schema for object fields."""
+        schema = self._generate_nested_object_schema(analysis)
+        
         # Check if field can be null
         if analysis.get('null_percentage', 0) > 0:
-            return {
-                "oneOf": [
-                    self._generate_nested_object_schema(analysis),
-                    {"type": "null"}
-                ]
-            }
+            return _allow_null(schema)
         
-        return self._generate_nested_object_schema(analysis)
+        return schema
     
     def _generate_nested_object_schema(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Generate schema for nested object fields with detailed structure."""
@@ -916,73 +1760,83 @@ class SchemaGenerator:
         nested = analysis['nested_structure']
         schema = {
             "type": "object",
-            "properties": {}
+            "properties": self._generate_structure_properties(nested)
         }
         
-        # Generate schemas for each field in the nested object
-        for field_name in nested['fields']:
-            field_types = nested['field_types'].get(field_name, set())
-            field_patterns = nested['field_patterns'].get(field_name, set())
-            field_constraints = nested['field_constraints'].get(field_name, {})
-            
-            # Generate schema for this field
-            field_schema = self._generate_nested_field_schema(field_types, field_patterns, field_constraints)
-            schema["properties"][field_name] = field_schema
-        
         # Analyze if this nested object needs additionalProperties
-        needs_additional = self._analyze_nested_additional_properties_needed(analysis)
+        needs_additional, mixed_fields = self._analyze_structure_additional_properties(nested)
         if needs_additional:
             schema["additionalProperties"] = True
             # Add warning in description
-            mixed_fields = []
-            for field_name in nested['fields']:
-                field_types = nested['field_types'].get(field_name, set())
-                if len(field_types) > 1:
-                    mixed_fields.append(f"{field_name}({', '.join(field_types)})")
-            
             schema["description"] = f"⚠️ WARNING: This object allows additional properties due to mixed types in fields: {', '.join(mixed_fields)}. Consider defining explicit field schemas for better validation."
         
         return schema
     
+    def _generate_structure_properties(self, structure_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generate the property schemas for a nested object or array item structure.
+        
+        Args:
+            structure_info: Structure statistics with fields, field_types,
+                field_patterns and field_constraints
+            
+        Returns:
+            Dictionary mapping field names to their schemas
+        """
+        field_types = structure_info['field_types']
+        field_patterns = structure_info['field_patterns']
+        field_constraints = structure_info['field_constraints']
+        return {
+            field_name: self._generate_nested_field_schema(
+                field_types.get(field_name, set()),
+                field_patterns.get(field_name, set()),
+                field_constraints.get(field_name, {})
+            )
+            for field_name in structure_info['fields']
+        }
+    
     def _generate_nested_field_schema(self, field_types: Set[str], field_patterns: Set[str], field_constraints: Dict[str, Any]) -> Dict[str, Any]:
         """Generate schema for a nested field."""
+        # Fast path: plain strings without patterns or usable length bounds
+        if (not field_patterns and len(field_types) == 1 and 'str' in field_types
+                and not field_constraints.get('min_length') and not field_constraints.get('max_length')):
+            return {"type": "string"}
+        
+        cache_key = ('field', frozenset(field_types), frozenset(field_patterns), _constraints_key(field_constraints))
+        cached = self._cached_leaf_schema(cache_key)
+        if cached is None:
+            cached = self._store_leaf_schema(cache_key, self._build_nested_field_schema(field_types, field_patterns, field_constraints))
+        return cached
+    
+    def _cached_leaf_schema(self, cache_key: tuple) -> Optional[Dict[str, Any]]:
+        """Look up a memoized leaf schema, marking it as recently used."""
+        cached = self._leaf_schema_cache.get(cache_key)
+        if cached is not None:
+            self._leaf_schema_cache.move_to_end(cache_key)
+        return cached
+    
+    def _store_leaf_schema(self, cache_key: tuple, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Memoize a leaf schema, dropping the least recently used one beyond LEAF_SCHEMA_CACHE_SIZE."""
+        self._leaf_schema_cache[cache_key] = schema
+        if len(self._leaf_schema_cache) > LEAF_SCHEMA_CACHE_SIZE:
+            self._leaf_schema_cache.popitem(last=False)
+        return schema
+    
+    def _build_nested_field_schema(self, field_types: Set[str], field_patterns: Set[str], field_constraints: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the schema for a nested field (uncached)."""
         if len(field_types) == 1:
             # Single type
-            field_type = list(field_types)[0]
-            if field_type == 'str':
-                return self._generate_nested_string_schema(field_patterns, field_constraints)
-            elif field_type == 'int':
-                return self._generate_nested_numeric_schema('integer', field_constraints)
-            elif field_type == 'float':
-                return self._generate_nested_numeric_schema('number', field_constraints)
-            elif field_type == 'bool':
-                return {"type": "boolean"}
-            elif field_type == 'list':
-                return {"type": "array", "items": {}}
-            elif field_type == 'dict':
-                return {"type": "object", "additionalProperties": True}
-            else:
-                return {"type": "string"}
+            return self._nested_field_type_schema(next(iter(field_types)), field_patterns, field_constraints)
         else:
             # Multiple types - use oneOf
-            type_schemas = []
-            for field_type in field_types:
-                if field_type == 'str':
-                    type_schemas.append(self._generate_nested_string_schema(field_patterns, field_constraints))
-                elif field_type == 'int':
-                    type_schemas.append(self._generate_nested_numeric_schema('integer', field_constraints))
-                elif field_type == 'float':
-                    type_schemas.append(self._generate_nested_numeric_schema('number', field_constraints))
-                elif field_type == 'bool':
-                    type_schemas.append({"type": "boolean"})
-                elif field_type == 'list':
-                    type_schemas.append({"type": "array", "items": {}})
-                elif field_type == 'dict':
-                    type_schemas.append({"type": "object", "additionalProperties": True})
-                else:
-                    type_schemas.append({"type": "string"})
-            
-            return {"oneOf": type_schemas}
+            return {"oneOf": [self._nested_field_type_schema(field_type, field_patterns, field_constraints) for field_type in field_types]}
+    
+    def _nested_field_type_schema(self, field_type: str, field_patterns: Set[str], field_constraints: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate the schema for one type of a nested field."""
+        handler = self._nested_type_handlers.get(field_type)
+        if handler is not None:
+            return handler(field_patterns, field_constraints)
+        return _clone_schema(PRIMITIVE_SCHEMAS.get(field_type, PRIMITIVE_SCHEMAS['str']))
     
     def _generate_nested_string_schema(self, field_patterns: Set[str], field_constraints: Dict[str, Any]) -> Dict[str, Any]:
         """Generate schema for nested string fields."""
@@ -1022,56 +1876,37 @@ class SchemaGenerator:
             schema["maxLength"] = max_length
         
         # Add pattern constraints
-        if 'email' in field_patterns:
-            schema["format"] = "email"
-        elif 'url' in field_patterns:
-            schema["format"] = "uri"
-        elif 'datetime' in field_patterns:
-            schema["format"] = "date-time"
-        elif 'uuid' in field_patterns:
-            schema["format"] = "uuid"
-        elif 'binary' in field_patterns:
-            schema["contentEncoding"] = "base64"
-            schema["contentMediaType"] = "application/octet-stream"
+        schema.update(_pattern_keywords(field_patterns, include_binary=True))
         
         return schema
     
     def _generate_nested_numeric_schema(self, numeric_type: str, field_constraints: Dict[str, Any]) -> Dict[str, Any]:
         """Generate schema for nested numeric fields."""
-        schema = {"type": numeric_type}
+        if numeric_type == 'integer':
+            return self._generate_nested_integer_schema(field_constraints)
+        return self._generate_nested_number_schema(field_constraints)
+    
+    def _generate_nested_integer_schema(self, field_constraints: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate schema for nested integer fields."""
+        schema = {"type": "integer"}
         
         # Add smart value constraints with reasonable ranges
         min_value = field_constraints.get('min_value')
         max_value = field_constraints.get('max_value')
+        if _is_number(min_value) and _is_number(max_value):
+            schema["minimum"], schema["maximum"] = _expand_integer_range(min_value, max_value)
         
-        if min_value is not None and max_value is not None and isinstance(min_value, (int, float)) and isinstance(max_value, (int, float)) and not isinstance(min_value, bool) and not isinstance(max_value, bool):
-            # Use smart ranges instead of exact values
-            if numeric_type == 'integer':
-                # For integers, use reasonable ranges
-                if min_value == max_value:
-                    # Single value - use a small range around it
-                    range_size = max(1, abs(min_value) // 10)
-                    schema["minimum"] = min_value - range_size
-                    schema["maximum"] = max_value + range_size
-                else:
-                    # Range of values - expand it slightly
-                    range_size = max_value - min_value
-                    expansion = max(1, range_size // 4)  # Expand by 25%
-                    schema["minimum"] = min_value - expansion
-                    schema["maximum"] = max_value + expansion
-            else:
-                # For floats, use percentage-based expansion
-                if min_value == max_value:
-                    # Single value - use 10% range
-                    range_size = abs(min_value) * 0.1
-                    schema["minimum"] = min_value - range_size
-                    schema["maximum"] = max_value + range_size
-                else:
-                    # Range of values - expand by 20%
-                    range_size = max_value - min_value
-                    expansion = range_size * 0.2
-                    schema["minimum"] = min_value - expansion
-                    schema["maximum"] = max_value + expansion
+        return schema
+    
+    def _generate_nested_number_schema(self, field_constraints: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate schema for nested float fields."""
+        schema = {"type": "number"}
+        
+        # Add smart value constraints with reasonable ranges
+        min_value = field_constraints.get('min_value')
+        max_value = field_constraints.get('max_value')
+        if _is_number(min_value) and _is_number(max_value):
+            schema["minimum"], schema["maximum"] = _expand_float_range(min_value, max_value)
         
         return schema
     
@@ -1086,31 +1921,23 @@ class SchemaGenerator:
             True if additionalProperties should be allowed
         """
         # Check if we have mixed types or complex nested structures
-        for field_name, analysis in field_analysis.items():
+        for analysis in field_analysis.values():
             # If any field has mixed types, we might need additionalProperties
-            if analysis.get('is_mixed', False) or len(analysis['types']) > 1:
+            if analysis.get('is_mixed', False) or _has_multiple_types(analysis):
                 return True
             
             # If any field is an object with unknown structure, we might need additionalProperties
-            if 'dict' in analysis['types'] and 'nested_structure' not in analysis:
+            if _analysis_types_mask(analysis) & T_DICT and 'nested_structure' not in analysis:
                 return True
             
             # If any field has high null percentage, it might indicate flexible structure
             if analysis.get('null_percentage', 0) > 0.5:
                 return True
         
-        # If we have very few fields and they're all well-defined, don't allow additionalProperties
-        if len(field_analysis) <= 3:
-            all_well_defined = True
-            for analysis in field_analysis.values():
-                if len(analysis['types']) > 1 or analysis.get('is_mixed', False):
-                    all_well_defined = False
-                    break
-            if all_well_defined:
-                return False
-        
-        # Default to allowing additionalProperties for flexibility
-        return True
+        # Every field is well-defined at this point (mixed fields returned above).
+        # With very few fields, don't allow additionalProperties; otherwise
+        # default to allowing them for flexibility
+        return len(field_analysis) > 3
     
     def _analyze_nested_additional_properties_needed(self, analysis: Dict[str, Any]) -> bool:
         """
@@ -1126,21 +1953,7 @@ class SchemaGenerator:
         if 'nested_structure' not in analysis:
             return False
         
-        nested = analysis['nested_structure']
-        
-        # Only allow additionalProperties if we have mixed types in multiple fields
-        mixed_type_fields = 0
-        for field_name in nested['fields']:
-            field_types = nested['field_types'].get(field_name, set())
-            if len(field_types) > 1:
-                mixed_type_fields += 1
-        
-        # Only allow additionalProperties if more than 50% of fields have mixed types
-        if mixed_type_fields > len(nested['fields']) * 0.5:
-            return True
-        
-        # Default to not allowing additionalProperties for nested objects
-        return False
+        return self._analyze_structure_additional_properties(analysis['nested_structure'])[0]
     
     def _analyze_array_object_additional_properties_needed(self, item_schema_info: Dict[str, Any]) -> bool:
         """
@@ -1153,19 +1966,27 @@ class SchemaGenerator:
         Returns:
             True if additionalProperties should be allowed
         """
+        return self._analyze_structure_additional_properties(item_schema_info)[0]
+    
+    def _analyze_structure_additional_properties(self, structure_info: Dict[str, Any]) -> tuple:
+        """
+        Decide whether a nested object or array item structure needs additionalProperties.
+        
+        Args:
+            structure_info: Structure statistics with fields and field_types
+            
+        Returns:
+            Tuple of (needs additionalProperties, descriptions of the mixed-type fields)
+        """
         # Only allow additionalProperties if we have mixed types in multiple fields
-        mixed_type_fields = 0
-        for field_name in item_schema_info['fields']:
-            field_types = item_schema_info['field_types'].get(field_name, set())
+        mixed_fields = []
+        for field_name in structure_info['fields']:
+            field_types = structure_info['field_types'].get(field_name, set())
             if len(field_types) > 1:
-                mixed_type_fields += 1
+                mixed_fields.append(f"{field_name}({', '.join(field_types)})")
         
-        # Only allow additionalProperties if more than 50% of fields have mixed types
-        if mixed_type_fields > len(item_schema_info['fields']) * 0.5:
-            return True
-        
-        # Default to not allowing additionalProperties for array objects
-        return False
+        # Only allow additionalProperties if more than 50% of fields have mixed types
+        return len(mixed_fields) > len(structure_info['fields']) * 0.5, mixed_fields
     
     def _analyze_dict_item_additional_properties_needed(self, array_structure: Dict[str, Any]) -> bool:
         """
@@ -1203,7 +2024,7 @@ class SchemaGenerator:
             return self._analyze_nested_additional_properties_needed(analysis)
         
         # If we have mixed types, allow additionalProperties
-        if analysis.get('is_mixed', False) or len(analysis['types']) > 1:
+        if analysis.get('is_mixed', False) or _has_multiple_types(analysis):
             return True
         
         # If we have high null percentage, allow additionalProperties
@@ -1224,18 +2045,41 @@ class SchemaGenerator:
         Raises:
             ValueError: If schema validation fails
         """
-        try:
-            import jsonschema
-            from jsonschema import validate
-            
-            for i, item in enumerate(data):
-                validate(instance=item, schema=schema)
-            logger.info(f"Schema validation successful for {len(data)} items")
-        except ImportError:
+        if jsonschema is None:
             logger.warning("jsonschema not available, skipping validation")
-        except jsonschema.exceptions.ValidationError as e:
-            logger.error(f"Schema validation failed for item {i}: {e}")
-            raise ValueError(f"Generated schema does not validate input data: {e}")
+            return
+        
+        # Check and compile the schema once instead of on every item
+        validator, is_valid = self._schema_validators(json.dumps(schema))
+        
+        for i, item in enumerate(data):
+            # The compiled validator accepts the common case quickly;
+            # jsonschema has the final say and reports the error
+            if is_valid is not None and is_valid(item):
+                continue
+            error = best_match(validator.iter_errors(item))
+            if error is not None:
+                logger.error(f"Schema validation failed for item {i}: {error}")
+                raise ValueError(f"Generated schema does not validate input data: {error}")
+        logger.info(f"Schema validation successful for {len(data)} items")
+    
+    def _build_schema_validators(self, schema_json: str) -> Tuple[Any, Optional[Callable[[Any], bool]]]:
+        """
+        Check a schema and build its validators.
+        
+        Args:
+            schema_json: JSON-encoded schema
+            
+        Returns:
+            The jsonschema validator and the compiled validator (None if the schema can't be compiled)
+            
+        Raises:
+            jsonschema.exceptions.SchemaError: If the schema itself is invalid
+        """
+        schema = json.loads(schema_json)
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        return validator_class(schema), compile_validator(schema)
     
     def generate_flexible_schema(self, objects: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -1246,14 +2090,12 @@ class SchemaGenerator:
             objects: List of JSON objects to analyze
             
         Returns:
-            Flexible JSON schema that allows any content
+            Flexible JSON schema that allows any content. Property schemas of
+            non-binary fields are shared and must not be modified in place.
         """
         if not objects:
             raise ValueError("JSON objects list cannot be empty")
         
-        # Analyze fields but make the schema very permissive
-        field_analysis = self._analyze_fields(objects)
-        
         schema = {
             "$schema": "http://json-schema.org/draft-2020-12/schema#",
             "type": "object",
@@ -1261,28 +2103,21 @@ class SchemaGenerator:
             "additionalProperties": True
         }
         
-        for field_name, analysis in field_analysis.items():
-            # Create very permissive property schema
-            property_schema = {
-                "oneOf": [
-                    {"type": "string"},
-                    {"type": "number"},
-                    {"type": "integer"},
-                    {"type": "boolean"},
-                    {"type": "object", "additionalProperties": True},
-                    {"type": "array", "items": {}},
-                    {"type": "null"}
-                ]
-            }
-            
+        # Analyze fields but make the schema very permissive
+        for field in self._cached_field_constraints(objects):
             # Add binary support if detected
-            if analysis.get('is_binary', False):
-                property_schema["oneOf"].append({
-                    "type": "string",
-                    "contentEncoding": "base64"
-                })
+            if field.is_binary:
+                property_schema = {
+                    "oneOf": ANY_VALUE_SCHEMAS + [{
+                        "type": "string",
+                        "contentEncoding": "base64"
+                    }]
+                }
+            else:
+                # Very permissive property schema, shared between fields
+                property_schema = PERMISSIVE_PROPERTY_SCHEMA
             
-            schema["properties"][field_name] = property_schema
+            schema["properties"][field.name] = property_schema
         
         return schema
     
@@ -1299,9 +2134,6 @@ class SchemaGenerator:
         if not objects:
             raise ValueError("JSON objects list cannot be empty")
         
-        # Analyze fields with focus on binary detection
-        field_analysis = self._analyze_fields(objects)
-        
         schema = {
             "$schema": "http://json-schema.org/draft-2020-12/schema#",
             "type": "object",
@@ -1309,12 +2141,13 @@ class SchemaGenerator:
             "required": []
         }
         
-        for field_name, analysis in field_analysis.items():
-            property_schema = self._generate_binary_aware_property_schema(field_name, analysis)
-            schema["properties"][field_name] = property_schema
+        # Analyze fields with focus on binary detection
+        for field in self._cached_field_constraints(objects):
+            property_schema = self._generate_binary_aware_property_schema(field.name, field.analysis)
+            schema["properties"][field.name] = property_schema
             
-            if analysis.get('required', False):
-                schema["required"].append(field_name)
+            if field.required:
+                schema["required"].append(field.name)
         
         return schema
     
@@ -1372,9 +2205,6 @@ class SchemaGenerator:
         if not objects:
             raise ValueError("JSON objects list cannot be empty")
         
-        # Analyze fields to understand types
-        field_analysis = self._analyze_fields(objects)
-        
         schema = {
             "$schema": "http://json-schema.org/draft-2020-12/schema#",
             "type": "object",
@@ -1382,40 +2212,26 @@ class SchemaGenerator:
             "additionalProperties": True
         }
         
-        for field_name, analysis in field_analysis.items():
-            # Create flexible property schema that preserves type info
-            type_options = []
-            
-            # Add detected types
-            if 'str' in analysis['types']:
-                type_options.append({"type": "string"})
-            if 'int' in analysis['types']:
-                type_options.append({"type": "integer"})
-            if 'float' in analysis['types']:
-                type_options.append({"type": "number"})
-            if 'bool' in analysis['types']:
-                type_options.append({"type": "boolean"})
-            if 'list' in analysis['types']:
-                type_options.append({"type": "array", "items": {}})
-            if 'dict' in analysis['types']:
+        # Analyze fields to understand types
+        for field in self._cached_field_constraints(objects):
+            # Create flexible property schema that preserves type info from
+            # the shared option templates
+            types_mask = field.types_mask
+            type_options = [option for bit, option in FLEXIBLE_TYPE_OPTIONS if types_mask & bit]
+            
+            if types_mask & T_DICT:
                 # For dict types, analyze if they need additionalProperties
-                needs_additional = self._analyze_dict_type_additional_properties_needed(analysis)
-                schema = {"type": "object"}
-                if needs_additional:
-                    schema["additionalProperties"] = True
-                    schema["description"] = "⚠️ WARNING: Object allows additional properties due to mixed content. Consider defining explicit field schemas."
-                type_options.append(schema)
+                if self._analyze_dict_type_additional_properties_needed(field.analysis):
+                    type_options.append(FLEXIBLE_OPEN_OBJECT_SCHEMA)
+                else:
+                    type_options.append(FLEXIBLE_OBJECT_SCHEMA)
             
             # Always allow null for flexibility
-            type_options.append({"type": "null"})
+            type_options.append(NULL_SCHEMA)
             
             # Add binary support if detected
-            if analysis.get('is_binary', False):
-                type_options.append({
-                    "type": "string",
-                    "contentEncoding": "base64",
-                    "contentMediaType": "application/octet-stream"
-                })
+            if field.is_binary:
+                type_options.append(BINARY_STRING_SCHEMA)
             
             # If we have multiple types, use oneOf, otherwise use the single type
             if len(type_options) > 1:
@@ -1423,7 +2239,7 @@ class SchemaGenerator:
             else:
                 property_schema = type_options[0] if type_options else {"type": "string"}
             
-            schema["properties"][field_name] = property_schema
+            schema["properties"][field.name] = property_schema
         
         return schema
     
@@ -1441,9 +2257,6 @@ class SchemaGenerator:
         if not objects:
             raise ValueError("JSON objects list cannot be empty")
         
-        # Analyze fields to understand types
-        field_analysis = self._analyze_fields(objects)
-        
         schema = {
             "$schema": "http://json-schema.org/draft-2020-12/schema#",
             "type": "object",
@@ -1451,36 +2264,29 @@ class SchemaGenerator:
             "required": []
         }
         
-        for field_name, analysis in field_analysis.items():
+        # Analyze fields to understand types
+        for field in self._cached_field_constraints(objects):
             # Check if field should use Any type (binary or mixed content)
             should_use_any = (
-                analysis.get('is_binary', False) or 
-                analysis.get('is_mixed', False) or
-                analysis.get('null_percentage', 0) > 0.3  # High null percentage
+                field.is_binary or 
+                field.is_mixed or
+                field.null_percentage > 0.3  # High null percentage
             )
             
             if should_use_any:
                 # Use Any type - allows everything
                 property_schema = {
-                    "oneOf": [
-                        {"type": "string"},
-                        {"type": "number"},
-                        {"type": "integer"},
-                        {"type": "boolean"},
-                        {"type": "object", "additionalProperties": True},
-                        {"type": "array", "items": {}},
-                        {"type": "null"}
-                    ],
-                    "description": f"Any type for {field_name} (allows all content types)"
+                    "oneOf": ANY_VALUE_SCHEMAS,
+                    "description": f"Any type for {field.name} (allows all content types)"
                 }
             else:
                 # Use specific type based on analysis
-                property_schema = self._generate_property_schema(field_name, analysis)
+                property_schema = self._generate_property_schema(field.name, field.analysis)
             
-            schema["properties"][field_name] = property_schema
+            schema["properties"][field.name] = property_schema
             
-            if analysis.get('required', False):
-                schema["required"].append(field_name)
+            if field.required:
+                schema["required"].append(field.name)
         
         return schema
     
@@ -1498,9 +2304,6 @@ class SchemaGenerator:
         if not objects:
             raise ValueError("JSON objects list cannot be empty")
         
-        # Analyze fields to understand types
-        field_analysis = self._analyze_fields(objects)
-        
         schema = {
             "$schema": "http://json-schema.org/draft-2020-12/schema#",
             "type": "object",
@@ -1509,19 +2312,21 @@ class SchemaGenerator:
             "additionalProperties": False  # No extra fields allowed
         }
         
-        for field_name, analysis in field_analysis.items():
-            if analysis.get('is_binary', False):
+        # Analyze fields to understand types
+        for field in self._cached_field_constraints(objects):
+            field_name = field.name
+            if field.is_binary:
                 # Strict binary field - must be base64 encoded string
                 property_schema = {
                     "type": "string",
                     "contentEncoding": "base64",
                     "contentMediaType": "application/octet-stream",
                     "minLength": 1,
-                    "pattern": "^[A-Za-z0-9+/]*={0,2}$",  # Base64 pattern
+                    "pattern": BASE64_PATTERN,  # Base64 pattern
                     "description": f"Binary data for {field_name} (base64 encoded)",
                     "examples": ["SGVsbG8gV29ybGQ="]  # Example base64
                 }
-            elif analysis.get('is_mixed', False):
+            elif field.is_mixed:
                 # Mixed content field - allow everything but with descriptions
                 property_schema = {
                     "oneOf": [
@@ -1534,7 +2339,7 @@ class SchemaGenerator:
                             "type": "string",
                             "contentEncoding": "base64",
                             "description": "Binary content (base64 encoded)",
-                            "pattern": "^[A-Za-z0-9+/]*={0,2}$"
+                            "pattern": BASE64_PATTERN
                         },
                         {
                             "type": "object",
@@ -1568,7 +2373,7 @@ class SchemaGenerator:
                 }
             else:
                 # Regular field - use standard generation but be more strict
-                property_schema = self._generate_property_schema(field_name, analysis)
+                property_schema = self._generate_property_schema(field_name, field.analysis)
                 
                 # Add additional constraints for non-binary fields
                 if property_schema.get("type") == "string":
@@ -1578,7 +2383,7 @@ class SchemaGenerator:
             
             schema["properties"][field_name] = property_schema
             
-            if analysis.get('required', False):
+            if field.required:
                 schema["required"].append(field_name)
         
         return schema
@@ -1617,9 +2422,6 @@ class SchemaGenerator:
         if not objects:
             raise ValueError("JSON objects list cannot be empty")
         
-        # Use simple field analysis instead of complex deep analysis
-        field_analysis = self._analyze_fields(objects)
-        
         schema = {
             "$schema": "http://json-schema.org/draft-2020-12/schema#",
             "type": "object",
@@ -1629,12 +2431,13 @@ class SchemaGenerator:
             "description": f"Smart hardened schema with intelligent binary and mixed type handling (max depth: {max_depth})"
         }
         
-        for field_name, analysis in field_analysis.items():
-            property_schema = self._generate_smart_property_schema(field_name, analysis)
-            schema["properties"][field_name] = property_schema
+        # Use simple field analysis instead of complex deep analysis
+        for field in self._cached_field_constraints(objects):
+            property_schema = self._generate_smart_property_schema(field.name, field.analysis)
+            schema["properties"][field.name] = property_schema
             
-            if analysis.get('required', False):
-                schema["required"].append(field_name)
+            if field.required:
+                schema["required"].append(field.name)
         
         return schema
     
@@ -1648,102 +2451,223 @@ class SchemaGenerator:
         Returns:
             Enhanced field analysis with nested structure information
         """
-        return self._analyze_fields_deep_with_depth(objects, max_depth=200)
+        return self._cached_analyze_fields(objects, max_depth=200)
     
-    def _analyze_fields_deep_with_depth(self, objects: List[Dict[str, Any]], max_depth: int = 100) -> Dict[str, Dict[str, Any]]:
+    def _analyze_fields_deep_with_depth(self, objects: List[Dict[str, Any]], max_depth: int = 100,
+                                        workers: int = 1) -> Dict[str, Dict[str, Any]]:
         """
         Deep analysis of fields including nested structures and binary detection with configurable max depth.
         
         Args:
             objects: List of JSON objects to analyze
             max_depth: Maximum depth to analyze for nested structures
+            workers: Number of worker processes to spread the fields over (1 analyzes in this process)
             
         Returns:
             Enhanced field analysis with nested structure information
         """
-        field_analysis = self._analyze_fields(objects)
+        with self._analysis_scope(objects):
+            field_analysis = self._cached_analyze_fields(objects)
+            
+            # Fields are independent, so their deep analysis can run in parallel
+            if workers > 1 and len(field_analysis) > 1:
+                insights = self._deep_field_insights_parallel(objects, field_analysis, max_depth, workers)
+            else:
+                insights = {
+                    field_name: self._deep_field_insights(objects, field_name, analysis, max_depth)
+                    for field_name, analysis in field_analysis.items()
+                }
         
         # Enhance analysis with deep nested structure detection
         for field_name, analysis in field_analysis.items():
-            # Analyze nested structures if present
-            if 'dict' in analysis['types'] or 'list' in analysis['types']:
-                # Use recursive analysis for deep nesting with custom max depth
-                nested_analysis = self._analyze_nested_structures_recursive(objects, field_name, max_depth=max_depth)
+            nested_analysis, has_nested_binary = insights[field_name]
+            if nested_analysis is not None:
                 analysis.update(nested_analysis)
-            
-            # Enhanced binary detection for nested content
-            if self._has_nested_binary(objects, field_name):
+            if has_nested_binary:
                 analysis['has_nested_binary'] = True
                 analysis['is_binary'] = True  # Mark as binary if nested binary is found
         
         return field_analysis
     
-    def _enhance_deep_analysis(self, field_analysis: Dict[str, Dict[str, Any]], objects: List[Dict[str, Any]], max_depth: int) -> Dict[str, Dict[str, Any]]:
+    def _deep_field_insights(self, objects: List[Dict[str, Any]], field_name: str, analysis: Dict[str, Any],
+                             max_depth: int) -> tuple:
         """
-        Enhance the deep analysis with additional insights about nested structures.
+        Run the nested structure and nested binary analysis for one field.
         
         Args:
-            field_analysis: Initial field analysis
             objects: List of JSON objects
-            max_depth: Maximum depth to analyze
+            field_name: Name of the field to analyze
+            analysis: Basic analysis of the field (only the type mask and binary flag are read)
+            max_depth: Maximum depth to analyze for nested structures
             
         Returns:
-            Enhanced field analysis with deeper insights
+            Tuple of (nested structure analysis or None, whether the field has nested binary data)
+        """
+        with self._analysis_scope(objects):
+            nested_analysis = None
+            if _analysis_types_mask(analysis) & (T_DICT | T_LIST):
+                # Use recursive analysis for deep nesting with custom max depth
+                nested_analysis = self._analyze_nested_structures_recursive(objects, field_name, max_depth=max_depth)
+            
+            # Enhanced binary detection for nested content - a field already
+            # flagged binary has a binary string value, so the walk would find it
+            has_nested_binary = analysis['is_binary'] or self._has_nested_binary(objects, field_name, max_depth)
+        return nested_analysis, has_nested_binary
+    
+    def _deep_field_insights_parallel(self, objects: List[Dict[str, Any]], field_analysis: Dict[str, Dict[str, Any]],
+                                      max_depth: int, workers: int) -> Dict[str, tuple]:
         """
-        enhanced_analysis = field_analysis.copy()
+        Run _deep_field_insights for every field in a pool of worker processes.
         
-        for field_name, analysis in enhanced_analysis.items():
-            # Analyze nested structures more deeply
-            if 'dict' in analysis['types'] or 'list' in analysis['types']:
-                nested_insights = self._analyze_deep_nested_insights(objects, field_name, max_depth)
-                analysis.update(nested_insights)
+        Fields are dealt round-robin to the workers, and each worker only
+        receives the values of its own fields rather than the whole object list.
+        
+        Args:
+            objects: List of JSON objects
+            field_analysis: Basic field analysis
+            max_depth: Maximum depth to analyze for nested structures
+            workers: Number of worker processes
             
-            # Analyze string patterns more deeply (simplified)
-            if 'str' in analysis['types']:
-                # Just add basic string insights without complex analysis
-                string_insights = self._analyze_basic_string_patterns(objects, field_name)
-                analysis.update(string_insights)
+        Returns:
+            Dictionary mapping field names to their _deep_field_insights result
+        """
+        workers = min(workers, len(field_analysis))
+        shards = [[] for _ in range(workers)]
+        for position, (field_name, analysis) in enumerate(field_analysis.items()):
+            shards[position % workers].append((
+                field_name,
+                self._field_values(objects, field_name),
+                {'types_mask': _analysis_types_mask(analysis), 'is_binary': analysis['is_binary']}
+            ))
+        
+        insights = {}
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for partial in executor.map(_deep_field_insights_chunk, shards, [max_depth] * workers, [self.binary_patterns] * workers):
+                insights.update(partial)
+        return insights
+    
+    def _enhance_deep_analysis(self, field_analysis: Dict[str, Dict[str, Any]], objects: List[Dict[str, Any]], max_depth: int) -> Dict[str, Dict[str, Any]]:
+        """
+        Enhance the deep analysis with additional insights about nested structures.
+        
+        The per-field analysis dicts are updated in place.
+        
+        Args:
+            field_analysis: Initial field analysis
+            objects: List of JSON objects
+            max_depth: Maximum depth to analyze
             
-            # Analyze array contents more deeply
-            if 'list' in analysis['types']:
-                array_insights = self._analyze_deep_array_contents(objects, field_name, max_depth)
-                analysis.update(array_insights)
+        Returns:
+            The same field analysis, enhanced with deeper insights
+        """
+        with self._analysis_scope(objects):
+            for field_name, analysis in field_analysis.items():
+                types_mask = _analysis_types_mask(analysis)
+                analyze_nested = bool(types_mask & (T_DICT | T_LIST))
+                analyze_strings = bool(types_mask & T_STR)
+                analyze_arrays = bool(types_mask & T_LIST)
+                
+                if analyze_nested or analyze_strings or analyze_arrays:
+                    analysis.update(self._collect_deep_insights(
+                        objects, field_name, max_depth, analyze_nested, analyze_strings, analyze_arrays
+                    ))
         
-        return enhanced_analysis
+        return field_analysis
     
-    def _analyze_deep_nested_insights(self, objects: List[Dict[str, Any]], field_name: str, max_depth: int) -> Dict[str, Any]:
+    def _collect_deep_insights(self, objects: List[Dict[str, Any]], field_name: str, max_depth: int,
+                               analyze_nested: bool, analyze_strings: bool, analyze_arrays: bool) -> Dict[str, Any]:
         """
-        Analyze nested structures for deeper insights.
+        Collect nested structure, string pattern and array content insights for a
+        field in a single pass over the objects.
         
         Args:
             objects: List of JSON objects
             field_name: Name of the field to analyze
             max_depth: Maximum depth to analyze
+            analyze_nested: Collect deep_nested_* insights for nested values
+            analyze_strings: Collect string pattern and length insights
+            analyze_arrays: Collect array_* insights for array values
             
         Returns:
-            Deep nested insights
+            Insights for the requested categories
         """
-        insights = {
+        nested_insights = {
             'deep_nested_types': set(),
             'deep_nested_patterns': set(),
             'deep_nested_binary_count': 0,
-            'deep_nested_string_lengths': [],
+            'deep_nested_string_lengths': array.array('I'),
             'deep_nested_complexity': 0
         }
-        
-        for obj in objects:
-            if field_name in obj:
-                value = obj[field_name]
-                self._analyze_single_nested_value(value, insights, 0, max_depth)
-        
-        # Calculate complexity score
-        insights['deep_nested_complexity'] = len(insights['deep_nested_types']) + len(insights['deep_nested_patterns'])
+        string_patterns_mask = 0
+        string_lengths = array.array('I')
+        array_item_types = set()
+        array_item_types_mask = 0
+        array_item_patterns = set()
+        array_lengths = set()
+        array_max_nested_depth = 0
+        
+        for value in self._field_values(objects, field_name):
+            # Walk nested structures
+            if analyze_nested:
+                self._analyze_single_nested_value(value, nested_insights, 0, max_depth)
+            
+            value_type = type(value)
+            if value_type is str:
+                if analyze_strings:
+                    patterns_mask = self._classify_string(value)
+                    string_patterns_mask |= patterns_mask & -patterns_mask
+                    string_lengths.append(len(value))
+            
+            elif value_type is list and analyze_arrays:
+                array_lengths.add(len(value))
+                
+                for item in value:
+                    item_type = type(item)
+                    type_bit = _TYPE_BITS.get(item_type)
+                    if type_bit is None:
+                        array_item_types.add(_TYPE_NAMES[item_type])
+                    else:
+                        array_item_types_mask |= type_bit
+                    
+                    # Analyze nested items
+                    if item_type is dict or item_type is list:
+                        item_insights = {
+                            'deep_nested_types': set(),
+                            'deep_nested_patterns': set(),
+                            'deep_nested_binary_count': 0,
+                            'deep_nested_string_lengths': array.array('I')
+                        }
+                        self._analyze_single_nested_value(item, item_insights, 0, max_depth)
+                        array_item_patterns.update(item_insights['deep_nested_patterns'])
+                        array_max_nested_depth = max(array_max_nested_depth, len(item_insights['deep_nested_types']))
+        
+        insights = {}
+        if analyze_nested:
+            # Calculate complexity score
+            nested_insights['deep_nested_complexity'] = len(nested_insights['deep_nested_types']) + len(nested_insights['deep_nested_patterns'])
+            insights.update(nested_insights)
+        
+        if analyze_strings:
+            insights['string_patterns'] = _mask_to_names(string_patterns_mask, _PATTERN_BIT_NAMES)
+            insights['string_length_distribution'] = string_lengths
+        
+        if analyze_arrays:
+            array_item_types.update(_mask_to_names(array_item_types_mask, _TYPE_BIT_NAMES))
+            insights['array_item_types'] = array_item_types
+            insights['array_item_patterns'] = array_item_patterns
+            insights['array_nested_complexity'] = len(array_item_types) + len(array_item_patterns)
+            # Arrays are consistent if they all have the same length
+            insights['array_consistent_structure'] = len(array_lengths) <= 1
+            insights['array_max_nested_depth'] = array_max_nested_depth
         
         return insights
     
     def _analyze_single_nested_value(self, value: Any, insights: Dict[str, Any], current_depth: int, max_depth: int) -> None:
         """
-        Analyze a single nested value recursively.
+        Analyze a single nested value and everything below it.
+        
+        Walks the structure with an explicit stack instead of recursing, so
+        deep documents don't pay a Python call per node.
         
         Args:
             value: Value to analyze
@@ -1754,179 +2678,106 @@ class SchemaGenerator:
         if current_depth >= max_depth:
             return
         
-        value_type = type(value).__name__
-        insights['deep_nested_types'].add(value_type)
-        
-        if isinstance(value, str):
-            # Analyze string patterns
-            if self._is_email(value):
-                insights['deep_nested_patterns'].add('email')
-            elif self._is_url(value):
-                insights['deep_nested_patterns'].add('url')
-            elif self._is_date_time(value):
-                insights['deep_nested_patterns'].add('datetime')
-            elif self._is_uuid(value):
-                insights['deep_nested_patterns'].add('uuid')
-            
-            # Track string lengths
-            insights['deep_nested_string_lengths'].append(len(value))
-            
-            # Check for binary
-            if self._is_likely_binary(value):
-                insights['deep_nested_binary_count'] += 1
+        # Types and patterns are accumulated as bitmasks and expanded into the
+        # insight name sets once at the end
+        types_mask = 0
+        patterns_mask = 0
+        add_string_length = insights['deep_nested_string_lengths'].append
+        binary_count = 0
+        
+        # Children are pushed in reverse so they pop in document order
+        stack = [(value, current_depth)]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            value, depth = pop()
+            value_type = type(value)
+            type_bit = _TYPE_BITS.get(value_type)
+            if type_bit is None:
+                insights['deep_nested_types'].add(_TYPE_NAMES[value_type])
+            else:
+                types_mask |= type_bit
+            
+            if value_type is str:
+                # Analyze string patterns (at most one besides binary)
+                string_mask = self._classify_string(value)
+                patterns_mask |= string_mask & ~P_BINARY
                 
-        elif isinstance(value, dict):
-            # Recursively analyze dictionary
-            for k, v in value.items():
-                self._analyze_single_nested_value(v, insights, current_depth + 1, max_depth)
+                # Track string lengths
+                add_string_length(len(value))
                 
-        elif isinstance(value, list):
-            # Recursively analyze list items
-            for item in value:
-                self._analyze_single_nested_value(item, insights, current_depth + 1, max_depth)
-    
-    def _analyze_basic_string_patterns(self, objects: List[Dict[str, Any]], field_name: str) -> Dict[str, Any]:
-        """
-        Analyze string patterns with basic insights (simplified version).
-        
-        Args:
-            objects: List of JSON objects
-            field_name: Name of the field to analyze
+                # Check for binary
+                if string_mask & P_BINARY:
+                    binary_count += 1
             
-        Returns:
-            Basic string pattern insights
-        """
-        insights = {
-            'string_patterns': set(),
-            'string_length_distribution': []
-        }
-        
-        string_values = []
-        for obj in objects:
-            if field_name in obj and isinstance(obj[field_name], str):
-                string_values.append(obj[field_name])
-        
-        if not string_values:
-            return insights
+            elif value_type is dict or value_type is list:
+                depth += 1
+                if depth < max_depth:
+                    children = value.values() if value_type is dict else value
+                    for child in reversed(list(children)):
+                        push((child, depth))
         
-        # Analyze patterns
-        for value in string_values:
-            if self._is_email(value):
-                insights['string_patterns'].add('email')
-            elif self._is_url(value):
-                insights['string_patterns'].add('url')
-            elif self._is_date_time(value):
-                insights['string_patterns'].add('datetime')
-            elif self._is_uuid(value):
-                insights['string_patterns'].add('uuid')
-            elif self._is_likely_binary(value):
-                insights['string_patterns'].add('binary')
-            
-            # Track length distribution
-            insights['string_length_distribution'].append(len(value))
-        
-        return insights
+        insights['deep_nested_types'].update(_mask_to_names(types_mask, _TYPE_BIT_NAMES))
+        insights['deep_nested_patterns'].update(_mask_to_names(patterns_mask, _PATTERN_BIT_NAMES))
+        insights['deep_nested_binary_count'] += binary_count
     
-    def _analyze_deep_string_patterns(self, objects: List[Dict[str, Any]], field_name: str) -> Dict[str, Any]:
+    def _analyze_deep_string_patterns(self, objects: List[Dict[str, Any]], field_name: str, deep: bool = False) -> Dict[str, Any]:
         """
         Analyze string patterns more deeply.
         
         Args:
             objects: List of JSON objects
             field_name: Name of the field to analyze
+            deep: Also compute entropy scores and common prefixes/suffixes, which
+                need an extra scan of every string - no schema generator uses them
             
         Returns:
             Deep string pattern insights
         """
         insights = {
             'string_patterns': set(),
-            'string_length_distribution': [],
-            'string_entropy_scores': [],
-            'string_common_prefixes': set(),
-            'string_common_suffixes': set()
+            'string_length_distribution': array.array('I')
         }
+        if deep:
+            insights.update({
+                'string_entropy_scores': array.array('d'),
+                'string_common_prefixes': set(),
+                'string_common_suffixes': set()
+            })
         
-        string_values = []
-        for obj in objects:
-            if field_name in obj and isinstance(obj[field_name], str):
-                string_values.append(obj[field_name])
+        string_values = [value for value in self._field_values(objects, field_name) if isinstance(value, str)]
         
         if not string_values:
             return insights
         
-        # Analyze patterns
-        for value in string_values:
-            if self._is_email(value):
-                insights['string_patterns'].add('email')
-            elif self._is_url(value):
-                insights['string_patterns'].add('url')
-            elif self._is_date_time(value):
-                insights['string_patterns'].add('datetime')
-            elif self._is_uuid(value):
-                insights['string_patterns'].add('uuid')
-            elif self._is_likely_binary(value):
-                insights['string_patterns'].add('binary')
-            
-            # Track length distribution
-            insights['string_length_distribution'].append(len(value))
-            
-            # Calculate entropy (simplified)
-            unique_chars = len(set(value))
-            if len(value) > 0:
-                entropy = unique_chars / len(value)
-                insights['string_entropy_scores'].append(entropy)
-            
-            # Track common prefixes/suffixes (first/last 3 chars)
-            if len(value) >= 3:
-                insights['string_common_prefixes'].add(value[:3])
-                insights['string_common_suffixes'].add(value[-3:])
+        # Fill the per-string columns in bulk - lengths and entropy scores are
+        # stored as typed arrays, one entry per string value
+        lengths = array.array('I', map(len, string_values))
+        insights['string_length_distribution'] = lengths
         
-        return insights
-    
-    def _analyze_deep_array_contents(self, objects: List[Dict[str, Any]], field_name: str, max_depth: int) -> Dict[str, Any]:
-        """
-        Analyze array contents more deeply.
-        
-        Args:
-            objects: List of JSON objects
-            field_name: Name of the field to analyze
-            max_depth: Maximum depth to analyze
-            
-        Returns:
-            Deep array content insights
-        """
-        insights = {
-            'array_item_types': set(),
-            'array_item_patterns': set(),
-            'array_nested_complexity': 0,
-            'array_consistent_structure': True,
-            'array_max_nested_depth': 0
-        }
-        
-        array_structures = []
-        
-        for obj in objects:
-            if field_name in obj and isinstance(obj[field_name], list):
-                array = obj[field_name]
-                array_structures.append(len(array))
-                
-                for item in array:
-                    item_type = type(item).__name__
-                    insights['array_item_types'].add(item_type)
-                    
-                    # Analyze nested items
-                    if isinstance(item, (dict, list)):
-                        nested_insights = {'deep_nested_types': set(), 'deep_nested_patterns': set()}
-                        self._analyze_single_nested_value(item, nested_insights, 0, max_depth)
-                        insights['array_item_patterns'].update(nested_insights['deep_nested_patterns'])
-                        insights['array_max_nested_depth'] = max(insights['array_max_nested_depth'], 
-                                                               len(nested_insights['deep_nested_types']))
+        # Analyze patterns (once per distinct pattern mask)
+        for patterns_mask in set(map(self._classify_string, string_values)):
+            if patterns_mask:
+                insights['string_patterns'].add(_PATTERN_NAMES[patterns_mask & -patterns_mask])
         
-        # Check if arrays have consistent structure
-        if len(set(array_structures)) > 1:
-            insights['array_consistent_structure'] = False
+        if not deep:
+            return insights
         
-        insights['array_nested_complexity'] = len(insights['array_item_types']) + len(insights['array_item_patterns'])
+        # Calculate entropy (simplified)
+        insights['string_entropy_scores'] = array.array('d', [
+            len(set(value)) / length for value, length in zip(string_values, lengths) if length > 0
+        ])
+        
+        # Track common prefixes/suffixes (first/last 3 chars), keeping at
+        # most MAX_STRING_AFFIXES of each so high-cardinality fields stay bounded
+        prefixes = insights['string_common_prefixes']
+        suffixes = insights['string_common_suffixes']
+        for value, length in zip(string_values, lengths):
+            if length >= 3:
+                if len(prefixes) < MAX_STRING_AFFIXES:
+                    prefixes.add(value[:3])
+                if len(suffixes) < MAX_STRING_AFFIXES:
+                    suffixes.add(value[-3:])
         
         return insights
     
@@ -1948,16 +2799,14 @@ class SchemaGenerator:
             'mixed_nested_types': False
         }
         
-        for obj in objects:
-            if field_name in obj:
-                value = obj[field_name]
-                depth_info = self._analyze_structure_depth(value, 0)
-                nested_analysis['max_depth'] = max(nested_analysis['max_depth'], depth_info['depth'])
-                nested_analysis['nested_types'].update(depth_info['types'])
-                
-                # Check for binary at different depths
-                if depth_info['has_binary']:
-                    nested_analysis['has_binary_at_depth'][depth_info['depth']] = True
+        for value in self._field_values(objects, field_name):
+            depth_info = self._analyze_structure_depth(value, 0)
+            nested_analysis['max_depth'] = max(nested_analysis['max_depth'], depth_info['depth'])
+            nested_analysis['nested_types'].update(depth_info['types'])
+            
+            # Check for binary at different depths
+            if depth_info['has_binary']:
+                nested_analysis['has_binary_at_depth'][depth_info['depth']] = True
         
         nested_analysis['mixed_nested_types'] = len(nested_analysis['nested_types']) > 1
         return nested_analysis
@@ -1973,65 +2822,104 @@ class SchemaGenerator:
         Returns:
             Depth analysis information
         """
-        result = {
-            'depth': current_depth,
-            'types': {type(value).__name__},
-            'has_binary': False
-        }
-        
-        if isinstance(value, str):
-            if self._is_likely_binary(value):
-                result['has_binary'] = True
-        elif isinstance(value, dict):
-            for k, v in value.items():
-                nested_result = self._analyze_structure_depth(v, current_depth + 1)
-                result['depth'] = max(result['depth'], nested_result['depth'])
-                result['types'].update(nested_result['types'])
-                if nested_result['has_binary']:
-                    result['has_binary'] = True
-        elif isinstance(value, list):
-            for item in value:
-                nested_result = self._analyze_structure_depth(item, current_depth + 1)
-                result['depth'] = max(result['depth'], nested_result['depth'])
-                result['types'].update(nested_result['types'])
-                if nested_result['has_binary']:
-                    result['has_binary'] = True
+        max_depth = current_depth
+        types = set()
+        types_mask = 0
+        has_binary = False
+        
+        # Walk with an explicit stack so deep documents can't hit the recursion limit
+        stack = [(value, current_depth)]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            value, depth = pop()
+            if depth > max_depth:
+                max_depth = depth
+            value_type = type(value)
+            type_bit = _TYPE_BITS.get(value_type)
+            if type_bit is None:
+                types.add(_TYPE_NAMES[value_type])
+            else:
+                types_mask |= type_bit
+            
+            if value_type is str:
+                if not has_binary and len(value) >= MIN_BINARY_LENGTH and self._is_binary_string(value):
+                    has_binary = True
+            elif value_type is dict:
+                extend((item, depth + 1) for item in value.values())
+            elif value_type is list:
+                extend((item, depth + 1) for item in value)
         
-        return result
+        types.update(_mask_to_names(types_mask, _TYPE_BIT_NAMES))
+        return {
+            'depth': max_depth,
+            'types': types,
+            'has_binary': has_binary
+        }
     
-    def _has_nested_binary(self, objects: List[Dict[str, Any]], field_name: str) -> bool:
+    def _has_nested_binary(self, objects: List[Dict[str, Any]], field_name: str, max_depth: Optional[int] = None) -> bool:
         """
         Check if a field contains nested binary data.
         
         Args:
             objects: List of JSON objects
             field_name: Name of the field to check
+            max_depth: Maximum depth to search (the field value is depth 0), or None for no limit
             
         Returns:
             True if nested binary data is found
         """
-        for obj in objects:
-            if field_name in obj:
-                if self._contains_binary_recursive(obj[field_name]):
-                    return True
-        return False
+        values = self._field_values(objects, field_name)
+        if max_depth is None:
+            # Walk every occurrence of the field in one traversal
+            return self._contains_binary_recursive(values)
+        return any(self._contains_binary_recursive(value, max_depth) for value in values)
     
-    def _contains_binary_recursive(self, value: Any) -> bool:
+    def _contains_binary_recursive(self, value: Any, max_depth: Optional[int] = None) -> bool:
         """
-        Recursively check if a value contains binary data.
+        Check if a value or anything nested in it contains binary data.
+        
+        Uses an explicit stack rather than recursion and stops at the first
+        binary string found.
         
         Args:
             value: Value to check
+            max_depth: Maximum depth to search (value is depth 0), or None for no limit
             
         Returns:
             True if binary data is found
         """
-        if isinstance(value, str):
-            return self._is_likely_binary(value)
-        elif isinstance(value, dict):
-            return any(self._contains_binary_recursive(v) for v in value.values())
-        elif isinstance(value, list):
-            return any(self._contains_binary_recursive(item) for item in value)
+        is_binary_string = self._is_binary_string
+        if max_depth is None:
+            stack = [value]
+            pop = stack.pop
+            extend = stack.extend
+            while stack:
+                value = pop()
+                value_type = type(value)
+                if value_type is str:
+                    if len(value) >= MIN_BINARY_LENGTH and is_binary_string(value):
+                        return True
+                elif value_type is dict:
+                    extend(value.values())
+                elif value_type is list:
+                    extend(value)
+            return False
+        
+        stack = [(value, 0)] if max_depth > 0 else []
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            value, depth = pop()
+            value_type = type(value)
+            if value_type is str:
+                if len(value) >= MIN_BINARY_LENGTH and is_binary_string(value):
+                    return True
+            elif value_type is dict or value_type is list:
+                depth += 1
+                if depth < max_depth:
+                    children = value.values() if value_type is dict else value
+                    extend((child, depth) for child in children)
         return False
     
     def _generate_smart_property_schema(self, field_name: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
@@ -2050,7 +2938,7 @@ class SchemaGenerator:
             return self._generate_smart_binary_schema(field_name, analysis)
         
         # Handle mixed types with intelligence
-        if analysis.get('is_mixed', False) or len(analysis['types']) > 1:
+        if analysis.get('is_mixed', False) or _has_multiple_types(analysis):
             return self._generate_smart_mixed_schema(field_name, analysis)
         
         # Handle single types with enhanced validation
@@ -2073,7 +2961,7 @@ class SchemaGenerator:
             "contentEncoding": "base64",
             "contentMediaType": "application/octet-stream",
             "minLength": 1,
-            "pattern": "^[A-Za-z0-9+/]*={0,2}$",
+            "pattern": BASE64_PATTERN,
             "description": f"Binary data for {field_name} (base64 encoded)",
             "examples": ["SGVsbG8gV29ybGQ="]
         }
@@ -2089,22 +2977,23 @@ class SchemaGenerator:
         Returns:
             Smart mixed type schema
         """
+        types_mask = _analysis_types_mask(analysis)
         type_options = []
         
         # Add detected types with enhanced validation
-        if 'str' in analysis['types']:
+        if types_mask & T_STR:
             str_schema = {"type": "string", "minLength": 1}
             
             # Add max length constraint for strings (simplified)
             max_length = analysis.get('max_length')
             if max_length is not None and max_length > 0:
                 # Use reasonable maximum based on pattern
-                patterns = analysis.get('patterns', set())
-                if 'uuid' in patterns:
+                patterns_mask = _analysis_patterns_mask(analysis)
+                if patterns_mask & P_UUID:
                     str_schema["maxLength"] = max_length
-                elif 'email' in patterns:
+                elif patterns_mask & P_EMAIL:
                     str_schema["maxLength"] = min(max_length * 2, 254)
-                elif 'url' in patterns:
+                elif patterns_mask & P_URL:
                     str_schema["maxLength"] = min(max_length * 3, 2048)
                 else:
                     str_schema["maxLength"] = min(max_length * 2, 1000)
@@ -2112,33 +3001,21 @@ class SchemaGenerator:
             if analysis.get('is_binary', False):
                 str_schema.update({
                     "contentEncoding": "base64",
-                    "pattern": "^[A-Za-z0-9+/]*={0,2}$"
+                    "pattern": BASE64_PATTERN
                 })
             type_options.append(str_schema)
         
-        if 'int' in analysis['types']:
-            type_options.append({"type": "integer"})
-        if 'float' in analysis['types']:
-            type_options.append({"type": "number"})
-        if 'bool' in analysis['types']:
-            type_options.append({"type": "boolean"})
-        if 'list' in analysis['types']:
-            type_options.append({
-                "type": "array",
-                "items": {},
-                "minItems": 0
-            })
-        if 'dict' in analysis['types']:
+        # The remaining options don't depend on the field, so the shared templates are used
+        type_options.extend(option for bit, option in SMART_MIXED_TYPE_OPTIONS if types_mask & bit)
+        if types_mask & T_DICT:
             # For dict types, analyze if they need additionalProperties
-            needs_additional = self._analyze_dict_type_additional_properties_needed(analysis)
-            schema = {"type": "object"}
-            if needs_additional:
-                schema["additionalProperties"] = True
-                schema["description"] = "⚠️ WARNING: Object allows additional properties due to mixed content. Consider defining explicit field schemas."
-            type_options.append(schema)
+            if self._analyze_dict_type_additional_properties_needed(analysis):
+                type_options.append(FLEXIBLE_OPEN_OBJECT_SCHEMA)
+            else:
+                type_options.append(FLEXIBLE_OBJECT_SCHEMA)
         
         # Always allow null for flexibility
-        type_options.append({"type": "null"})
+        type_options.append(NULL_SCHEMA)
         
         return {
             "oneOf": type_options,
@@ -2208,15 +3085,25 @@ class SchemaGenerator:
         Returns:
             Enhanced single type schema
         """
-        schema = self._generate_property_schema(field_name, analysis)
+        types_mask = _analysis_types_mask(analysis)
+        if types_mask == T_STR:
+            schema = self._generate_string_schema(analysis)
+        elif types_mask == T_LIST:
+            schema = self._generate_array_schema(analysis)
+        elif types_mask & T_OTHER:
+            # Non-JSON types fall back to a string schema
+            schema = self._generate_property_schema(field_name, analysis)
+        else:
+            # Numbers, booleans, objects and null get no enhancements
+            return self._generate_property_schema(field_name, analysis)
         
-        # Add enhanced validation
+        # Add enhanced validation (nullable schemas are left as generated)
         if schema.get("type") == "string":
             schema["minLength"] = 1
             if analysis.get('is_binary', False):
                 schema.update({
                     "contentEncoding": "base64",
-                    "pattern": "^[A-Za-z0-9+/]*={0,2}$"
+                    "pattern": BASE64_PATTERN
                 })
         elif schema.get("type") == "array":
             schema["minItems"] = 0
@@ -2245,74 +3132,116 @@ class SchemaGenerator:
             'optional_fields_at_depth': {}
         }
         
-        for obj in objects:
-            if field_name in obj:
-                value = obj[field_name]
-                if isinstance(value, dict):
-                    self._analyze_dict_structure_recursive(value, nested_analysis, 0, max_depth, [field_name])
+        roots = [value for value in self._field_values(objects, field_name) if type(value) is dict]
+        if roots:
+            self._analyze_dict_structure_recursive(roots, nested_analysis, max_depth, field_name)
         
         return nested_analysis
     
-    def _analyze_dict_structure_recursive(self, data: Dict[str, Any], analysis: Dict[str, Any], 
-                                        current_depth: int, max_depth: int, path: List[str]) -> None:
+    def _analyze_dict_structure_recursive(self, roots: List[Dict[str, Any]], analysis: Dict[str, Any],
+                                        max_depth: int, path: str) -> None:
         """
-        Recursively analyze dictionary structure to build complete hierarchy.
+        Analyze dictionary structures to build the complete hierarchy.
+        
+        Walks the dictionaries with an explicit stack instead of recursing, so
+        deeply nested documents can't hit the recursion limit.
         
         Args:
-            data: Dictionary to analyze
+            roots: Dictionaries to analyze (depth 0)
             analysis: Analysis dictionary to update
-            current_depth: Current depth in the structure
             max_depth: Maximum depth to analyze
-            path: Current path in the structure
+            path: Dotted path of the root dictionaries in the structure
         """
-        if current_depth >= max_depth:
+        if max_depth <= 0:
             return
-            
-        analysis['max_depth_found'] = max(analysis['max_depth_found'], current_depth)
-        
-        # Record the current path
-        path_str = '.'.join(path)
-        analysis['all_possible_paths'].add(path_str)
-        
-        # Initialize depth-specific analysis if not exists
-        if current_depth not in analysis['structure_hierarchy']:
-            analysis['structure_hierarchy'][current_depth] = {
-                'fields': set(),
-                'types': set(),
-                'required_fields': set(),
-                'optional_fields': set()
-            }
         
-        # Analyze current level
-        for key, value in data.items():
-            analysis['structure_hierarchy'][current_depth]['fields'].add(key)
-            
-            # Analyze value type
-            value_type = type(value).__name__
-            analysis['structure_hierarchy'][current_depth]['types'].add(value_type)
-            
-            # Check for binary data
-            if isinstance(value, str) and self._is_likely_binary(value):
-                if current_depth not in analysis['has_binary_at_depth']:
-                    analysis['has_binary_at_depth'][current_depth] = set()
-                analysis['has_binary_at_depth'][current_depth].add(key)
+        hierarchy = analysis['structure_hierarchy']
+        add_path = analysis['all_possible_paths'].add
+        # Child path strings keyed by (parent path, key, is list item). Each
+        # distinct path is built once and the same string object (with its
+        # cached hash) is reused for every dict found at that path.
+        child_paths = {}
+        # Value types seen per depth as a bitmask, expanded to names at the end
+        types_masks = {}
+        type_bits = _TYPE_BITS
+        binary_at_depth = analysis['has_binary_at_depth']
+        max_depth_found = analysis['max_depth_found']
+        is_binary_string = self._is_binary_string
+        
+        stack = [(data, 0, path) for data in roots]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            data, depth, path = pop()
+            if depth > max_depth_found:
+                max_depth_found = depth
+            
+            # Record the current path
+            add_path(path)
+            
+            # Initialize depth-specific analysis if not exists
+            level = hierarchy.get(depth)
+            if level is None:
+                level = hierarchy[depth] = {
+                    'fields': set(),
+                    'types': set(),
+                    'required_fields': set(),
+                    'optional_fields': set()
+                }
+            add_field = level['fields'].add
+            types_mask = 0
+            add_required = level['required_fields'].add
+            add_optional = level['optional_fields'].add
             
-            # Track required vs optional fields
-            if value is not None:
-                analysis['structure_hierarchy'][current_depth]['required_fields'].add(key)
-            else:
-                analysis['structure_hierarchy'][current_depth]['optional_fields'].add(key)
+            child_depth = depth + 1
+            descend = child_depth < max_depth
             
-            # Recursively analyze nested structures
-            if isinstance(value, dict):
-                new_path = path + [key]
-                self._analyze_dict_structure_recursive(value, analysis, current_depth + 1, max_depth, new_path)
-            elif isinstance(value, list):
-                # Analyze list items if they contain dictionaries
-                for item in value:
-                    if isinstance(item, dict):
-                        new_path = path + [key, '[]']
-                        self._analyze_dict_structure_recursive(item, analysis, current_depth + 1, max_depth, new_path)
+            # Analyze current level
+            for key, value in data.items():
+                add_field(key)
+                
+                # Analyze value type
+                value_type = type(value)
+                type_bit = type_bits.get(value_type)
+                if type_bit is None:
+                    level['types'].add(_TYPE_NAMES[value_type])
+                else:
+                    types_mask |= type_bit
+                
+                # Check for binary data
+                if value_type is str and len(value) >= MIN_BINARY_LENGTH and is_binary_string(value):
+                    binary_at_depth.setdefault(depth, set()).add(key)
+                
+                # Track required vs optional fields
+                if value is not None:
+                    add_required(key)
+                else:
+                    add_optional(key)
+                
+                # Queue nested structures
+                if not descend:
+                    continue
+                if value_type is dict:
+                    child_path = child_paths.get((path, key, False))
+                    if child_path is None:
+                        child_path = child_paths[(path, key, False)] = path + '.' + key
+                    push((value, child_depth, child_path))
+                elif value_type is list:
+                    # Analyze list items if they contain dictionaries
+                    item_path = None
+                    for item in value:
+                        if type(item) is dict:
+                            if item_path is None:
+                                item_path = child_paths.get((path, key, True))
+                                if item_path is None:
+                                    item_path = child_paths[(path, key, True)] = path + '.' + key + '.[]'
+                            push((item, child_depth, item_path))
+            
+            types_masks[depth] = types_masks.get(depth, 0) | types_mask
+        
+        for depth, types_mask in types_masks.items():
+            hierarchy[depth]['types'].update(_mask_to_names(types_mask, _TYPE_BIT_NAMES))
+        analysis['max_depth_found'] = max_depth_found
     
     def _generate_recursive_nested_schema(self, field_name: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -2378,45 +3307,34 @@ class SchemaGenerator:
         Returns:
             Base object schema
         """
+        fields = level_analysis.get('fields', set())
+        required_fields = level_analysis.get('required_fields', set())
+        
+        # For now, allow any type for nested fields - every field shares the
+        # same read-only permissive schema
+        # This could be enhanced to analyze the actual types found
         schema = {
             "type": "object",
-            "properties": {},
+            "properties": dict.fromkeys(fields, PERMISSIVE_PROPERTY_SCHEMA),
             "additionalProperties": True  # Allow additional properties for flexibility
         }
         
-        fields = level_analysis.get('fields', set())
-        required_fields = level_analysis.get('required_fields', set())
-        optional_fields = level_analysis.get('optional_fields', set())
-        
-        # Generate property schemas for each field
-        for field in fields:
-            # For now, allow any type for nested fields
-            # This could be enhanced to analyze the actual types found
-            schema["properties"][field] = {
-                "oneOf": [
-                    {"type": "string"},
-                    {"type": "number"},
-                    {"type": "integer"},
-                    {"type": "boolean"},
-                    {"type": "object", "additionalProperties": True},
-                    {"type": "array", "items": {}},
-                    {"type": "null"}
-                ]
-            }
-        
         # Add required fields if any
         if required_fields:
             schema["required"] = list(required_fields)
         
         return schema
     
-    def analyze_objects_with_depth(self, objects: List[Dict[str, Any]], max_depth: int = 200) -> Dict[str, Any]:
+    def analyze_objects_with_depth(self, objects: List[Dict[str, Any]], max_depth: int = 200,
+                                   workers: int = 1) -> Dict[str, Any]:
         """
         Analyze objects to understand their structure without generating a schema.
         
         Args:
             objects: List of JSON objects to analyze
             max_depth: Maximum depth to analyze for nested structures (default: 100)
+            workers: Number of worker processes for the per-field nested analysis
+                (default: 1, analyze in this process)
             
         Returns:
             Detailed analysis of object structure
@@ -2425,7 +3343,7 @@ class SchemaGenerator:
             raise ValueError("JSON objects list cannot be empty")
         
         # Get deep field analysis
-        field_analysis = self._analyze_fields_deep_with_depth(objects, max_depth)
+        field_analysis = self._cached_analyze_fields(objects, max_depth, workers)
         
         # Create comprehensive analysis result
         analysis = {
@@ -2444,7 +3362,7 @@ class SchemaGenerator:
         # Process each field
         for field_name, field_info in field_analysis.items():
             field_analysis_result = {
-                "types": list(field_info.get('types', set())),
+                "types": field_info.get('types', set()),
                 "is_required": field_info.get('required', False),
                 "null_percentage": field_info.get('null_percentage', 0),
                 "is_binary": field_info.get('is_binary', False),
@@ -2456,19 +3374,18 @@ class SchemaGenerator:
             if 'max_depth_found' in field_info:
                 field_analysis_result["nested_structure"] = {
                     "max_depth": field_info['max_depth_found'],
-                    "all_possible_paths": list(field_info.get('all_possible_paths', set())),
+                    "all_possible_paths": field_info.get('all_possible_paths', set()),
                     "structure_hierarchy": {}
                 }
                 
-                # Convert sets to lists for JSON serialization
                 if 'structure_hierarchy' in field_info:
                     hierarchy = field_info['structure_hierarchy']
                     for depth, level_info in hierarchy.items():
                         field_analysis_result["nested_structure"]["structure_hierarchy"][depth] = {
-                            "fields": list(level_info.get('fields', set())),
-                            "types": list(level_info.get('types', set())),
-                            "required_fields": list(level_info.get('required_fields', set())),
-                            "optional_fields": list(level_info.get('optional_fields', set()))
+                            "fields": level_info.get('fields', set()),
+                            "types": level_info.get('types', set()),
+                            "required_fields": level_info.get('required_fields', set()),
+                            "optional_fields": level_info.get('optional_fields', set())
                         }
                 
                 analysis["summary"]["max_nested_depth_found"] = max(
@@ -2486,7 +3403,8 @@ class SchemaGenerator:
             
             analysis["fields"][field_name] = field_analysis_result
         
-        return analysis
+        # Convert sets to sorted lists for JSON serialization in one pass
+        return _json_ready(analysis)
     
     # Backward compatibility methods
     def analyze_json_list(self, json_data: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -2500,3 +3418,254 @@ class SchemaGenerator:
             Generated JSON schema
         """
         return self._analyze_objects(json_data)
+
+
+def _merge_constraints(target: Dict[str, Any], source: Dict[str, Any]) -> None:
+    """Combine min/max length and value constraints from source into target."""
+    for key in ('min_length', 'min_value'):
+        if source[key] is not None and (target[key] is None or source[key] < target[key]):
+            target[key] = source[key]
+    for key in ('max_length', 'max_value'):
+        if source[key] is not None and (target[key] is None or source[key] > target[key]):
+            target[key] = source[key]
+
+
+def _merge_structure_info(target: Dict[str, Any], source: Dict[str, Any]) -> None:
+    """Combine nested object / array item structure statistics from source into target."""
+    target['fields'] |= source['fields']
+    for field_name, field_types in source['field_types'].items():
+        target['field_types'].setdefault(field_name, set()).update(field_types)
+    for field_name, field_patterns in source['field_patterns'].items():
+        target['field_patterns'].setdefault(field_name, set()).update(field_patterns)
+    for field_name, constraints in source['field_constraints'].items():
+        if field_name in target['field_constraints']:
+            _merge_constraints(target['field_constraints'][field_name], constraints)
+        else:
+            target['field_constraints'][field_name] = constraints
+
+
+def _split_file_by_lines(file_path: str, parts: int) -> List[tuple]:
+    """Split a file into at most `parts` (start, end) byte ranges ending on newlines."""
+    file_size = os.path.getsize(file_path)
+    boundaries = [0]
+    with open(file_path, 'rb') as f:
+        for i in range(1, parts):
+            f.seek(file_size * i // parts)
+            f.readline()  # Advance to the start of the next line
+            position = min(f.tell(), file_size)
+            if position > boundaries[-1]:
+                boundaries.append(position)
+    if boundaries[-1] < file_size:
+        boundaries.append(file_size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def _read_ndjson_chunk(generator: SchemaGenerator, file_path: str, start: int, end: int) -> List[Dict[str, Any]]:
+    """Parse the NDJSON objects in the byte range [start, end) of a file."""
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        content = f.read(end - start).decode('utf-8')
+    return generator.parse_ndjson(content)
+
+
+def _collect_ndjson_chunk_stats(file_path: str, start: int, end: int, binary_patterns: List[str]) -> tuple:
+    """Worker: collect raw field statistics for one byte range of an NDJSON file."""
+    generator = SchemaGenerator()
+    generator.binary_patterns = binary_patterns
+    objects = _read_ndjson_chunk(generator, file_path, start, end)
+    return generator._collect_field_stats(objects), len(objects)
+
+
+def _deep_field_insights_chunk(fields: List[tuple], max_depth: int, binary_patterns: List[str]) -> Dict[str, tuple]:
+    """Worker: run the deep analysis for a subset of fields, given their values."""
+    generator = SchemaGenerator()
+    generator.binary_patterns = binary_patterns
+    insights = {}
+    for field_name, values, analysis in fields:
+        objects = [{field_name: value} for value in values]
+        insights[field_name] = generator._deep_field_insights(objects, field_name, analysis, max_depth)
+    return insights
+
+
+def _validate_ndjson_chunk(file_path: str, start: int, end: int, schema: Dict[str, Any]) -> None:
+    """Worker: validate one byte range of an NDJSON file against a schema."""
+    generator = SchemaGenerator()
+    objects = _read_ndjson_chunk(generator, file_path, start, end)
+    generator._validate_schema(schema, objects)
+
+
+# Keywords that only annotate a schema and never affect validation
+_ANNOTATION_KEYWORDS = frozenset({
+    '$schema', '$comment', 'title', 'description', 'default', 'examples',
+    'format', 'contentEncoding', 'contentMediaType',
+})
+
+# Keywords the compiled validator implements
+_COMPILED_KEYWORDS = frozenset({
+    'type', 'properties', 'required', 'additionalProperties', 'items',
+    'minItems', 'maxItems', 'minLength', 'maxLength', 'minimum', 'maximum',
+    'pattern', 'oneOf', 'anyOf', 'allOf',
+}) | _ANNOTATION_KEYWORDS
+
+# Type tests matching jsonschema's default type checker
+_TYPE_TESTS = {
+    'string': 'isinstance(o, str)',
+    'integer': '(not isinstance(o, bool) and (isinstance(o, int) or (isinstance(o, float) and o.is_integer())))',
+    'number': '(not isinstance(o, bool) and isinstance(o, _Number))',
+    'boolean': 'isinstance(o, bool)',
+    'null': 'o is None',
+    'object': 'isinstance(o, dict)',
+    'array': 'isinstance(o, list)',
+}
+
+
+class _UnsupportedSchema(Exception):
+    """Raised when a schema uses keywords the compiled validator does not implement."""
+
+
+def compile_validator(schema: Dict[str, Any]) -> Optional[Callable[[Any], bool]]:
+    """
+    Compile a generated schema into a plain Python validation function.
+    
+    The schema is translated once into straight-line Python code with inlined
+    type, length, range and structure checks, which is much faster than
+    interpreting it with jsonschema for every document. Only the keywords the
+    generators emit are supported; format and content keywords are treated as
+    annotations, as jsonschema does by default.
+    
+    Args:
+        schema: JSON schema to compile
+        
+    Returns:
+        Function returning True if a document is valid, or None if the schema
+        uses keywords that are not supported
+    """
+    namespace = {'_Number': numbers.Number}
+    lines = []
+    try:
+        root = _emit_validator(schema, lines, namespace)
+    except _UnsupportedSchema:
+        return None
+    exec(compile('\n'.join(lines), '<compiled validator>', 'exec'), namespace)
+    return namespace[root]
+
+
+def _emit_validator(schema: Any, lines: List[str], namespace: Dict[str, Any]) -> str:
+    """Emit the source of a validation function for one (sub)schema and return its name."""
+    name = f'_v{len(namespace)}'
+    namespace[name] = None  # Reserve the name
+    
+    if schema is True or schema == {}:
+        lines += [f'def {name}(o):', '    return True', '']
+        return name
+    if schema is False:
+        lines += [f'def {name}(o):', '    return False', '']
+        return name
+    if not isinstance(schema, dict) or not _COMPILED_KEYWORDS.issuperset(schema):
+        raise _UnsupportedSchema()
+    if 'draft-03' in str(schema.get('$schema', '')) or 'draft-04' in str(schema.get('$schema', '')):
+        # Older drafts use different integer semantics
+        raise _UnsupportedSchema()
+    
+    def constant(value: Any) -> str:
+        constant_name = f'_c{len(namespace)}'
+        namespace[constant_name] = value
+        return constant_name
+    
+    body = []
+    
+    # Type
+    if 'type' in schema:
+        types = schema['type'] if isinstance(schema['type'], list) else [schema['type']]
+        if not all(t in _TYPE_TESTS for t in types):
+            raise _UnsupportedSchema()
+        body.append(f'    if not ({" or ".join(_TYPE_TESTS[t] for t in types)}):')
+        body.append('        return False')
+    
+    # String keywords
+    string_checks = []
+    if 'minLength' in schema:
+        string_checks.append(f'len(o) < {schema["minLength"]!r}')
+    if 'maxLength' in schema:
+        string_checks.append(f'len(o) > {schema["maxLength"]!r}')
+    if 'pattern' in schema:
+        pattern_check = _SCHEMA_PATTERN_CHECKS.get(schema["pattern"]) or re.compile(schema["pattern"]).search
+        string_checks.append(f'not {constant(pattern_check)}(o)')
+    if string_checks:
+        body.append('    if isinstance(o, str) and (' + ' or '.join(string_checks) + '):')
+        body.append('        return False')
+    
+    # Numeric keywords
+    numeric_checks = []
+    if 'minimum' in schema:
+        numeric_checks.append(f'o < {constant(schema["minimum"])}')
+    if 'maximum' in schema:
+        numeric_checks.append(f'o > {constant(schema["maximum"])}')
+    if numeric_checks:
+        body.append(f'    if {_TYPE_TESTS["number"]} and (' + ' or '.join(numeric_checks) + '):')
+        body.append('        return False')
+    
+    # Object keywords
+    object_checks = []
+    properties = schema.get('properties', {})
+    for property_name, property_schema in properties.items():
+        validator = _emit_validator(property_schema, lines, namespace)
+        object_checks.append(f'        if {property_name!r} in o and not {validator}(o[{property_name!r}]):')
+        object_checks.append('            return False')
+    if schema.get('required'):
+        object_checks.append(f'        if not {constant(frozenset(schema["required"]))} <= o.keys():')
+        object_checks.append('            return False')
+    additional = schema.get('additionalProperties', True)
+    if additional is not True and additional != {}:
+        known = constant(frozenset(properties))
+        if additional is False:
+            object_checks.append(f'        if not o.keys() <= {known}:')
+            object_checks.append('            return False')
+        else:
+            validator = _emit_validator(additional, lines, namespace)
+            object_checks.append('        for k, v in o.items():')
+            object_checks.append(f'            if k not in {known} and not {validator}(v):')
+            object_checks.append('                return False')
+    if object_checks:
+        body.append('    if isinstance(o, dict):')
+        body.extend(object_checks)
+    
+    # Array keywords
+    array_checks = []
+    if 'minItems' in schema:
+        array_checks.append(f'        if len(o) < {schema["minItems"]!r}:')
+        array_checks.append('            return False')
+    if 'maxItems' in schema:
+        array_checks.append(f'        if len(o) > {schema["maxItems"]!r}:')
+        array_checks.append('            return False')
+    items = schema.get('items', {})
+    if isinstance(items, list):
+        raise _UnsupportedSchema()
+    if items is not True and items != {}:
+        validator = _emit_validator(items, lines, namespace)
+        array_checks.append('        for x in o:')
+        array_checks.append(f'            if not {validator}(x):')
+        array_checks.append('                return False')
+    if array_checks:
+        body.append('    if isinstance(o, list):')
+        body.extend(array_checks)
+    
+    # Combinators
+    if 'allOf' in schema:
+        validators = [_emit_validator(sub, lines, namespace) for sub in schema['allOf']]
+        body.append('    if not (' + ' and '.join(f'{v}(o)' for v in validators) + '):')
+        body.append('        return False')
+    if 'anyOf' in schema:
+        validators = [_emit_validator(sub, lines, namespace) for sub in schema['anyOf']]
+        body.append('    if not (' + ' or '.join(f'{v}(o)' for v in validators) + '):')
+        body.append('        return False')
+    if 'oneOf' in schema:
+        validators = [_emit_validator(sub, lines, namespace) for sub in schema['oneOf']]
+        body.append('    if (' + ' + '.join(f'{v}(o)' for v in validators) + ') != 1:')
+        body.append('        return False')
+    
+    lines.append(f'def {name}(o):')
+    lines.extend(body)
+    lines.append('    return True')
+    lines.append('')
+    return name
@@ -1,5 +1,5 @@
-import json
 from schema_generator import SchemaGenerator
+from json_helpers import save_json
 
 def show_complete_schema():
     """Show the complete generated schema"""
@@ -8,16 +8,11 @@ def show_complete_schema():
     # Create schema generator
     generator = SchemaGenerator()
     
-    # Read the complex test data
-    with open('test_complex_data.ndjson', 'r', encoding='utf-8') as f:
-        ndjson_content = f.read()
-    
-    # Generate schema
-    schema = generator.analyze_ndjson(ndjson_content)
+    # Generate schema from the complex test data (parsed line by line)
+    schema = generator.analyze_ndjson_file('test_complex_data.ndjson')
     
     # Save schema to file for easy viewing
-    with open('generated_schema.json', 'w') as f:
-        json.dump(schema, f, indent=2)
+    save_json('generated_schema.json', schema)
     
     print("✅ Schema generated successfully!")
     print(f"📄 Complete schema saved to: generated_schema.json")
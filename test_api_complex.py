@@ -1,30 +1,50 @@
-import requests
-import json
+import os
+import sys
+import uuid
+from api_test_helpers import decode_json, open_session, post_body
+from json_helpers import save_json
 
-def test_api_with_complex_data():
+def iter_multipart_file(field_name, file_path, content_type, boundary, chunk_size=1 << 16):
+    """Yield a multipart/form-data body for a single file without reading it into memory"""
+    filename = os.path.basename(file_path)
+    yield (
+        f'--{boundary}\r\n'
+        f'Content-Disposition: form-data; name="{field_name}"; filename="{filename}"\r\n'
+        f'Content-Type: {content_type}\r\n\r\n'
+    ).encode('utf-8')
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            yield chunk
+    yield f'\r\n--{boundary}--\r\n'.encode('utf-8')
+
+def test_api_with_complex_data(live=False):
     """Test the API with complex NDJSON data"""
     print("Testing API with complex NDJSON data...")
     
     # API endpoint
     url = "http://localhost:9000/api/v1/schemas/smart"
     
-    # Read the complex test data
-    with open('test_complex_data.ndjson', 'rb') as f:
-        files = {'file': ('test_complex_data.ndjson', f, 'application/json')}
-        
-        print("Sending request to API...")
-        response = requests.post(url, files=files)
+    # Stream the complex test data instead of buffering the whole upload
+    boundary = uuid.uuid4().hex
+    body = iter_multipart_file('file', 'test_complex_data.ndjson', 'application/json', boundary)
+    
+    print("Sending request to API...")
+    session = open_session(live)
+    session.headers['Content-Type'] = f'multipart/form-data; boundary={boundary}'
+    try:
+        response = post_body(session, url, body)
+    finally:
+        session.close()
     
     if response.status_code == 200:
-        result = response.json()
+        result = decode_json(response)
         schema = result.get('schema', {})
         
         print("✅ API call successful!")
         print(f"📄 Schema received with {len(schema.get('properties', {}))} properties")
         
-        # Save the schema to file
-        with open('api_generated_schema.json', 'w') as f:
-            json.dump(schema, f, indent=2)
+        # Save the schema to file, reusing the encoded schema for the preview
+        schema_str = save_json('api_generated_schema.json', schema).decode('utf-8')
         
         print("📄 Schema saved to: api_generated_schema.json")
         
@@ -60,7 +80,6 @@ def test_api_with_complex_data():
         
         # Show the first few lines of the schema
         print(f"\n📋 Schema Preview (first 10 lines):")
-        schema_str = json.dumps(schema, indent=2)
         lines = schema_str.split('\n')[:10]
         for line in lines:
             print(f"   {line}")
@@ -72,4 +91,5 @@ def test_api_with_complex_data():
         print(f"Error: {response.text}")
 
 if __name__ == "__main__":
-    test_api_with_complex_data()
+    # Pass --live to test against a running server instead of the in-process app
+    test_api_with_complex_data(live='--live' in sys.argv)
@@ -1,9 +1,38 @@
+import sys
 import requests
-import json
-import tempfile
-import os
+from api_test_helpers import decode_json, open_session, post_concurrently
+from json_helpers import encode_ndjson
 
-def test_api_fixed():
+# Test data with varying lengths
+TEST_DATA = [
+    {
+        "id": 999,
+        "name": "VeryLongNameThatExceedsOriginalLength",
+        "email": "very.long.email.address@very.long.domain.com",
+        "age": 99,
+        "active": True,
+        "binary_data": "VGhpcyBpcyBhIHZlcnkgbG9uZyBiaW5hcnkgZGF0YSBzdHJpbmcgdGhhdCBleGNlZWRzIHRoZSBvcmlnaW5hbCBsZW5ndGg=",
+        "nested": {"username": "verylongusername", "preferences": {"theme": "dark", "notifications": True}},
+        "tags": ["user", "premium", "very_long_tag"],
+        "metadata": {"created_at": "2024-01-15T10:30:00Z", "last_login": "2024-01-20T14:22:15Z"}
+    },
+    {
+        "id": 1,
+        "name": "A",  # Very short name
+        "email": "a@b.c",  # Very short email
+        "age": 1,
+        "active": False,
+        "binary_data": "SGVsbG8=",  # Very short binary
+        "nested": {"username": "a", "preferences": {"theme": "light", "notifications": False}},
+        "tags": [],  # Empty array
+        "metadata": {"created_at": "2024-01-01T00:00:00Z", "last_login": "2024-01-01T00:00:00Z"}
+    }
+]
+
+# Encode the NDJSON payload once, at import time, and reuse it for every request
+NDJSON_DATA = encode_ndjson(TEST_DATA)
+
+def test_api_fixed(live=False):
     """Test the fixed API with flexible schema generation"""
     print("Testing fixed API with flexible schema generation:")
     print("=" * 60)
@@ -11,48 +40,23 @@ def test_api_fixed():
     # API base URL
     base_url = "http://localhost:9000"
     
-    # Test data with varying lengths
-    test_data = [
-        {
-            "id": 999,
-            "name": "VeryLongNameThatExceedsOriginalLength",
-            "email": "very.long.email.address@very.long.domain.com",
-            "age": 99,
-            "active": True,
-            "binary_data": "VGhpcyBpcyBhIHZlcnkgbG9uZyBiaW5hcnkgZGF0YSBzdHJpbmcgdGhhdCBleGNlZWRzIHRoZSBvcmlnaW5hbCBsZW5ndGg=",
-            "nested": {"username": "verylongusername", "preferences": {"theme": "dark", "notifications": True}},
-            "tags": ["user", "premium", "very_long_tag"],
-            "metadata": {"created_at": "2024-01-15T10:30:00Z", "last_login": "2024-01-20T14:22:15Z"}
-        },
-        {
-            "id": 1,
-            "name": "A",  # Very short name
-            "email": "a@b.c",  # Very short email
-            "age": 1,
-            "active": False,
-            "binary_data": "SGVsbG8=",  # Very short binary
-            "nested": {"username": "a", "preferences": {"theme": "light", "notifications": False}},
-            "tags": [],  # Empty array
-            "metadata": {"created_at": "2024-01-01T00:00:00Z", "last_login": "2024-01-01T00:00:00Z"}
-        }
-    ]
-    
-    # Create temporary NDJSON file
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.ndjson') as temp_file:
-        for obj in test_data:
-            temp_file.write(json.dumps(obj) + '\n')
-        temp_file_path = temp_file.name
+    # One session for all endpoints so the connection is kept alive
+    session = open_session(live)
     
     try:
+        # The endpoints are independent, so all requests are sent concurrently
+        endpoints = ["/api/v1/schemas/smart", "/api/v1/schemas/flexible", "/api/v1/analyze"]
+        
+        files = {'file': ('test_data.ndjson', NDJSON_DATA, 'application/json')}
+        responses = post_concurrently(session, base_url, endpoints, files=files)
+        
         # Test the smart schema endpoint
         print("Testing /api/v1/schemas/smart endpoint...")
-        with open(temp_file_path, 'rb') as f:
-            files = {'file': ('test_data.ndjson', f, 'application/json')}
-            response = requests.post(f"{base_url}/api/v1/schemas/smart", files=files)
+        response = responses["/api/v1/schemas/smart"]
         
         if response.status_code == 200:
             print("✅ Smart schema endpoint works!")
-            schema = response.json()['schema']
+            schema = decode_json(response)['schema']
             
             # Check if schema is flexible
             properties = schema.get("properties", {})
@@ -74,13 +78,11 @@ def test_api_fixed():
         
         # Test the flexible schema endpoint
         print("\nTesting /api/v1/schemas/flexible endpoint...")
-        with open(temp_file_path, 'rb') as f:
-            files = {'file': ('test_data.ndjson', f, 'application/json')}
-            response = requests.post(f"{base_url}/api/v1/schemas/flexible", files=files)
+        response = responses["/api/v1/schemas/flexible"]
         
         if response.status_code == 200:
             print("✅ Flexible schema endpoint works!")
-            schema = response.json()['schema']
+            schema = decode_json(response)['schema']
             
             # Check if schema is very flexible
             properties = schema.get("properties", {})
@@ -102,13 +104,11 @@ def test_api_fixed():
         
         # Test the analyze endpoint
         print("\nTesting /api/v1/analyze endpoint...")
-        with open(temp_file_path, 'rb') as f:
-            files = {'file': ('test_data.ndjson', f, 'application/json')}
-            response = requests.post(f"{base_url}/api/v1/analyze", files=files)
+        response = responses["/api/v1/analyze"]
         
         if response.status_code == 200:
             print("✅ Analyze endpoint works!")
-            analysis = response.json()['analysis']
+            analysis = decode_json(response)['analysis']
             print(f"Analysis summary: {analysis.get('summary', {})}")
         else:
             print(f"❌ Analyze endpoint failed: {response.status_code}")
@@ -120,8 +120,7 @@ def test_api_fixed():
     except Exception as e:
         print(f"❌ Test failed: {e}")
     finally:
-        # Clean up
-        os.unlink(temp_file_path)
+        session.close()
     
     print("\n" + "=" * 60)
     print("Test Summary:")
@@ -130,4 +129,5 @@ def test_api_fixed():
     print("If you see ✅ messages above, the fixes are working correctly!")
 
 if __name__ == "__main__":
-    test_api_fixed()
+    # Pass --live to test against a running server instead of the in-process app
+    test_api_fixed(live='--live' in sys.argv)
@@ -1,9 +1,38 @@
-import requests
-import json
-import tempfile
-import os
+import sys
+import uuid
+from api_test_helpers import decode_json, encode_multipart_file, open_session, post_concurrently
+from json_helpers import encode_ndjson
 
-def test_api_nested():
+# Length and range constraints reported for nested properties
+CONSTRAINT_KEYS = ('minLength', 'maxLength', 'minimum', 'maximum')
+
+def print_constraints(schema, indent):
+    """Print the length and range constraints a property schema sets"""
+    for key in CONSTRAINT_KEYS:
+        value = schema.get(key)
+        if value is not None:
+            print(f"{indent}{key}: {value}")
+
+# Test data with complex nested structures
+TEST_DATA = [
+    {"id": 1, "name": "Alice", "email": "alice@example.com"},
+    {"id": 2, "name": "Bob", "phones": ["+1-555-1234", "+1-555-5678"], "active": True},
+    {"id": 3, "profile": {"username": "charlie", "age": 29}, "tags": ["premium", "beta"]},
+    {"id": 4, "name": "Dana", "address": {"city": "Berlin", "zip": 10115}, "preferences": None},
+    {"id": 5, "meta": {"created_at": "2025-08-17T19:30:00Z"}, "score": 87.5},
+    {"id": "6a", "name": "Eve", "devices": [{"type": "mobile", "os": "Android"}, {"type": "laptop"}]},
+    {"id": 7, "misc": [1, "two", {"nested": True}], "active": "yes"},
+    {"id": 8, "binary_data": "SGVsbG8gV29ybGQ=", "extra": {"random": 42}},
+    {"id": 9, "profile": {"username": "frank"}, "tags": None, "preferences": {"theme": "dark"}},
+    {"id": 10, "log": [{"time": "10:00", "event": "login"}, {"time": "10:05", "event": "click", "x": 45, "y": 60}]}
+]
+
+# Encode the NDJSON payload and its multipart body once, at import time
+NDJSON_DATA = encode_ndjson(TEST_DATA)
+MULTIPART_BOUNDARY = uuid.uuid4().hex
+MULTIPART_BODY = encode_multipart_file('file', 'test_nested_data.ndjson', NDJSON_DATA, 'application/json', MULTIPART_BOUNDARY)
+
+def test_api_nested(live=False):
     """Test the API with enhanced nested analysis"""
     print("Testing API with enhanced nested analysis:")
     print("=" * 60)
@@ -11,35 +40,22 @@ def test_api_nested():
     # API base URL
     base_url = "http://localhost:9090"
     
-    # Test data with complex nested structures
-    test_data = [
-        {"id": 1, "name": "Alice", "email": "alice@example.com"},
-        {"id": 2, "name": "Bob", "phones": ["+1-555-1234", "+1-555-5678"], "active": True},
-        {"id": 3, "profile": {"username": "charlie", "age": 29}, "tags": ["premium", "beta"]},
-        {"id": 4, "name": "Dana", "address": {"city": "Berlin", "zip": 10115}, "preferences": None},
-        {"id": 5, "meta": {"created_at": "2025-08-17T19:30:00Z"}, "score": 87.5},
-        {"id": "6a", "name": "Eve", "devices": [{"type": "mobile", "os": "Android"}, {"type": "laptop"}]},
-        {"id": 7, "misc": [1, "two", {"nested": True}], "active": "yes"},
-        {"id": 8, "binary_data": "SGVsbG8gV29ybGQ=", "extra": {"random": 42}},
-        {"id": 9, "profile": {"username": "frank"}, "tags": None, "preferences": {"theme": "dark"}},
-        {"id": 10, "log": [{"time": "10:00", "event": "login"}, {"time": "10:05", "event": "click", "x": 45, "y": 60}]}
-    ]
-    
-    # Create temporary NDJSON file
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.ndjson') as temp_file:
-        for obj in test_data:
-            temp_file.write(json.dumps(obj) + '\n')
-        temp_file_path = temp_file.name
+    # One session for all endpoints so the connection is kept alive
+    session = open_session(live)
+    session.headers['Content-Type'] = f'multipart/form-data; boundary={MULTIPART_BOUNDARY}'
     
     try:
+        # The endpoints are independent, so all requests are sent concurrently
+        endpoints = ["/api/v1/schemas/smart", "/api/v1/analyze"]
+        
+        responses = post_concurrently(session, base_url, endpoints, body=MULTIPART_BODY)
+        
         # Test smart schema generation with nested analysis
         print("Testing smart schema generation with nested analysis...")
-        with open(temp_file_path, 'rb') as f:
-            files = {'file': ('test_nested_data.ndjson', f, 'application/json')}
-            response = requests.post(f"{base_url}/api/v1/schemas/smart", files=files)
+        response = responses["/api/v1/schemas/smart"]
         
         if response.status_code == 200:
-            schema = response.json()
+            schema = decode_json(response)
             print("✅ Smart schema generation successful!")
             print(f"Schema has {len(schema['schema']['properties'])} top-level properties")
             
@@ -59,14 +75,7 @@ def test_api_nested():
                     for nested_prop, nested_schema in prop_schema['properties'].items():
                         nested_type = nested_schema.get('type', 'unknown')
                         print(f"    {nested_prop}: {nested_type}")
-                        if 'minLength' in nested_schema:
-                            print(f"      minLength: {nested_schema['minLength']}")
-                        if 'maxLength' in nested_schema:
-                            print(f"      maxLength: {nested_schema['maxLength']}")
-                        if 'minimum' in nested_schema:
-                            print(f"      minimum: {nested_schema['minimum']}")
-                        if 'maximum' in nested_schema:
-                            print(f"      maximum: {nested_schema['maximum']}")
+                        print_constraints(nested_schema, '      ')
                 
                 # Check for arrays with nested objects
                 elif prop_schema.get('type') == 'array' and 'items' in prop_schema:
@@ -79,14 +88,7 @@ def test_api_nested():
                         for array_prop, array_prop_schema in items_schema['properties'].items():
                             array_prop_type = array_prop_schema.get('type', 'unknown')
                             print(f"    {array_prop}: {array_prop_type}")
-                            if 'minLength' in array_prop_schema:
-                                print(f"      minLength: {array_prop_schema['minLength']}")
-                            if 'maxLength' in array_prop_schema:
-                                print(f"      maxLength: {array_prop_schema['maxLength']}")
-                            if 'minimum' in array_prop_schema:
-                                print(f"      minimum: {array_prop_schema['minimum']}")
-                            if 'maximum' in array_prop_schema:
-                                print(f"      maximum: {array_prop_schema['maximum']}")
+                            print_constraints(array_prop_schema, '      ')
                     elif 'oneOf' in items_schema:
                         print(f"  Array items: Multiple object types ({len(items_schema['oneOf'])} variants)")
                         for i, variant in enumerate(items_schema['oneOf']):
@@ -101,12 +103,10 @@ def test_api_nested():
         
         # Test analysis endpoint
         print("Testing analysis endpoint...")
-        with open(temp_file_path, 'rb') as f:
-            files = {'file': ('test_nested_data.ndjson', f, 'application/json')}
-            response = requests.post(f"{base_url}/api/v1/analyze", files=files)
+        response = responses["/api/v1/analyze"]
         
         if response.status_code == 200:
-            analysis = response.json()
+            analysis = decode_json(response)
             print("✅ Analysis successful!")
             print(f"Analyzed {analysis['analysis']['total_objects']} objects")
             print(f"Found {analysis['analysis']['summary']['total_fields']} fields")
@@ -127,11 +127,11 @@ def test_api_nested():
             print(f"Error: {response.text}")
             
     finally:
-        # Clean up
-        os.unlink(temp_file_path)
+        session.close()
     
     print("=" * 60)
     print("Enhanced nested analysis API test completed!")
 
 if __name__ == "__main__":
-    test_api_nested()
+    # Pass --live to test against a running server instead of the in-process app
+    test_api_nested(live='--live' in sys.argv)
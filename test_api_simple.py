@@ -1,9 +1,31 @@
-import requests
-import json
-import tempfile
-import os
+import sys
+from api_test_helpers import decode_json, open_session, post_concurrently
+from json_helpers import encode_ndjson
 
-def test_api_simple():
+# Simple test data
+TEST_DATA = [
+    {
+        "id": 1,
+        "name": "John",
+        "email": "john@test.com",
+        "age": 25,
+        "active": True,
+        "tags": ["user", "admin"]
+    },
+    {
+        "id": 2,
+        "name": "Jane",
+        "email": "jane@test.com",
+        "age": 30,
+        "active": False,
+        "tags": ["user"]
+    }
+]
+
+# Encode the NDJSON payload once, at import time, and reuse it for every request
+NDJSON_DATA = encode_ndjson(TEST_DATA)
+
+def test_api_simple(live=False):
     """Test the fixed API with simple data"""
     print("Testing fixed API with simple data:")
     print("=" * 50)
@@ -11,41 +33,22 @@ def test_api_simple():
     # API base URL
     base_url = "http://localhost:9090"
     
-    # Simple test data
-    test_data = [
-        {
-            "id": 1,
-            "name": "John",
-            "email": "john@test.com",
-            "age": 25,
-            "active": True,
-            "tags": ["user", "admin"]
-        },
-        {
-            "id": 2,
-            "name": "Jane",
-            "email": "jane@test.com",
-            "age": 30,
-            "active": False,
-            "tags": ["user"]
-        }
-    ]
-    
-    # Create temporary NDJSON file
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.ndjson') as temp_file:
-        for obj in test_data:
-            temp_file.write(json.dumps(obj) + '\n')
-        temp_file_path = temp_file.name
+    # One session for all endpoints so the connection is kept alive
+    session = open_session(live)
     
     try:
+        # The endpoints are independent, so all requests are sent concurrently
+        endpoints = ["/api/v1/schemas/smart", "/api/v1/schemas/flexible", "/api/v1/analyze"]
+        
+        files = {'file': ('test_data.ndjson', NDJSON_DATA, 'application/json')}
+        responses = post_concurrently(session, base_url, endpoints, files=files)
+        
         # Test smart schema generation
         print("Testing smart schema generation...")
-        with open(temp_file_path, 'rb') as f:
-            files = {'file': ('test_data.ndjson', f, 'application/json')}
-            response = requests.post(f"{base_url}/api/v1/schemas/smart", files=files)
+        response = responses["/api/v1/schemas/smart"]
         
         if response.status_code == 200:
-            schema = response.json()
+            schema = decode_json(response)
             print("✅ Smart schema generation successful!")
             print(f"Schema has {len(schema['schema']['properties'])} properties")
             print("Properties:", list(schema['schema']['properties'].keys()))
@@ -55,12 +58,10 @@ def test_api_simple():
         
         # Test flexible schema generation
         print("\nTesting flexible schema generation...")
-        with open(temp_file_path, 'rb') as f:
-            files = {'file': ('test_data.ndjson', f, 'application/json')}
-            response = requests.post(f"{base_url}/api/v1/schemas/flexible", files=files)
+        response = responses["/api/v1/schemas/flexible"]
         
         if response.status_code == 200:
-            schema = response.json()
+            schema = decode_json(response)
             print("✅ Flexible schema generation successful!")
             print(f"Schema has {len(schema['schema']['properties'])} properties")
         else:
@@ -69,12 +70,10 @@ def test_api_simple():
         
         # Test analysis endpoint
         print("\nTesting analysis endpoint...")
-        with open(temp_file_path, 'rb') as f:
-            files = {'file': ('test_data.ndjson', f, 'application/json')}
-            response = requests.post(f"{base_url}/api/v1/analyze", files=files)
+        response = responses["/api/v1/analyze"]
         
         if response.status_code == 200:
-            analysis = response.json()
+            analysis = decode_json(response)
             print("✅ Analysis successful!")
             print(f"Analyzed {analysis['analysis']['total_objects']} objects")
             print(f"Found {analysis['analysis']['summary']['total_fields']} fields")
@@ -83,11 +82,11 @@ def test_api_simple():
             print(f"Error: {response.text}")
             
     finally:
-        # Clean up
-        os.unlink(temp_file_path)
+        session.close()
     
     print("\n" + "=" * 50)
     print("Test completed!")
 
 if __name__ == "__main__":
-    test_api_simple()
+    # Pass --live to test against a running server instead of the in-process app
+    test_api_simple(live='--live' in sys.argv)
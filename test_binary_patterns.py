@@ -0,0 +1,35 @@
+from schema_generator import SchemaGenerator
+
+def test_custom_binary_patterns():
+    """Test that binary_patterns changed on a generator apply from the next call"""
+    print("Testing custom binary patterns:")
+    print("=" * 60)
+
+    generator = SchemaGenerator()
+
+    # Long enough to be checked, but plain text for the built-in patterns
+    test_data = [
+        {"id": 1, "payload": "BIN:some plain words here"},
+        {"id": 2, "payload": "BIN:more plain words there"}
+    ]
+
+    analysis = generator.analyze_objects_with_depth(test_data)
+    assert not analysis['fields']['payload']['is_binary'], "plain text should not be binary by default"
+    print("✅ payload is not binary with the default patterns")
+
+    # The custom pattern allows spaces, which the built-in patterns never match
+    generator.binary_patterns.append(r'^BIN:[a-z ]+$')
+    analysis = generator.analyze_objects_with_depth(test_data)
+    assert analysis['fields']['payload']['is_binary'], "the added pattern should mark payload as binary"
+    schema = generator.generate_smart_hardened_schema(test_data)
+    assert schema['properties']['payload'].get('contentEncoding') == "base64"
+    print("✅ payload is binary after adding ^BIN:[a-z ]+$")
+
+    # Removing the pattern again drops the cached verdicts
+    generator.binary_patterns.pop()
+    analysis = generator.analyze_objects_with_depth(test_data)
+    assert not analysis['fields']['payload']['is_binary'], "payload should no longer be binary"
+    print("✅ payload is not binary after removing the pattern")
+
+if __name__ == "__main__":
+    test_custom_binary_patterns()
@@ -0,0 +1,69 @@
+import json
+from jsonschema.validators import validator_for
+from schema_generator import SchemaGenerator, compile_validator
+
+def test_compiled_validator():
+    """Test that the compiled validator agrees with jsonschema on generated schemas"""
+    print("Testing compiled validator against jsonschema:")
+    print("=" * 60)
+
+    generator = SchemaGenerator()
+
+    test_data = [
+        {
+            "id": 1,
+            "name": "Alice",
+            "email": "alice@example.com",
+            "score": 87.5,
+            "tags": ["admin", "user"],
+            "profile": {"age": 25, "city": "Paris"},
+            "log": [{"time": "10:00", "event": "login"}],
+            "note": None
+        },
+        {
+            "id": 2,
+            "name": "Bob",
+            "email": "bob@example.com",
+            "score": 92.0,
+            "tags": [],
+            "profile": {"age": 30, "city": "Berlin"},
+            "log": [{"time": "11:00", "event": "logout"}],
+            "note": "VGhpcyBpcyBzb21lIGJhc2U2NCBlbmNvZGVkIGRhdGE="
+        }
+    ]
+
+    # Documents that break the schema in different ways
+    invalid_data = [
+        {"id": "1", "name": "Alice", "email": "alice@example.com", "score": 87.5, "tags": [], "profile": {"age": 25, "city": "Paris"}, "log": []},
+        {"id": 1, "name": "", "email": "alice@example.com", "score": 87.5, "tags": [], "profile": {"age": 25, "city": "Paris"}, "log": []},
+        {"id": 1, "name": "Alice", "email": "alice@example.com", "score": 1e9, "tags": [], "profile": {"age": 25, "city": "Paris"}, "log": []},
+        {"id": 1, "name": "Alice", "email": "alice@example.com", "score": 87.5, "tags": [1], "profile": {"age": 25, "city": "Paris"}, "log": []},
+        {"id": 1, "name": "Alice", "email": "alice@example.com", "score": 87.5, "tags": [], "profile": {"age": "old", "city": "Paris"}, "log": []},
+        {"name": "Alice"},
+        [1, 2, 3]
+    ]
+
+    schemas = {
+        "smart": generator._analyze_objects(test_data),
+        "hardened": generator.generate_hardened_binary_schema(test_data),
+        "smart_hardened": generator.generate_smart_hardened_schema(test_data),
+        "flexible": generator.generate_flexible_schema(test_data)
+    }
+
+    for name, schema in schemas.items():
+        is_valid = compile_validator(schema)
+        assert is_valid is not None, f"{name} schema should be compilable"
+
+        validator = validator_for(schema)(schema)
+        for item in test_data + invalid_data:
+            expected = validator.is_valid(item)
+            assert is_valid(item) == expected, f"{name}: compiled validator disagrees on {json.dumps(item)}"
+
+        print(f"✅ {name}: compiled validator matches jsonschema on {len(test_data) + len(invalid_data)} documents")
+
+    # Unsupported keywords fall back to jsonschema
+    assert compile_validator({"type": "string", "enum": ["a", "b"]}) is None
+    print("✅ Schemas with unsupported keywords are not compiled")
+
+if __name__ == "__main__":
+    test_compiled_validator()
@@ -1,7 +1,7 @@
-import requests
-import json
+import sys
+from api_test_helpers import decode_json, open_session
 
-def test_complex_data():
+def test_complex_data(live=False):
     """Test the fixed API with complex data"""
     print("Testing fixed API with complex data:")
     print("=" * 50)
@@ -9,16 +9,22 @@ def test_complex_data():
     # API base URL
     base_url = "http://localhost:9090"
     
+    # One session for both endpoints
+    session = open_session(live)
+    
     # Test with the complex data file
     try:
+        # Read the file once and upload the same bytes to both endpoints
+        with open('test_complex_data.ndjson', 'rb') as f:
+            ndjson_data = f.read()
+        files = {'file': ('test_complex_data.ndjson', ndjson_data, 'application/json')}
+        
         # Test smart schema generation with complex data
         print("Testing smart schema generation with complex data...")
-        with open('test_complex_data.ndjson', 'rb') as f:
-            files = {'file': ('test_complex_data.ndjson', f, 'application/json')}
-            response = requests.post(f"{base_url}/api/v1/schemas/smart", files=files)
+        response = session.post(f"{base_url}/api/v1/schemas/smart", files=files)
         
         if response.status_code == 200:
-            schema = response.json()
+            schema = decode_json(response)
             print("✅ Smart schema generation successful!")
             print(f"Schema has {len(schema['schema']['properties'])} properties")
             print("Properties:", list(schema['schema']['properties'].keys()))
@@ -33,12 +39,10 @@ def test_complex_data():
         
         # Test analysis with complex data
         print("\nTesting analysis with complex data...")
-        with open('test_complex_data.ndjson', 'rb') as f:
-            files = {'file': ('test_complex_data.ndjson', f, 'application/json')}
-            response = requests.post(f"{base_url}/api/v1/analyze", files=files)
+        response = session.post(f"{base_url}/api/v1/analyze", files=files)
         
         if response.status_code == 200:
-            analysis = response.json()
+            analysis = decode_json(response)
             print("✅ Analysis successful!")
             print(f"Analyzed {analysis['analysis']['total_objects']} objects")
             print(f"Found {analysis['analysis']['summary']['total_fields']} fields")
@@ -52,9 +56,12 @@ def test_complex_data():
         print("❌ test_complex_data.ndjson file not found")
     except Exception as e:
         print(f"❌ Error: {e}")
+    finally:
+        session.close()
     
     print("\n" + "=" * 50)
     print("Test completed!")
 
 if __name__ == "__main__":
-    test_complex_data()
+    # Pass --live to test against a running server instead of the in-process app
+    test_complex_data(live='--live' in sys.argv)
@@ -1,6 +1,61 @@
 import json
+from collections import Counter
 from schema_generator import SchemaGenerator
 
+# Generated schemas only ever contain exact dicts and lists
+CONTAINER_TYPES = (dict, list)
+
+def check_for_binary(schema_obj):
+    """Check for binary classifications in the schema, in document order"""
+    # Walk with an explicit stack - a None node marks a binary hit to report
+    stack = [(schema_obj, "")] if type(schema_obj) is dict else []
+    while stack:
+        node, path = stack.pop()
+        if node is None:
+            print(f"✅ Binary detected at: {path}")
+            continue
+        entries = []
+        for key, value in node.items():
+            current_path = f"{path}.{key}" if path else key
+            if key == "contentEncoding" and value == "base64":
+                entries.append((None, path))
+                continue
+            value_type = type(value)
+            if value_type is dict:
+                entries.append((value, current_path))
+            elif value_type is list:
+                for i, item in enumerate(value):
+                    if type(item) is dict:
+                        entries.append((item, f"{current_path}[{i}]"))
+        stack.extend(reversed(entries))
+
+def count_types(schema_obj):
+    """Count types and binary fields over the whole schema, in document order"""
+    type_counts = Counter()
+    binary_count = 0
+    stack = [schema_obj]
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is dict:
+            if node.get("contentEncoding") == "base64":
+                binary_count += 1
+            if "type" in node:
+                type_name = node["type"]
+                if type(type_name) is list:
+                    # Nullable types are listed as e.g. ["string", "null"]
+                    type_name = tuple(type_name)
+                type_counts[type_name] += 1
+            if "oneOf" in node:
+                type_counts["mixed"] += 1
+            children = node.values()
+        elif node_type is list:
+            children = node
+        else:
+            continue
+        stack.extend(reversed([child for child in children if type(child) in CONTAINER_TYPES]))
+    return type_counts, binary_count
+
 def test_complex_schema():
     """Test the schema generator with complex data including binary content"""
     print("Testing schema generator with complex NDJSON data:")
@@ -9,16 +64,20 @@ def test_complex_schema():
     # Create schema generator
     generator = SchemaGenerator()
     
-    # Read the complex test data
-    with open('test_complex_data.ndjson', 'r', encoding='utf-8') as f:
-        ndjson_content = f.read()
+    # Count the lines of the complex test data without decoding the file
+    file_path = 'test_complex_data.ndjson'
+    with open(file_path, 'rb') as f:
+        line_count = sum(1 for _ in f)
     
-    print(f"Loaded {len(ndjson_content.splitlines())} lines of NDJSON data")
+    print(f"Loaded {line_count} lines of NDJSON data")
     print()
     
+    # Parse once, line by line - the objects are reused for validation below
+    objects = generator.parse_ndjson_file(file_path)
+    
     # Generate schema
     print("Generating schema...")
-    schema = generator.analyze_ndjson(ndjson_content)
+    schema = generator.analyze_json_list(objects)
     
     # Print the schema in a readable format
     print("\nGenerated Schema:")
@@ -30,20 +89,6 @@ def test_complex_schema():
     print("Checking for binary classifications:")
     print("-" * 30)
     
-    def check_for_binary(schema_obj, path=""):
-        """Recursively check for binary classifications in the schema"""
-        if isinstance(schema_obj, dict):
-            for key, value in schema_obj.items():
-                current_path = f"{path}.{key}" if path else key
-                if key == "contentEncoding" and value == "base64":
-                    print(f"✅ Binary detected at: {path}")
-                elif isinstance(value, dict):
-                    check_for_binary(value, current_path)
-                elif isinstance(value, list):
-                    for i, item in enumerate(value):
-                        if isinstance(item, dict):
-                            check_for_binary(item, f"{current_path}[{i}]")
-    
     check_for_binary(schema)
     
     # Validate the schema against the original data
@@ -52,19 +97,19 @@ def test_complex_schema():
     print("-" * 30)
     
     try:
-        # Parse the NDJSON data
-        objects = generator.parse_ndjson(ndjson_content)
-        
         # Validate each object against the schema
-        import jsonschema
-        from jsonschema import validate
+        from jsonschema import Draft202012Validator
+        from jsonschema.exceptions import best_match
+        
+        # Check and build the validator once, not once per object
+        Draft202012Validator.check_schema(schema)
+        validator = Draft202012Validator(schema)
         
         validation_errors = []
         for i, obj in enumerate(objects, 1):
-            try:
-                validate(instance=obj, schema=schema)
-            except jsonschema.exceptions.ValidationError as e:
-                validation_errors.append(f"Object {i}: {e}")
+            error = best_match(validator.iter_errors(obj))
+            if error is not None:
+                validation_errors.append(f"Object {i}: {error}")
         
         if validation_errors:
             print("❌ Validation errors found:")
@@ -91,27 +136,7 @@ def test_complex_schema():
     print(f"Optional fields: {len(properties) - len(required_fields)}")
     
     # Count different types
-    type_counts = {}
-    binary_count = 0
-    
-    def count_types(schema_obj):
-        nonlocal binary_count
-        if isinstance(schema_obj, dict):
-            if "contentEncoding" in schema_obj and schema_obj["contentEncoding"] == "base64":
-                binary_count += 1
-            if "type" in schema_obj:
-                type_name = schema_obj["type"]
-                type_counts[type_name] = type_counts.get(type_name, 0) + 1
-            if "oneOf" in schema_obj:
-                type_counts["mixed"] = type_counts.get("mixed", 0) + 1
-            for value in schema_obj.values():
-                if isinstance(value, (dict, list)):
-                    count_types(value)
-        elif isinstance(schema_obj, list):
-            for item in schema_obj:
-                count_types(item)
-    
-    count_types(properties)
+    type_counts, binary_count = count_types(properties)
     
     print(f"Binary fields: {binary_count}")
     print("Type distribution:")
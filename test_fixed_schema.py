@@ -9,16 +9,17 @@ def test_fixed_schema():
     # Create schema generator
     generator = SchemaGenerator()
     
-    # Read the complex test data
-    with open('test_complex_data.ndjson', 'r', encoding='utf-8') as f:
-        ndjson_content = f.read()
+    # Count the lines of the complex test data without decoding the file
+    file_path = 'test_complex_data.ndjson'
+    with open(file_path, 'rb') as f:
+        line_count = sum(1 for _ in f)
     
-    print(f"Loaded {len(ndjson_content.splitlines())} lines of NDJSON data")
+    print(f"Loaded {line_count} lines of NDJSON data")
     print()
     
     # Generate schema using the smart hardened method
     print("Generating smart hardened schema...")
-    objects = generator.parse_ndjson(ndjson_content)
+    objects = generator.parse_ndjson_file(file_path)
     schema = generator.generate_smart_hardened_schema(objects)
     
     # Print the schema in a readable format
@@ -59,17 +60,21 @@ def test_fixed_schema():
     
     # Validate the test data against the generated schema
     try:
-        import jsonschema
-        from jsonschema import validate
+        from jsonschema import Draft202012Validator
+        from jsonschema.exceptions import best_match
+        
+        # Check and build the validator once, not once per object
+        Draft202012Validator.check_schema(schema)
+        validator = Draft202012Validator(schema)
         
         validation_errors = []
         for i, obj in enumerate(test_data, 1):
-            try:
-                validate(instance=obj, schema=schema)
+            error = best_match(validator.iter_errors(obj))
+            if error is None:
                 print(f"✅ Test object {i} validates successfully")
-            except jsonschema.exceptions.ValidationError as e:
-                validation_errors.append(f"Object {i}: {e}")
-                print(f"❌ Test object {i} failed validation: {e}")
+            else:
+                validation_errors.append(f"Object {i}: {error}")
+                print(f"❌ Test object {i} failed validation: {error}")
         
         if not validation_errors:
             print(f"\n🎉 All test objects validated successfully!")
@@ -0,0 +1,44 @@
+from jsonschema.validators import validator_for
+from schema_generator import SchemaGenerator, FORMAT_CHECKER
+
+def test_format_checker():
+    """Test that FORMAT_CHECKER asserts the format keywords of generated schemas"""
+    print("Testing the format checker on a generated schema:")
+    print("=" * 60)
+
+    generator = SchemaGenerator()
+
+    test_data = [
+        {"email": "alice@example.com", "site": "https://example.com/a", "uid": "123e4567-e89b-12d3-a456-426614174000", "at": "2024-01-20T14:22:15Z"},
+        {"email": "bob@test.org", "site": "http://test.org", "uid": "123E4567-E89B-12D3-A456-426614174001", "at": "2024-02-01"}
+    ]
+
+    schema = generator.generate_smart_hardened_schema(test_data)
+    formats = {name: prop.get("format") for name, prop in schema["properties"].items()}
+    assert formats == {"email": "email", "site": "uri", "uid": "uuid", "at": "date-time"}, formats
+
+    validator_class = validator_for(schema)
+    plain = validator_class(schema)
+    checked = validator_class(schema, format_checker=FORMAT_CHECKER)
+
+    # The data the schema was generated from passes either way
+    for item in test_data:
+        assert checked.is_valid(item), f"generated data should pass the format checks: {item}"
+    print("✅ Source data passes with format checking")
+
+    # Values of the right type and length but the wrong format are only
+    # rejected when the formats are asserted
+    invalid_formats = {
+        "email": "not an email",
+        "site": "ftp://example.com",
+        "uid": "123e4567-e89b-12d3-a456-4266141740zz",
+        "at": "next tuesday"
+    }
+    for field, value in invalid_formats.items():
+        item = dict(test_data[0], **{field: value})
+        assert plain.is_valid(item), f"{field}: format is only an annotation by default"
+        assert not checked.is_valid(item), f"{field}: FORMAT_CHECKER should reject {value!r}"
+        print(f"✅ {field}: {value!r} rejected only with FORMAT_CHECKER")
+
+if __name__ == "__main__":
+    test_format_checker()
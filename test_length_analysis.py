@@ -1,6 +1,9 @@
-import json
+import heapq
 from schema_generator import SchemaGenerator
 
+# Longest list of distinct lengths printed per field
+MAX_LISTED_LENGTHS = 50
+
 def analyze_length_patterns():
     """Analyze length patterns in the test data"""
     print("Analyzing length patterns in test data...")
@@ -8,36 +11,42 @@ def analyze_length_patterns():
     # Create schema generator
     generator = SchemaGenerator()
     
-    # Read the complex test data
-    with open('test_complex_data.ndjson', 'r', encoding='utf-8') as f:
-        ndjson_content = f.read()
-    
-    # Parse objects
-    objects = generator.parse_ndjson(ndjson_content)
-    
-    # Analyze each field's length patterns
+    # Stream the complex test data line by line, keeping running length
+    # stats ([min, max, distinct lengths]) per field in the same pass
+    objects = []
     field_lengths = {}
     
-    for obj in objects:
+    for obj in generator.stream_ndjson('test_complex_data.ndjson'):
+        objects.append(obj)
         for field_name, value in obj.items():
-            if isinstance(value, str):
-                if field_name not in field_lengths:
-                    field_lengths[field_name] = []
-                field_lengths[field_name].append(len(value))
+            if type(value) is str:
+                length = len(value)
+                stats = field_lengths.get(field_name)
+                if stats is None:
+                    field_lengths[field_name] = [length, length, {length}]
+                else:
+                    if length < stats[0]:
+                        stats[0] = length
+                    elif length > stats[1]:
+                        stats[1] = length
+                    stats[2].add(length)
     
     print("\n📊 Length Analysis by Field:")
     print("-" * 50)
     
-    for field_name, lengths in field_lengths.items():
-        min_len = min(lengths)
-        max_len = max(lengths)
-        unique_lengths = len(set(lengths))
+    for field_name, (min_len, max_len, lengths) in field_lengths.items():
+        unique_lengths = len(lengths)
         
         print(f"\n{field_name}:")
         print(f"  Min length: {min_len}")
         print(f"  Max length: {max_len}")
         print(f"  Unique lengths: {unique_lengths}")
-        print(f"  All lengths: {sorted(set(lengths))}")
+        if unique_lengths <= MAX_LISTED_LENGTHS:
+            print(f"  All lengths: {sorted(lengths)}")
+        else:
+            # Only sort as much as is shown
+            shortest = heapq.nsmallest(MAX_LISTED_LENGTHS, lengths)
+            print(f"  Shortest {MAX_LISTED_LENGTHS} lengths: {shortest} ...")
         
         if min_len == max_len:
             print(f"  ⚠️  WARNING: Min and max are the same!")
@@ -49,7 +58,8 @@ def analyze_length_patterns():
     print("Checking generated schema for min/max length issues:")
     print("-" * 50)
     
-    schema = generator.analyze_ndjson(ndjson_content)
+    # Reuse the objects parsed above rather than parsing the file again
+    schema = generator.analyze_json_list(objects)
     properties = schema.get("properties", {})
     
     problematic_fields = []
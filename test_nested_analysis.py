@@ -1,5 +1,15 @@
-import json
 from schema_generator import SchemaGenerator
+from json_helpers import dumps_indented
+
+# Length and range constraints reported for nested properties
+CONSTRAINT_KEYS = ('minLength', 'maxLength', 'minimum', 'maximum')
+
+def print_constraints(schema, indent):
+    """Print the length and range constraints a property schema sets"""
+    for key in CONSTRAINT_KEYS:
+        value = schema.get(key)
+        if value is not None:
+            print(f"{indent}{key}: {value}")
 
 def test_nested_analysis():
     """Test the enhanced nested analysis with complex data structures"""
@@ -35,7 +45,7 @@ def test_nested_analysis():
     
     # Show the generated schema
     print("Generated Schema:")
-    print(json.dumps(schema, indent=2))
+    print(dumps_indented(schema).decode('utf-8'))
     print()
     
     # Analyze specific nested structures
@@ -54,10 +64,10 @@ def test_nested_analysis():
                 print(f"  Items: Multiple object types ({len(items_schema['oneOf'])} variants)")
                 for i, variant in enumerate(items_schema['oneOf']):
                     if variant.get('type') == 'object' and 'properties' in variant:
-                        props = list(variant['properties'].keys())
+                        props = list(variant['properties'])
                         print(f"    Variant {i+1}: {props}")
             elif items_schema.get('type') == 'object' and 'properties' in items_schema:
-                props = list(items_schema['properties'].keys())
+                props = list(items_schema['properties'])
                 print(f"  Items: Object with properties: {props}")
         
         print()
@@ -69,21 +79,14 @@ def test_nested_analysis():
         print(f"  Type: {profile_schema.get('type', 'unknown')}")
         
         if profile_schema.get('type') == 'object' and 'properties' in profile_schema:
-            props = list(profile_schema['properties'].keys())
+            props = list(profile_schema['properties'])
             print(f"  Properties: {props}")
             
             # Show details for each property
             for prop_name, prop_schema in profile_schema['properties'].items():
                 prop_type = prop_schema.get('type', 'unknown')
                 print(f"    {prop_name}: {prop_type}")
-                if 'minLength' in prop_schema:
-                    print(f"      minLength: {prop_schema['minLength']}")
-                if 'maxLength' in prop_schema:
-                    print(f"      maxLength: {prop_schema['maxLength']}")
-                if 'minimum' in prop_schema:
-                    print(f"      minimum: {prop_schema['minimum']}")
-                if 'maximum' in prop_schema:
-                    print(f"      maximum: {prop_schema['maximum']}")
+                print_constraints(prop_schema, '      ')
         
         print()
     
@@ -96,7 +99,7 @@ def test_nested_analysis():
         if 'items' in devices_schema:
             items_schema = devices_schema['items']
             if items_schema.get('type') == 'object' and 'properties' in items_schema:
-                props = list(items_schema['properties'].keys())
+                props = list(items_schema['properties'])
                 print(f"  Items: Object with properties: {props}")
                 
                 # Show details for each property
@@ -115,25 +118,25 @@ def test_nested_analysis():
     
     for field_name, analysis in field_analysis.items():
         print(f"🔍 {field_name}:")
-        print(f"  Types: {list(analysis['types'])}")
+        print(f"  Types: {sorted(analysis['types'])}")
         print(f"  Required: {analysis.get('required', False)}")
         print(f"  Null percentage: {analysis.get('null_percentage', 0):.1%}")
         
         # Show nested structure info if available
         if 'nested_structure' in analysis:
             nested = analysis['nested_structure']
-            print(f"  Nested fields: {list(nested['fields'])}")
+            print(f"  Nested fields: {sorted(nested['fields'])}")
             for field, types in nested['field_types'].items():
-                print(f"    {field}: {list(types)}")
+                print(f"    {field}: {sorted(types)}")
         
         # Show array structure info if available
         if 'array_structure' in analysis:
             array_struct = analysis['array_structure']
-            print(f"  Array item types: {list(array_struct['item_types'])}")
+            print(f"  Array item types: {sorted(array_struct['item_types'])}")
             if array_struct['nested_objects']:
                 print(f"  Contains nested objects: {len(array_struct['item_schemas'])} different structures")
                 for keys, schema_info in array_struct['item_schemas'].items():
-                    print(f"    Structure {keys}: {list(schema_info['fields'])} (count: {schema_info['count']})")
+                    print(f"    Structure {keys}: {sorted(schema_info['fields'])} (count: {schema_info['count']})")
         
         print()
     
@@ -4,8 +4,18 @@ Test script for improved nested structure handling.
 This demonstrates the new recursive analysis that can handle deeply nested structures up to 100 levels.
 """
 
-import json
 from schema_generator import SchemaGenerator
+from json_helpers import encode_ndjson, save_json
+
+# One generator shared by both tests, so its string classification caches stay warm
+generator = SchemaGenerator()
+
+def build_nested(depth, value):
+    """Build {"level1": {"level2": ... {"level<depth>": {"value": value}}}}"""
+    nested = {"value": value}
+    for level in range(depth, 0, -1):
+        nested = {f"level{level}": nested}
+    return nested
 
 def test_nested_structures():
     """Test the improved nested structure handling."""
@@ -13,20 +23,8 @@ def test_nested_structures():
     print("🧪 Testing Improved Nested Structure Handling")
     print("=" * 60)
     
-    # Test data with deeply nested structures
-    test_data = [
-    {"level1": {"value": "a"}},
-    {"level1": {"level2": {"value": "b"}}},
-    {"level1": {"level2": {"level3": {"value": "c"}}}},
-    {"level1": {"level2": {"level3": {"level4": {"value": "d"}}}}},
-    {"level1": {"level2": {"level3": {"level4": {"level5": {"value": "e"}}}}}},
-    {"level1": {"level2": {"level3": {"level4": {"level5": {"level6": {"value": "f"}}}}}}},
-    {"level1": {"level2": {"level3": {"level4": {"level5": {"level6": {"level7": {"value": "g"}}}}}}}},
-    {"level1": {"level2": {"level3": {"level4": {"level5": {"level6": {"level7": {"level8": {"value": "h"}}}}}}}}}
-]
-
-    
-    generator = SchemaGenerator()
+    # Test data with deeply nested structures: row i nests "value" under level1..level{i}
+    test_data = [build_nested(depth, chr(ord('a') + depth - 1)) for depth in range(1, 9)]
     
     try:
         # Generate smart hardened schema
@@ -35,11 +33,9 @@ def test_nested_structures():
         
         print("✅ Smart Hardened Schema generated successfully!")
         print("\n📊 Generated Schema:")
-        print(json.dumps(smart_schema, indent=2))
-        
-        # Save to file
-        with open("nested_test_schema.json", "w") as f:
-            json.dump(smart_schema, f, indent=2)
+        # Save to file, reusing the encoded schema for the preview
+        schema_str = save_json("nested_test_schema.json", smart_schema).decode('utf-8')
+        print(schema_str)
         
         print("\n💾 Schema saved to: nested_test_schema.json")
         
@@ -47,9 +43,8 @@ def test_nested_structures():
         print("\n📁 Testing with NDJSON file...")
         
         # Create NDJSON file
-        with open("test_nested.ndjson", "w") as f:
-            for item in test_data:
-                f.write(json.dumps(item) + "\n")
+        with open("test_nested.ndjson", "wb") as f:
+            f.write(encode_ndjson(test_data))
         
         # Generate schema from file
         file_schema = generator.analyze_ndjson_file("test_nested.ndjson")
@@ -57,8 +52,7 @@ def test_nested_structures():
         print("✅ Schema generated from NDJSON file successfully!")
         
         # Save file schema
-        with open("nested_file_schema.json", "w") as f:
-            json.dump(file_schema, f, indent=2)
+        save_json("nested_file_schema.json", file_schema)
         
         print("💾 File schema saved to: nested_file_schema.json")
         
@@ -134,23 +128,20 @@ def test_complex_nested():
         }
     ]
     
-    generator = SchemaGenerator()
-    
     try:
         print("📋 Generating schema for complex nested structures...")
         schema = generator.generate_smart_hardened_schema(complex_data)
         
         print("✅ Complex nested schema generated successfully!")
         
-        # Save to file
-        with open("complex_nested_schema.json", "w") as f:
-            json.dump(schema, f, indent=2)
+        # Save to file, reusing the encoded schema for the preview
+        schema_str = save_json("complex_nested_schema.json", schema).decode('utf-8')
         
         print("💾 Complex nested schema saved to: complex_nested_schema.json")
         
         # Show the schema
         print("\n📊 Complex Nested Schema:")
-        print(json.dumps(schema, indent=2))
+        print(schema_str)
         
     except Exception as e:
         print(f"❌ Error: {e}")
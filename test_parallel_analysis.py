@@ -0,0 +1,93 @@
+import json
+import os
+import random
+import tempfile
+from schema_generator import SchemaGenerator
+
+def build_records(count, seed=7):
+    """Build varied records with optional, nullable, nested and array fields"""
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        record = {
+            "id": i,
+            "name": rng.choice(["Alice", "Bob", "Charlie", "Dana"]) + str(rng.randint(1, 999)),
+            "email": f"user{i}@example.com",
+            "score": round(rng.uniform(0, 100), 2) + 0.5,
+            "active": rng.random() < 0.5,
+            "tags": rng.sample(["admin", "user", "beta", "premium"], rng.randint(0, 3)),
+            "profile": {"age": rng.randint(18, 90), "city": rng.choice(["Paris", "Berlin", "Tokyo"])}
+        }
+        if rng.random() < 0.3:
+            record["nickname"] = None if rng.random() < 0.5 else "nick" + str(i)
+        if rng.random() < 0.2:
+            record["token"] = "".join(rng.choice("0123456789abcdef") for _ in range(40))
+        records.append(record)
+    return records
+
+def write_ndjson(records):
+    """Write records to a temporary NDJSON file and return its path"""
+    fd, file_path = tempfile.mkstemp(suffix=".ndjson")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    return file_path
+
+def test_analyze_ndjson_file_parallel():
+    """Test that the multi-process file analysis matches the single-process one"""
+    print("Testing parallel NDJSON file analysis:")
+    print("=" * 60)
+
+    generator = SchemaGenerator()
+
+    # 101 lines do not split evenly over any of the worker counts above 1
+    file_path = write_ndjson(build_records(101))
+    try:
+        expected = generator.analyze_ndjson_file(file_path)
+        for workers in [1, 2, 3, 7]:
+            schema = generator.analyze_ndjson_file_parallel(file_path, workers=workers)
+            assert schema == expected, f"workers={workers}: schema differs from analyze_ndjson_file"
+            print(f"✅ workers={workers}: schema matches analyze_ndjson_file")
+
+        # More workers than lines leaves some ranges empty
+        tiny_path = write_ndjson(build_records(3))
+        try:
+            expected = generator.analyze_ndjson_file(tiny_path)
+            assert generator.analyze_ndjson_file_parallel(tiny_path, workers=7) == expected
+            print("✅ workers=7 on 3 lines: schema matches analyze_ndjson_file")
+        finally:
+            os.remove(tiny_path)
+    finally:
+        os.remove(file_path)
+
+def build_nested(depth, value):
+    """Build {"level1": {"level2": ... {"level<depth>": {"value": value}}}}"""
+    nested = {"value": value}
+    for level in range(depth, 0, -1):
+        nested = {f"level{level}": nested}
+    return nested
+
+def test_analyze_objects_with_depth_workers():
+    """Test that spreading the nested analysis over processes gives the same result"""
+    print("\nTesting parallel nested structure analysis:")
+    print("=" * 60)
+
+    generator = SchemaGenerator()
+
+    # Deep chains, arrays of objects and binary values give each field real nested work
+    objects = build_records(60)
+    for i, record in enumerate(objects):
+        record["deep"] = build_nested(i % 12 + 1, "v" * (i % 5 + 1))
+        record["events"] = [{"type": "click", "meta": {"x": i, "y": [i, i + 1]}}] * (i % 3)
+        record["blob"] = {"data": "SGVsbG8gV29ybGQgdGhpcyBpcyBiYXNlNjQ=" if i % 4 == 0 else "plain"}
+
+    for max_depth in [2, 5, 50]:
+        expected = generator.analyze_objects_with_depth(objects, max_depth)
+        for workers in [2, 3]:
+            analysis = generator.analyze_objects_with_depth(objects, max_depth, workers=workers)
+            assert analysis == expected, f"max_depth={max_depth}, workers={workers}: analysis differs from workers=1"
+        print(f"✅ max_depth={max_depth}: workers=2 and 3 match workers=1")
+
+if __name__ == "__main__":
+    test_analyze_ndjson_file_parallel()
+    test_analyze_objects_with_depth_workers()
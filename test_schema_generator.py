@@ -12,9 +12,10 @@ from schema_generator import SchemaGenerator
 class TestSchemaGenerator(unittest.TestCase):
     """Test cases for the SchemaGenerator class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.sample_data = [
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures (read-only, shared by all tests)."""
+        cls.sample_data = [
             {
                 "id": 1,
                 "name": "John Doe",
@@ -31,7 +32,7 @@ class TestSchemaGenerator(unittest.TestCase):
             }
         ]
         
-        self.expected_json_schema = {
+        cls.expected_json_schema = {
             "$schema": "http://json-schema.org/draft-2020-12/schema#",
             "type": "array",
             "items": {
@@ -47,7 +48,7 @@ class TestSchemaGenerator(unittest.TestCase):
             }
         }
         
-        self.expected_pydantic_model = """from pydantic import BaseModel, Field, EmailStr
+        cls.expected_pydantic_model = """from pydantic import BaseModel, Field, EmailStr
 
 class User(BaseModel):
     id: int = Field(..., description="Unique identifier")
@@ -56,7 +57,7 @@ class User(BaseModel):
     age: int = Field(..., ge=0, description="Age in years")
     is_active: bool = Field(..., description="Active status")"""
         
-        self.expected_sql_schema = """CREATE TABLE users (
+        cls.expected_sql_schema = """CREATE TABLE users (
     id INTEGER PRIMARY KEY,
     name VARCHAR(255) NOT NULL,
     email VARCHAR(255) NOT NULL,
@@ -197,9 +198,10 @@ class User(BaseModel):
 class TestComplexDataStructures(unittest.TestCase):
     """Test cases for complex data structures."""
     
-    def setUp(self):
-        """Set up test fixtures for complex data."""
-        self.complex_data = [
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures for complex data (read-only, shared by all tests)."""
+        cls.complex_data = [
             {
                 "id": 1,
                 "user": {
@@ -5,8 +5,11 @@ Simple test script for the new simplified API with just 2 routes:
 2. Object analysis without schema generation
 """
 
-import json
 from schema_generator import SchemaGenerator
+from json_helpers import save_json
+
+# One generator shared by both tests, so its string classification caches stay warm
+generator = SchemaGenerator()
 
 def test_smart_schema_with_depth():
     """Test smart schema generation with different max nested depths."""
@@ -28,8 +31,6 @@ def test_smart_schema_with_depth():
 
 
     
-    generator = SchemaGenerator()
-    
     # Test with different max depths
     for max_depth in [3, 5, 8, 100]:
         print(f"\n📋 Testing with max_depth = {max_depth}")
@@ -42,8 +43,7 @@ def test_smart_schema_with_depth():
             
             # Save to file
             filename = f"smart_schema_depth_{max_depth}.json"
-            with open(filename, "w") as f:
-                json.dump(schema, f, indent=2)
+            save_json(filename, schema)
             
             print(f"💾 Schema saved to: {filename}")
             
@@ -104,8 +104,6 @@ def test_object_analysis():
         }
     ]
     
-    generator = SchemaGenerator()
-    
     # Test analysis with different max depths
     for max_depth in [3, 5, 10]:
         print(f"\n📊 Testing analysis with max_depth = {max_depth}")
@@ -118,8 +116,7 @@ def test_object_analysis():
             
             # Save to file
             filename = f"object_analysis_depth_{max_depth}.json"
-            with open(filename, "w") as f:
-                json.dump(analysis, f, indent=2)
+            save_json(filename, analysis)
             
             print(f"💾 Analysis saved to: {filename}")
             
@@ -1,9 +1,28 @@
-import requests
-import json
-import tempfile
-import os
+import sys
+import uuid
+from api_test_helpers import decode_json, encode_multipart_file, open_session, post_body
+from json_helpers import encode_ndjson
 
-def test_simple_fix():
+# Test data from user
+TEST_DATA = [
+    {"id": 1, "name": "Alice", "email": "alice@example.com"},
+    {"id": 2, "name": "Bob", "phones": ["+1-555-1234", "+1-555-5678"], "active": True},
+    {"id": 3, "profile": {"username": "charlie", "age": 29}, "tags": ["premium", "beta"]},
+    {"id": 4, "name": "Dana", "address": {"city": "Berlin", "zip": 10115}, "preferences": None},
+    {"id": 5, "meta": {"created_at": "2025-08-17T19:30:00Z"}, "score": 87.5},
+    {"id": "6a", "name": "Eve", "devices": [{"type": "mobile", "os": "Android"}, {"type": "laptop"}]},
+    {"id": 7, "misc": [1, "two", {"nested": True}], "active": "yes"},
+    {"id": 8, "binary_data": "SGVsbG8gV29ybGQ=", "extra": {"random": 42}},
+    {"id": 9, "profile": {"username": "frank"}, "tags": None, "preferences": {"theme": "dark"}},
+    {"id": 10, "log": [{"time": "10:00", "event": "login"}, {"time": "10:05", "event": "click", "x": 45, "y": 60}]}
+]
+
+# Encode the NDJSON payload and its multipart body once, at import time
+NDJSON_DATA = encode_ndjson(TEST_DATA)
+MULTIPART_BOUNDARY = uuid.uuid4().hex
+MULTIPART_BODY = encode_multipart_file('file', 'test_data.ndjson', NDJSON_DATA, 'application/json', MULTIPART_BOUNDARY)
+
+def test_simple_fix(live=False):
     """Test the reverted API with simple data"""
     print("Testing reverted API with simple data:")
     print("=" * 50)
@@ -11,35 +30,17 @@ def test_simple_fix():
     # API base URL
     base_url = "http://localhost:9090"
     
-    # Test data from user
-    test_data = [
-        {"id": 1, "name": "Alice", "email": "alice@example.com"},
-        {"id": 2, "name": "Bob", "phones": ["+1-555-1234", "+1-555-5678"], "active": True},
-        {"id": 3, "profile": {"username": "charlie", "age": 29}, "tags": ["premium", "beta"]},
-        {"id": 4, "name": "Dana", "address": {"city": "Berlin", "zip": 10115}, "preferences": None},
-        {"id": 5, "meta": {"created_at": "2025-08-17T19:30:00Z"}, "score": 87.5},
-        {"id": "6a", "name": "Eve", "devices": [{"type": "mobile", "os": "Android"}, {"type": "laptop"}]},
-        {"id": 7, "misc": [1, "two", {"nested": True}], "active": "yes"},
-        {"id": 8, "binary_data": "SGVsbG8gV29ybGQ=", "extra": {"random": 42}},
-        {"id": 9, "profile": {"username": "frank"}, "tags": None, "preferences": {"theme": "dark"}},
-        {"id": 10, "log": [{"time": "10:00", "event": "login"}, {"time": "10:05", "event": "click", "x": 45, "y": 60}]}
-    ]
-    
-    # Create temporary NDJSON file
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.ndjson') as temp_file:
-        for obj in test_data:
-            temp_file.write(json.dumps(obj) + '\n')
-        temp_file_path = temp_file.name
+    # One session for all endpoints so the connection is kept alive
+    session = open_session(live)
+    session.headers['Content-Type'] = f'multipart/form-data; boundary={MULTIPART_BOUNDARY}'
     
     try:
         # Test smart schema generation
         print("Testing smart schema generation...")
-        with open(temp_file_path, 'rb') as f:
-            files = {'file': ('test_data.ndjson', f, 'application/json')}
-            response = requests.post(f"{base_url}/api/v1/schemas/smart", files=files)
+        response = post_body(session, f"{base_url}/api/v1/schemas/smart", MULTIPART_BODY)
         
         if response.status_code == 200:
-            schema = response.json()
+            schema = decode_json(response)
             print("✅ Smart schema generation successful!")
             print(f"Schema has {len(schema['schema']['properties'])} properties")
             print("Properties:", list(schema['schema']['properties'].keys()))
@@ -54,12 +55,10 @@ def test_simple_fix():
         
         # Test analysis endpoint
         print("\nTesting analysis endpoint...")
-        with open(temp_file_path, 'rb') as f:
-            files = {'file': ('test_data.ndjson', f, 'application/json')}
-            response = requests.post(f"{base_url}/api/v1/analyze", files=files)
+        response = post_body(session, f"{base_url}/api/v1/analyze", MULTIPART_BODY)
         
         if response.status_code == 200:
-            analysis = response.json()
+            analysis = decode_json(response)
             print("✅ Analysis successful!")
             print(f"Analyzed {analysis['analysis']['total_objects']} objects")
             print(f"Found {analysis['analysis']['summary']['total_fields']} fields")
@@ -68,11 +67,11 @@ def test_simple_fix():
             print(f"Error: {response.text}")
             
     finally:
-        # Clean up
-        os.unlink(temp_file_path)
+        session.close()
     
     print("\n" + "=" * 50)
     print("Test completed!")
 
 if __name__ == "__main__":
-    test_simple_fix()
+    # Pass --live to test against a running server instead of the in-process app
+    test_simple_fix(live='--live' in sys.argv)
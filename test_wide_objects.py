@@ -0,0 +1,40 @@
+import random
+from schema_generator import SchemaGenerator, MAX_UNROLLED_FIELDS
+
+def test_wide_objects():
+    """Test that very wide, sparse field sets are analyzed like narrow ones"""
+    print("Testing field analysis of very wide objects:")
+    print("=" * 60)
+
+    generator = SchemaGenerator()
+    rng = random.Random(11)
+
+    # 600 fields, each object only carrying a random subset of them
+    field_names = [f"field_{i}" for i in range(600)]
+    values = [1, 2.5, "text", "user@example.com", True, None, [1, 2], {"a": 1}]
+    objects = [
+        {name: rng.choice(values) for name in rng.sample(field_names, rng.randint(1, 80))}
+        for _ in range(200)
+    ]
+    # One field present in every object, so not every field is missing somewhere
+    for obj in objects:
+        obj["always"] = rng.randint(0, 100)
+
+    analysis = generator._analyze_fields(objects)
+    assert len(analysis) > MAX_UNROLLED_FIELDS, "the data should take the wide field path"
+
+    # Analyzing the same objects restricted to slices of the fields keeps each
+    # slice below the threshold, where the generated analyzer is used
+    names = sorted(analysis)
+    expected = {}
+    for start in range(0, len(names), MAX_UNROLLED_FIELDS):
+        chunk = set(names[start:start + MAX_UNROLLED_FIELDS])
+        sliced = [{key: value for key, value in obj.items() if key in chunk} for obj in objects]
+        expected.update(generator._analyze_fields(sliced))
+
+    assert analysis == expected, "wide field analysis differs from the generated analyzer"
+    assert analysis["always"]["missing_count"] == 0
+    print(f"✅ {len(analysis)} sparse fields analyzed the same as slices of {MAX_UNROLLED_FIELDS}")
+
+if __name__ == "__main__":
+    test_wide_objects()